@@ -0,0 +1,260 @@
+'''End-to-end benchmarks for the us-real-estate MCP server against the local mock upstream.
+
+Covers single-call latency, concurrent throughput, pagination pulls, the cache
+hit paths, behaviour under injected 429s and 503s, large-page JSON decoding
+and cold-start time. Results are printed, and written to --output, as JSON for
+regression tracking.
+
+Usage: python benchmark.py [iterations] [--output results.json] [--fixtures FILE]
+'''
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import requests
+from fastmcp import Client
+
+from mockupstream import MockUpstream
+
+STUB_LATENCY = 0.05
+fixtures = None
+
+
+def summarize(samples: list) -> dict:
+    samples = sorted(samples)
+    return {
+        'mean_ms': 1000 * sum(samples) / len(samples),
+        'p50_ms': 1000 * samples[len(samples) // 2],
+        'p99_ms': 1000 * samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+    }
+
+
+async def timed(fn, iterations: int) -> dict:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = fn()
+        if asyncio.iscoroutine(result):
+            await result
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+@contextmanager
+def upstream(server, **options):
+    '''Point the server at a fresh mock upstream for the duration of the block'''
+    mock = MockUpstream(fixtures=fixtures, **options).start()
+    default_base_url, server.base_url = server.base_url, mock.url
+    try:
+        yield mock
+    finally:
+        server.base_url = default_base_url
+        mock.stop()
+
+
+async def bench_single_call(iterations: int) -> dict:
+    import server
+    url = f'{server.base_url}/for-sale/similiar-homes'
+    payload = {'property_id': '1000000042'}
+    return {
+        'bare_requests_get': await timed(lambda: requests.get(url, params=payload).json(), iterations),
+        'shared_client': await timed(lambda: server._get(url, payload), iterations),
+    }
+
+
+async def bench_concurrency(concurrency: int) -> dict:
+    '''N tool calls against a stub with fixed latency: serial sum vs concurrent max'''
+    import server
+    with upstream(server, latency=STUB_LATENCY):
+        start = time.perf_counter()
+        for i in range(concurrency):
+            requests.get(f'{server.base_url}/v3/property-detail', params={'property_id': str(i)}).json()
+        serial = time.perf_counter() - start
+        async with Client(server.mcp) as mcp_client:
+            start = time.perf_counter()
+            await asyncio.gather(*(mcp_client.call_tool('v3_property_detail', {'property_id': str(i)})
+                                   for i in range(concurrency)))
+            concurrent = time.perf_counter() - start
+    return {
+        'calls': concurrency,
+        'stub_latency_ms': 1000 * STUB_LATENCY,
+        'serial_blocking_ms': 1000 * serial,
+        'concurrent_async_ms': 1000 * concurrent,
+        'throughput_per_second': concurrency / concurrent,
+    }
+
+
+async def bench_pagination(listings: int) -> dict:
+    '''Pull a whole search through the prefetching page iterator and through count-then-parallel pages'''
+    import server
+    results = {'listings': listings, 'stub_latency_ms': 1000 * STUB_LATENCY}
+    with upstream(server, latency=STUB_LATENCY, listings=listings) as mock:
+        async with Client(server.mcp) as mcp_client:
+            for tool in ('search_all_pages', 'bulk_fetch_listings'):
+                before = mock.counts['requests']
+                start = time.perf_counter()
+                await mcp_client.call_tool(tool, {'endpoint': 'v3_for_sale', 'params': {'postal_code': '62701'}})
+                results[tool] = {'elapsed_ms': 1000 * (time.perf_counter() - start),
+                                 'upstream_calls': mock.counts['requests'] - before}
+    return results
+
+
+async def bench_cache(iterations: int) -> dict:
+    '''A cached endpoint answered by upstream, by the disk tier and by the memory tier'''
+    import server
+    url = f'{server.base_url}/finance/average-rate'
+    payload = {'postal_code': '62701'}
+
+    def cold():
+        server.response_cache.clear()
+        if server.disk_cache is not None:
+            server.disk_cache.clear()
+        return server._get(url, payload)
+
+    def from_disk():
+        server.response_cache.clear()
+        return server._get(url, payload)
+
+    results = {'miss': await timed(cold, iterations)}
+    if server.disk_cache is not None:
+        results['disk_hit'] = await timed(from_disk, iterations)
+    results['memory_hit'] = await timed(lambda: server._get(url, payload), iterations)
+    return results
+
+
+async def bench_faults(calls: int) -> dict:
+    '''Concurrent calls against an upstream answering 10% of requests with 429 and 5% with 503'''
+    import server
+    retries_before = sum(server.retry_policy.retries.values())
+    with upstream(server, latency=STUB_LATENCY, throttle_rate=0.1, error_rate=0.05, retry_after=0.05, seed=1) as mock:
+        url = f'{server.base_url}/for-sale/similiar-homes'
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(*(server._get(url, {'property_id': str(1000000000 + i)}) for i in range(calls)),
+                                        return_exceptions=True)
+        elapsed = time.perf_counter() - start
+    failed = sum(isinstance(outcome, BaseException) for outcome in outcomes)
+    return {
+        'calls': calls,
+        'succeeded': calls - failed,
+        'failed': failed,
+        'elapsed_ms': 1000 * elapsed,
+        'retries': sum(server.retry_policy.retries.values()) - retries_before,
+        'upstream': mock.stats(),
+    }
+
+
+async def bench_decode(iterations: int) -> dict:
+    '''Parsing a limit=200 search page with the stdlib json module and with the server's decoder'''
+    import server
+    page = MockUpstream(listings=200).synthesize('/v3/for-sale', {'limit': 200})
+    body = json.dumps(page).encode()
+    return {
+        'bytes': len(body),
+        'json_loads': await timed(lambda: json.loads(body), iterations),
+        'server_decode': await timed(lambda: server._json_loads(body), iterations),
+    }
+
+
+# Runs in a fresh interpreter, as a stdio server spawned for a new agent session would.
+startup_script = '''
+import asyncio, json, time
+start = time.perf_counter()
+import server
+imported = time.perf_counter()
+from fastmcp import Client
+
+async def main():
+    async with Client(server.mcp) as client:
+        connected = time.perf_counter()
+        await client.list_tools()
+        listed = time.perf_counter()
+        await client.call_tool('v3_property_detail', {'property_id': '1000000001'})
+        called = time.perf_counter()
+    print(json.dumps({'import': imported - start, 'first_list_tools': listed - connected,
+                      'first_tool_call': called - listed, 'total': called - start}))
+
+asyncio.run(main())
+'''
+
+
+def bench_startup(runs: int) -> dict:
+    '''Cold start: `import server`, the first list_tools and the first upstream tool call, each in a new process.
+    The disk cache is left off so every run's tool call goes upstream.'''
+    mock = MockUpstream(fixtures=fixtures).start()
+    env = {name: value for name, value in os.environ.items() if name != 'CACHE_DB_PATH'}
+    env['RAPID_API_BASE_URL'] = mock.url
+    samples = []
+    try:
+        for _ in range(runs):
+            output = subprocess.run([sys.executable, '-c', startup_script], env=env, capture_output=True, text=True, check=True,
+                                    cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+            samples.append(json.loads(output.strip().splitlines()[-1]))
+    finally:
+        mock.stop()
+    return {'runs': runs, **{phase: summarize([sample[phase] for sample in samples]) for phase in samples[0]}}
+
+
+def metadata(iterations: int) -> dict:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'iterations': iterations,
+    }
+
+
+async def run(iterations: int, listings: int) -> dict:
+    return {
+        'meta': metadata(iterations),
+        'single_call': await bench_single_call(iterations),
+        'concurrency': await bench_concurrency(20),
+        'pagination': await bench_pagination(listings),
+        'cache': await bench_cache(iterations),
+        'faults': await bench_faults(50),
+        'decode': await bench_decode(iterations),
+        'startup': bench_startup(10),
+    }
+
+
+def main():
+    global fixtures
+    parser = argparse.ArgumentParser(description='Benchmark the MCP server against the local mock upstream')
+    parser.add_argument('iterations', type=int, nargs='?', default=200)
+    parser.add_argument('--output', help='Also write the JSON results to this file')
+    parser.add_argument('--fixtures', help='Recorded responses for the mock upstream to replay')
+    parser.add_argument('--listings', type=int, default=2000, help='Listings in the paginated search')
+    args = parser.parse_args()
+    fixtures = args.fixtures
+    mock = MockUpstream(fixtures=fixtures).start()
+    os.environ['RAPID_API_BASE_URL'] = mock.url
+    # Measure the request path itself: no client-side throttling, no background warmer,
+    # and a throwaway disk cache tier.
+    os.environ.setdefault('RATE_LIMIT_RPS', '0')
+    os.environ.setdefault('WARM_INTERVAL', '0')
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ.setdefault('CACHE_DB_PATH', os.path.join(directory, 'cache.db'))
+        results = asyncio.run(run(args.iterations, args.listings))
+    mock.stop()
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+
+
+if __name__ == '__main__':
+    main()
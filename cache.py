@@ -0,0 +1,270 @@
+import asyncio
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Awaitable, Callable, Union
+from urllib.parse import urlencode
+
+
+def canonical_value(value) -> str:
+    '''Render a query value the way it goes over the wire, folding 3199790641.0 into 3199790641'''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def make_key(url: str, payload: dict) -> str:
+    '''Cache key for a GET: the URL plus the non-None payload, sorted by parameter name'''
+    items = sorted((k, canonical_value(v)) for k, v in payload.items() if v is not None)
+    return f'{url}?{urlencode(items)}'
+
+
+class ResponseCache:
+    '''In-memory LRU cache of raw response bodies with a soft and a hard TTL per entry.
+
+    Up to the soft TTL an entry is fresh. Between the soft and hard TTL it is
+    still returned but marked stale, so the caller can serve it while it
+    refreshes. Past the hard TTL it is gone. Eviction happens in
+    least-recently-used order once either `max_entries` or `max_bytes` (the
+    summed length of the stored bodies) is exceeded.
+    '''
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Union[tuple, None]:
+        '''Return `(body, fresh)` for an entry within its hard TTL, or None'''
+        with self._lock:
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            if entry is None or entry[2] <= now:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            body, fresh_until, _ = entry
+            if fresh_until > now:
+                self.hits += 1
+                return body, True
+            self.stale_hits += 1
+            return body, False
+
+    def remaining(self, key: str) -> Union[float, None]:
+        '''Seconds until `key` goes stale, without counting a lookup; None if absent or already stale'''
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        left = entry[1] - time.monotonic()
+        return left if left > 0 else None
+
+    def put(self, key: str, body: bytes, ttl: float, stale_ttl: float = 0) -> None:
+        '''Store `body` fresh for `ttl` seconds, then servable as stale for `stale_ttl` more'''
+        if ttl + stale_ttl <= 0 or len(body) > self.max_bytes:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (body, now + ttl, now + ttl + stale_ttl)
+            self.size += len(body)
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.size,
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+        }
+
+    def _remove(self, key: str) -> None:
+        body = self._entries.pop(key)[0]
+        self.size -= len(body)
+
+
+class DiskCache:
+    '''SQLite-backed cache tier shared by every server process on the host.
+
+    Bodies are stored zlib-compressed with absolute fresh-until and expiry
+    times. Once the compressed total passes `max_bytes`, expired rows are
+    purged first and then the least recently read rows until the store fits
+    again. The total is kept as a running count of this process's writes and
+    evictions, re-summed from the table every `refresh_every` writes to take
+    in other processes' changes. Read times are written back in batches of
+    `touch_batch`, or after `touch_interval` seconds, rather than on every hit.
+
+    Every call blocks on SQLite (up to the 5 second busy timeout when another
+    process holds the write lock); async callers run them in a worker thread.
+    '''
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, level: int = 6, refresh_every: int = 1000,
+                 touch_batch: int = 64, touch_interval: float = 30.0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.level = level
+        self.refresh_every = refresh_every
+        self.touch_batch = touch_batch
+        self.touch_interval = touch_interval
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = None
+        self._puts = 0
+        self._touched = {}
+        self._touches_flushed = time.time()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS entries '
+                           '(key TEXT PRIMARY KEY, body BLOB, size INTEGER, expires REAL, accessed REAL, fresh_until REAL)')
+        if 'fresh_until' not in [column[1] for column in self._conn.execute('PRAGMA table_info(entries)')]:
+            self._conn.execute('ALTER TABLE entries ADD COLUMN fresh_until REAL')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)')
+
+    def get(self, key: str) -> Union[tuple, None]:
+        '''Return `(body, seconds_fresh, seconds_left)` for an entry within its hard TTL, or None.
+        `seconds_fresh` is negative once the entry has gone stale.'''
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute('SELECT body, expires, fresh_until FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+            self._touched[key] = now
+            if len(self._touched) >= self.touch_batch or now - self._touches_flushed >= self.touch_interval:
+                self._conn.execute('BEGIN IMMEDIATE')
+                try:
+                    self._flush_touches(now)
+                    self._conn.execute('COMMIT')
+                except BaseException:
+                    self._conn.execute('ROLLBACK')
+                    raise
+            self.hits += 1
+        fresh_until = row[2] if row[2] is not None else row[1]
+        return zlib.decompress(row[0]), fresh_until - now, row[1] - now
+
+    def put(self, key: str, body: bytes, ttl: float, stale_ttl: float = 0) -> None:
+        if ttl + stale_ttl <= 0:
+            return
+        now = time.time()
+        data = zlib.compress(body, self.level)
+        with self._lock:
+            self._touched.pop(key, None)
+            replaced = self._conn.execute('SELECT size FROM entries WHERE key = ?', (key,)).fetchone()
+            self._conn.execute('INSERT OR REPLACE INTO entries (key, body, size, expires, accessed, fresh_until) '
+                               'VALUES (?, ?, ?, ?, ?, ?)', (key, data, len(data), now + ttl + stale_ttl, now, now + ttl))
+            self._puts += 1
+            if self._size is None or self._puts >= self.refresh_every:
+                self._size = self._total()
+                self._puts = 0
+            else:
+                self._size += len(data) - (replaced[0] if replaced else 0)
+            if self._size > self.max_bytes:
+                self._evict(now)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM entries')
+            self._touched.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, size = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        lookups = self.hits + self.misses
+        return {
+            'entries': entries,
+            'bytes': size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+        }
+
+    def _total(self) -> int:
+        return self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    def _flush_touches(self, now: float) -> None:
+        '''Write back the read times collected since the last flush; runs inside the caller's transaction'''
+        self._conn.executemany('UPDATE entries SET accessed = ? WHERE key = ?',
+                               [(accessed, key) for key, accessed in self._touched.items()])
+        self._touched.clear()
+        self._touches_flushed = now
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._flush_touches(now)
+            self.evictions += self._conn.execute('DELETE FROM entries WHERE expires <= ?', (now,)).rowcount
+            total = self._total()
+            excess = total - self.max_bytes
+            if excess > 0:
+                doomed = []
+                for key, size in self._conn.execute('SELECT key, size FROM entries ORDER BY accessed'):
+                    if excess <= 0:
+                        break
+                    doomed.append((key,))
+                    excess -= size
+                    total -= size
+                self._conn.executemany('DELETE FROM entries WHERE key = ?', doomed)
+                self.evictions += len(doomed)
+            self._conn.execute('COMMIT')
+            self._size = total
+        except BaseException:
+            self._conn.execute('ROLLBACK')
+            raise
+
+
+class SingleFlight:
+    '''Collapses identical concurrent calls into one: later callers await the first call's result'''
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._inflight = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable]):
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+        future = asyncio.ensure_future(fn())
+        self._inflight[key] = future
+        future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        self.calls += 1
+        return await asyncio.shield(future)
+
+    def pending(self, key: str) -> bool:
+        return key in self._inflight
+
+    def stats(self) -> dict:
+        return {
+            'calls': self.calls,
+            'coalesced': self.coalesced,
+            'in_flight': len(self._inflight),
+        }
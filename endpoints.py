@@ -0,0 +1,540 @@
+import inspect
+from typing import Annotated, Awaitable, Callable, List, Union
+
+from pydantic import Field
+
+required = inspect.Parameter.empty
+
+
+class Param:
+    '''One tool argument. `query=False` marks arguments handled by the server (such as `fields`)
+    rather than sent upstream.'''
+
+    def __init__(self, name: str, type, description: str = '', default=required, query: bool = True):
+        self.name = name
+        self.type = type
+        self.description = description
+        self.default = default
+        self.query = query
+
+    def parameter(self) -> inspect.Parameter:
+        return inspect.Parameter(self.name, inspect.Parameter.POSITIONAL_OR_KEYWORD, default=self.default,
+                                 annotation=Annotated[self.type, Field(description=self.description)])
+
+
+class Endpoint:
+    '''An upstream GET endpoint exposed as an MCP tool.
+
+    `cache_ttl` is how many seconds a successful response stays cached (0 for
+    never) and `cost` how many requests of the RapidAPI quota a call uses.
+    '''
+
+    def __init__(self, name: str, path: str, description: str, params: List[Param], cache_ttl: float = 0, cost: int = 1):
+        self.name = name
+        self.path = path
+        self.description = description
+        self.params = params
+        self.cache_ttl = cache_ttl
+        self.cost = cost
+
+    def payload(self, arguments: dict) -> dict:
+        '''The query parameters for a call: the upstream arguments that were given'''
+        return {param.name: arguments[param.name] for param in self.params
+                if param.query and arguments.get(param.name) is not None}
+
+
+class Pipeline:
+    '''Middleware chain every endpoint tool call runs through before reaching `handler`.
+
+    A stage is `async def stage(endpoint, arguments, call_next)` and returns the
+    response; awaiting `call_next(endpoint, arguments)` runs the stages after it
+    and then the handler. Stages may change the arguments, answer without
+    calling on, or post-process the response.
+    '''
+
+    def __init__(self, handler: Callable[[Endpoint, dict], Awaitable], stages: Union[List[Callable], None] = None):
+        self.handler = handler
+        self.stages = list(stages or [])
+
+    def use(self, stage: Callable) -> Callable:
+        self.stages.append(stage)
+        return stage
+
+    async def __call__(self, endpoint: Endpoint, arguments: dict):
+        return await self._run(0, endpoint, arguments)
+
+    async def _run(self, index: int, endpoint: Endpoint, arguments: dict):
+        if index == len(self.stages):
+            return await self.handler(endpoint, arguments)
+        return await self.stages[index](endpoint, arguments,
+                                        lambda endpoint, arguments: self._run(index + 1, endpoint, arguments))
+
+
+def make_tool(endpoint: Endpoint, call: Callable[[Endpoint, dict], Awaitable]) -> Callable:
+    '''A coroutine function with the endpoint's name, docstring and typed signature, for registering as a tool.
+    It binds its arguments, defaults included, and hands them to `call(endpoint, arguments)`.'''
+    signature = inspect.Signature([param.parameter() for param in endpoint.params], return_annotation=dict)
+
+    async def tool(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return await call(endpoint, bound.arguments)
+
+    tool.__name__ = tool.__qualname__ = endpoint.name
+    tool.__doc__ = endpoint.description
+    tool.__signature__ = signature
+    tool.__annotations__ = {**{name: parameter.annotation for name, parameter in signature.parameters.items()}, 'return': dict}
+    return tool
+
+
+# Every plain upstream endpoint, in tool registration order. A Param without a
+# default is required; descriptions are shown to the model as the argument docs.
+registry = [
+    Endpoint('v3_property_detail', '/v3/property-detail', 'Get property detail data by `property_id`', [
+        Param('property_id', str),
+        Param('fields', Union[str, List[str], None], 'Fields to return: a preset (summary|detail_summary|no_media) or dotted paths such as data.list_price. Prefix a path with - to drop it instead. Default is the full response', None, query=False),
+    ], cache_ttl=900),
+    Endpoint('v2_property_detail', '/v2/property-detail', 'Get property detail data by `property_id` V2', [
+        Param('property_id', Union[int, float], 'Default: 3199790641'),
+    ], cache_ttl=900),
+    Endpoint('property_detail', '/property-detail', 'Get property detail data by `property_id`', [
+        Param('property_id', str),
+    ], cache_ttl=900),
+    Endpoint('property_by_mls_id', '/property-by-mls-id', 'Search properties by MLS ID', [
+        Param('mls_id', str),
+    ], cache_ttl=900),
+    Endpoint('keywords_search_suggest', '/keywords-search-suggest', 'Get keyword search suggestion for `keyword_seach` parameters in `/for-sale` endpoint', [
+        Param('keyword_text', str),
+        Param('limit', Union[int, float, None], 'Default: 10', None),
+    ], cache_ttl=24 * 3600),
+    Endpoint('location_suggest', '/location/suggest', 'Get location suggestion / autocomplete **Required Parameter**: `input` **Optional Parameter**:', [
+        Param('input', str, 'Part of location name'),
+    ], cache_ttl=24 * 3600),
+    Endpoint('location_for_sale_nearby_areas', '/location/for-sale-nearby-areas', 'Get nearby areas for **include_nearby_areas_slug_id** parameter in **/for-sale** endpoint. Get by (area_type="city" & city & state_code) or by (area_type="neighborhood" & city & state_code & neighborhood) or by (area_type="postal_code" & postal_code)', [
+        Param('area_type', str, 'One of the following options: city|neighborhood'),
+        Param('city', Union[str, None], '', None),
+        Param('neighborhood', Union[str, None], '', None),
+        Param('postal_code', Union[str, None], '', None),
+        Param('state_code', Union[str, None], '', None),
+    ], cache_ttl=24 * 3600),
+    Endpoint('location_for_sale_nearby_areas_by_postal_code', '/location/for-sale-nearby-areas-by-postal-code', 'Get nearby areas by `postal_code` for **include_nearby_areas_slug_id** parameter in **/for-sale** endpoint.', [
+        Param('postal_code', str),
+    ], cache_ttl=24 * 3600),
+    Endpoint('location_for_rent_nearby_areas', '/location/for-rent-nearby-areas', 'Get nearby areas for **include_nearby_areas_slug_id** parameter in **/for-rent**. Get by (area_type="city" & city & state_code) or by (area_type="neighborhood" & city & state_code & neighborhood) or by (area_type="postal_code" & postal_code)', [
+        Param('area_type', str, 'One of the following options: city|postal_code|neighborhood'),
+        Param('city', Union[str, None], '', None),
+        Param('neighborhood', Union[str, None], '', None),
+        Param('state_code', Union[str, None], '', None),
+        Param('postal_code', Union[int, float, None], 'Default: 14218', None),
+    ], cache_ttl=24 * 3600),
+    Endpoint('location_schools', '/location/schools', 'Get schools near a location by (**state_code & city**) or by (**state_code & city & neighborhood**) or by **postal_code**', [
+        Param('postal_code', Union[int, float, None], 'Default: 14218', None),
+        Param('city', Union[str, None], '', None),
+        Param('state_code', Union[str, None], '', None),
+        Param('neighborhood', Union[str, None], '', None),
+    ], cache_ttl=24 * 3600),
+    Endpoint('location_commute_time', '/location/commute-time', 'Get commute time from origins to destinations with one of following mode: walking|driving|bicycling|transit', [
+        Param('origins', str, 'Origin location: address, city+state_code, neighborhood, postal_code, etc'),
+        Param('destinations', str, 'Destination location: address, city+state_code, neighborhood, postal_code, etc'),
+        Param('mode', str, 'One of the following options: driving|walking|bicycling|transit'),
+    ]),
+    Endpoint('location_noise_score', '/location/noise-score', 'Get location noise score by (**latitude & longitude**)', [
+        Param('longitude', Union[int, float], 'Default: -73.95471'),
+        Param('latitude', Union[int, float], 'Default: 40.769135'),
+    ], cache_ttl=24 * 3600),
+    Endpoint('v3_for_sale', '/v3/for-sale', 'Search for-sale properties. **Parameters**: ` **state_code**,city, location, sort, limit, offset, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, property_type_nyc_only, new_construction, hide_pending_contingent, has_virtual_tours, has_3d_tours, hide_foreclosure, price_reduced, open_house, keywords, no_hoa_fee, hoa_max, days_on_realtor, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, lot_size_min, lot_size_max, home_age_max, stories, garage, heating_cooling, inside_rooms, outside_features, lot_views, community_ammenities, features_in_nyc_only`', [
+        Param('state_code', str, 'State Code. Get from /location/suggest response'),
+        Param('city', Union[str, None], 'City name. Get data from /location/suggest response', None),
+        Param('sort', Union[str, None], 'One of the following options: relevant|newest|lowest_price|highest_price|open_house_date|price_reduced_date|largest_sqft|lot_size|sold_date. Default is newest', None),
+        Param('offset', Union[int, float, None], 'Offset results, default 0. Maximum 9800. Default: 0', None),
+        Param('limit', Union[int, float, None], 'Number of results. Maximum 200 for Paid Plan, default 42 Default: 42', None),
+        Param('location', Union[str, None], 'Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank', None),
+        Param('price_min', Union[str, None], 'Minimum list price in USD', None),
+        Param('price_max', Union[str, None], 'Maximum list price in USD', None),
+        Param('beds_min', Union[str, None], 'Minimum bedrooms', None),
+        Param('beds_max', Union[str, None], 'Maximum bedrooms', None),
+        Param('baths_min', Union[str, None], 'Minimum bathrooms', None),
+        Param('baths_max', Union[str, None], 'Maximum bathrooms', None),
+        Param('property_type', Union[str, None], 'Comma separated values. One or more from following options: multi_family|single_family|mobile|land|farm', None),
+        Param('property_type_nyc_only', Union[str, None], 'Comma separated values. One or more from following options: condo|coop|condop. For NYC listings only', None),
+        Param('new_construction', Union[str, None], 'true for New construction only. Leave blank for any', None),
+        Param('hide_pending_contingent', Union[str, None], 'true for hide pending/contingent. Leave blank for any', None),
+        Param('has_virtual_tours', Union[str, None], 'true for properties with virtual tour only. Leave blank for any', None),
+        Param('has_3d_tours', Union[str, None], 'true for properties with 3D tour only. Leave blank for any', None),
+        Param('hide_foreclosure', Union[str, None], 'true for hide foreclosure. Leave blank for any', None),
+        Param('price_reduced', Union[str, None], 'true for properties with price reduced only. Leave blank for any', None),
+        Param('open_house', Union[str, None], 'true for properties with open house only. Leave blank for any', None),
+        Param('keywords', Union[str, None], 'Comma separated values. Get popular keywords from /keywords-search-suggest response', None),
+        Param('no_hoa_fee', Union[str, None], 'true for properties without HOA fee only. Leave blank for any', None),
+        Param('hoa_max', Union[str, None], 'Maximum HOA fee in USD', None),
+        Param('days_on_realtor', Union[str, None], 'One of the following options: today|7|14|21|30', None),
+        Param('expand_search_radius', Union[str, None], 'One of the following options: 1|5|10|25|50. Expand search by radius in miles', None),
+        Param('include_nearby_areas_slug_id', Union[str, None], 'Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-sale-nearby-areas', None),
+        Param('home_size_min', Union[str, None], 'One of the following options: 750|1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500. Minimum home size in sqft', None),
+        Param('home_size_max', Union[str, None], 'One of the following options: 1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500|10000. Maximum home size in sqft', None),
+        Param('lot_size_min', Union[str, None], 'One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Minimum lot size in sqft', None),
+        Param('lot_size_max', Union[str, None], 'One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Maximum lot size in sqft', None),
+        Param('home_age_max', Union[str, None], 'Maximum home age', None),
+        Param('stories', Union[str, None], 'One of the following options: single|multi', None),
+        Param('garage', Union[str, None], 'One of the following options: 1+|2+|3+', None),
+        Param('heating_cooling', Union[str, None], 'Comma separated values. One or more from following options: central_air|central_heat|forced_air', None),
+        Param('inside_rooms', Union[str, None], 'Comma separated values. One or more comma separated from following options: basement|hardwood_floors|fireplace|disability_features|den_or_office|family_room|dining_room', None),
+        Param('outside_features', Union[str, None], 'Comma separated values. One or more from following options: swimming_pool|spa_or_hot_tub|horse_facilities', None),
+        Param('lot_views', Union[str, None], 'Comma separated values. One or more from following options: waterfront|cul_de_sac|corner_lot|golf_course_lot_or_frontage|hill_or_mountain_view|ocean_view|lake_view|river_view', None),
+        Param('community_ammenities', Union[str, None], 'Comma separated values. One or more from following options: community_swimming_pool|community_spa_or_hot_tub|community_golf|community_security_features|community_boat_facilities|tennis_court|community_clubhouse|senior_community', None),
+        Param('features_in_nyc_only', Union[str, None], 'Comma separated values. One or more from following options: furniture|dishwasher|community_doorman|pets_allowed|laundry_room|elevator|community_outdoor_space', None),
+        Param('fields', Union[str, List[str], None], 'Fields to return: a preset (summary|search_summary|no_media) or dotted paths such as data.home_search.results.list_price. Prefix a path with - to drop it instead. Default is the full response', None, query=False),
+    ]),
+    Endpoint('v2_for_sale', '/v2/for-sale', 'Search for-sale properties. **Parameters**: `city, state_code, location, limit, offset, sort:newest price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, property_type_nyc_only, new_construction, hide_pending_contingent, has_virtual_tours, has_3d_tours, hide_foreclosure, price_reduced, open_house, keywords, no_hoa_fee, hoa_max, days_on_realtor, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, lot_size_min, lot_size_max, home_age_max, stories, garage, heating_cooling, inside_rooms, outside_features, lot_views, community_ammenities, features_in_nyc_only`', [
+        Param('offset', Union[int, float], 'Offset results, default 0. Maximum 9800. Default: 0'),
+        Param('limit', Union[int, float], 'Number of results. Maximum 200 for Paid Plan, default 42 Default: 42'),
+        Param('state_code', str, 'State Code. Get from /location/suggest response'),
+        Param('city', str, 'City name. Get data from /location/suggest response'),
+        Param('location', Union[str, None], 'Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank', None),
+        Param('sort', Union[str, None], 'One of the following options: relevant|newest|lowest_price|highest_price|open_house_date|price_reduced_date|largest_sqft|lot_size|sold_date. Default is relevant', None),
+        Param('price_min', Union[str, None], 'Minimum list price in USD', None),
+        Param('price_max', Union[str, None], 'Maximum list price in USD', None),
+        Param('beds_min', Union[str, None], 'Minimum bedrooms', None),
+        Param('beds_max', Union[str, None], 'Maximum bedrooms', None),
+        Param('baths_min', Union[str, None], 'Minimum bathrooms', None),
+        Param('baths_max', Union[str, None], 'Maximum bathrooms', None),
+        Param('property_type', Union[str, None], 'Comma separated values. One or more from following options: multi_family|single_family|mobile|land|farm', None),
+        Param('property_type_nyc_only', Union[str, None], 'Comma separated values. One or more from following options: condo|coop|condop. For NYC listings only', None),
+        Param('new_construction', Union[str, None], 'true for New construction only. Leave blank for any', None),
+        Param('hide_pending_contingent', Union[str, None], 'true for hide pending/contingent. Leave blank for any', None),
+        Param('has_virtual_tours', Union[str, None], 'true for properties with virtual tour only. Leave blank for any', None),
+        Param('has_3d_tours', Union[str, None], 'true for properties with 3D tour only. Leave blank for any', None),
+        Param('hide_foreclosure', Union[str, None], 'true for hide foreclosure. Leave blank for any', None),
+        Param('price_reduced', Union[str, None], 'true for properties with price reduced only. Leave blank for any', None),
+        Param('open_house', Union[str, None], 'true for properties with open house only. Leave blank for any', None),
+        Param('keywords', Union[str, None], 'Comma separated values. Get popular keywords from /keywords-search-suggest response', None),
+        Param('no_hoa_fee', Union[str, None], 'true for properties without HOA fee only. Leave blank for any', None),
+        Param('hoa_max', Union[str, None], 'Maximum HOA fee in USD', None),
+        Param('days_on_realtor', Union[str, None], 'One of the following options: today|7|14|21|30', None),
+        Param('expand_search_radius', Union[str, None], 'One of the following options: 1|5|10|25|50. Expand search by radius in miles', None),
+        Param('include_nearby_areas_slug_id', Union[str, None], 'Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-sale-nearby-areas', None),
+        Param('home_size_min', Union[str, None], 'One of the following options: 750|1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500. Minimum home size in sqft', None),
+        Param('home_size_max', Union[str, None], 'One of the following options: 1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500|10000. Maximum home size in sqft', None),
+        Param('lot_size_min', Union[str, None], 'One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Minimum lot size in sqft', None),
+        Param('lot_size_max', Union[str, None], 'One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Maximum lot size in sqft', None),
+        Param('home_age_max', Union[str, None], 'Maximum home age', None),
+        Param('stories', Union[str, None], 'One of the following options: single|multi', None),
+        Param('garage', Union[str, None], 'One of the following options: 1+|2+|3+', None),
+        Param('heating_cooling', Union[str, None], 'Comma separated values. One or more from following options: central_air|central_heat|forced_air', None),
+        Param('inside_rooms', Union[str, None], 'Comma separated values. One or more comma separated from following options: basement|hardwood_floors|fireplace|disability_features|den_or_office|family_room|dining_room', None),
+        Param('outside_features', Union[str, None], 'Comma separated values. One or more from following options: swimming_pool|spa_or_hot_tub|horse_facilities', None),
+        Param('lot_views', Union[str, None], 'Comma separated values. One or more from following options: waterfront|cul_de_sac|corner_lot|golf_course_lot_or_frontage|hill_or_mountain_view|ocean_view|lake_view|river_view', None),
+        Param('community_ammenities', Union[str, None], 'Comma separated values. One or more from following options: community_swimming_pool|community_spa_or_hot_tub|community_golf|community_security_features|community_boat_facilities|tennis_court|community_clubhouse|senior_community', None),
+        Param('features_in_nyc_only', Union[str, None], 'Comma separated values. One or more from following options: furniture|dishwasher|community_doorman|pets_allowed|laundry_room|elevator|community_outdoor_space', None),
+    ]),
+    Endpoint('v2_for_sale_by_zipcode', '/v2/for-sale-by-zipcode', 'Search for-sale properties. **Parameters**: `zipcode, limit, offset, sort:newest price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, property_type_nyc_only, new_construction, hide_pending_contingent, has_virtual_tours, has_3d_tours, hide_foreclosure, price_reduced, open_house, keywords, no_hoa_fee, hoa_max, days_on_realtor, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, lot_size_min, lot_size_max, home_age_max, stories, garage, heating_cooling, inside_rooms, outside_features, lot_views, community_ammenities, features_in_nyc_only`', [
+        Param('zipcode', str, 'zipcode'),
+        Param('offset', Union[int, float, None], 'Offset results, default 0. Maximum 9800. Default: 0', None),
+        Param('limit', Union[int, float, None], 'Number of results. Maximum 200 for Paid Plan, default 42 Default: 42', None),
+        Param('sort', Union[str, None], 'One of the following options: relevant|newest|lowest_price|highest_price|open_house_date|price_reduced_date|largest_sqft|lot_size|sold_date. Default is relevant', None),
+        Param('price_min', Union[str, None], 'Minimum list price in USD', None),
+        Param('price_max', Union[str, None], 'Maximum list price in USD', None),
+        Param('beds_min', Union[str, None], 'Minimum bedrooms', None),
+        Param('beds_max', Union[str, None], 'Maximum bedrooms', None),
+        Param('baths_min', Union[str, None], 'Minimum bathrooms', None),
+        Param('baths_max', Union[str, None], 'Maximum bathrooms', None),
+        Param('property_type', Union[str, None], 'Comma separated values. One or more from following options: multi_family|single_family|mobile|land|farm', None),
+        Param('property_type_nyc_only', Union[str, None], 'Comma separated values. One or more from following options: condo|coop|condop. For NYC listings only', None),
+        Param('new_construction', Union[str, None], 'true for New construction only. Leave blank for any', None),
+        Param('hide_pending_contingent', Union[str, None], 'true for hide pending/contingent. Leave blank for any', None),
+        Param('has_virtual_tours', Union[str, None], 'true for properties with virtual tour only. Leave blank for any', None),
+        Param('has_3d_tours', Union[str, None], 'true for properties with 3D tour only. Leave blank for any', None),
+        Param('hide_foreclosure', Union[str, None], 'true for hide foreclosure. Leave blank for any', None),
+        Param('price_reduced', Union[str, None], 'true for properties with price reduced only. Leave blank for any', None),
+        Param('open_house', Union[str, None], 'true for properties with open house only. Leave blank for any', None),
+        Param('keywords', Union[str, None], 'Comma separated values. Get popular keywords from /keywords-search-suggest response', None),
+        Param('no_hoa_fee', Union[str, None], 'true for properties without HOA fee only. Leave blank for any', None),
+        Param('hoa_max', Union[str, None], 'Maximum HOA fee in USD', None),
+        Param('days_on_realtor', Union[str, None], 'One of the following options: today|7|14|21|30', None),
+        Param('expand_search_radius', Union[str, None], 'One of the following options: 1|5|10|25|50. Expand search by radius in miles', None),
+        Param('include_nearby_areas_slug_id', Union[str, None], 'Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-sale-nearby-areas', None),
+        Param('home_size_min', Union[str, None], 'One of the following options: 750|1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500. Minimum home size in sqft', None),
+        Param('home_size_max', Union[str, None], 'One of the following options: 1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500|10000. Maximum home size in sqft', None),
+        Param('lot_size_min', Union[str, None], 'One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Minimum lot size in sqft', None),
+        Param('lot_size_max', Union[str, None], 'One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Maximum lot size in sqft', None),
+        Param('home_age_max', Union[str, None], 'Maximum home age', None),
+        Param('stories', Union[str, None], 'One of the following options: single|multi', None),
+        Param('garage', Union[str, None], 'One of the following options: 1+|2+|3+', None),
+        Param('heating_cooling', Union[str, None], 'Comma separated values. One or more from following options: central_air|central_heat|forced_air', None),
+        Param('inside_rooms', Union[str, None], 'Comma separated values. One or more comma separated from following options: basement|hardwood_floors|fireplace|disability_features|den_or_office|family_room|dining_room', None),
+        Param('outside_features', Union[str, None], 'Comma separated values. One or more from following options: swimming_pool|spa_or_hot_tub|horse_facilities', None),
+        Param('lot_views', Union[str, None], 'Comma separated values. One or more from following options: waterfront|cul_de_sac|corner_lot|golf_course_lot_or_frontage|hill_or_mountain_view|ocean_view|lake_view|river_view', None),
+        Param('community_ammenities', Union[str, None], 'Comma separated values. One or more from following options: community_swimming_pool|community_spa_or_hot_tub|community_golf|community_security_features|community_boat_facilities|tennis_court|community_clubhouse|senior_community', None),
+        Param('features_in_nyc_only', Union[str, None], 'Comma separated values. One or more from following options: furniture|dishwasher|community_doorman|pets_allowed|laundry_room|elevator|community_outdoor_space', None),
+    ]),
+    Endpoint('v2_for_sale_result_count', '/v2/for-sale-result-count', 'Get for-sale search result count. **Parameters**: `city, state_code, location, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, property_type_nyc_only, new_construction, hide_pending_contingent, has_virtual_tours, has_3d_tours, hide_foreclosure, price_reduced, open_house, keywords, no_hoa_fee, hoa_max, days_on_realtor, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, lot_size_min, lot_size_max, home_age_max, stories, garage, heating_cooling, inside_rooms, outside_features, lot_views, community_ammenities, features_in_nyc_only`', [
+        Param('state_code', str, 'State Code. Get from /location/suggest response'),
+        Param('city', str, 'City name. Get data from /location/suggest response'),
+        Param('location', Union[str, None], 'Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank', None),
+        Param('price_min', Union[str, None], 'Minimum list price in USD', None),
+        Param('price_max', Union[str, None], 'Maximum list price in USD', None),
+        Param('beds_min', Union[str, None], 'Minimum bedrooms', None),
+        Param('beds_max', Union[str, None], 'Maximum bedrooms', None),
+        Param('baths_min', Union[str, None], 'Minimum bathrooms', None),
+        Param('baths_max', Union[str, None], 'Maximum bathrooms', None),
+        Param('property_type_nyc_only', Union[str, None], 'Comma separated values. One or more from following options: condo|coop|condop. For NYC listings only', None),
+        Param('new_construction', Union[str, None], 'true for New construction only. Leave blank for any', None),
+        Param('hide_pending_contingent', Union[str, None], 'true for hide pending/contingent. Leave blank for any', None),
+        Param('has_virtual_tours', Union[str, None], 'true for properties with virtual tour only. Leave blank for any', None),
+        Param('has_3d_tours', Union[str, None], 'true for properties with 3D tour only. Leave blank for any', None),
+        Param('hide_foreclosure', Union[str, None], 'true for hide foreclosure. Leave blank for any', None),
+        Param('price_reduced', Union[str, None], 'true for properties with price reduced only. Leave blank for any', None),
+        Param('open_house', Union[str, None], 'true for properties with open house only. Leave blank for any', None),
+        Param('keywords', Union[str, None], 'Comma separated values. Get popular keywords from /keywords-search-suggest response', None),
+        Param('no_hoa_fee', Union[str, None], 'true for properties without HOA fee only. Leave blank for any', None),
+        Param('hoa_max', Union[str, None], 'Maximum HOA fee in USD', None),
+        Param('days_on_realtor', Union[str, None], 'One of the following options: today|7|14|21|30', None),
+        Param('expand_search_radius', Union[str, None], 'One of the following options: 1|5|10|25|50. Expand search by radius in miles', None),
+        Param('include_nearby_areas_slug_id', Union[str, None], 'Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-sale-nearby-areas', None),
+        Param('home_size_min', Union[str, None], 'One of the following options: 750|1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500. Minimum home size in sqft', None),
+        Param('home_size_max', Union[str, None], 'One of the following options: 1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500|10000. Maximum home size in sqft', None),
+        Param('lot_size_min', Union[str, None], 'One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Minimum lot size in sqft', None),
+        Param('lot_size_max', Union[str, None], 'One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Maximum lot size in sqft', None),
+        Param('home_age_max', Union[str, None], 'Maximum home age', None),
+        Param('stories', Union[str, None], 'One of the following options: single|multi', None),
+        Param('garage', Union[str, None], 'One of the following options: 1+|2+|3+', None),
+        Param('heating_cooling', Union[str, None], 'Comma separated values. One or more from following options: central_air|central_heat|forced_air', None),
+        Param('inside_rooms', Union[str, None], 'Comma separated values. One or more comma separated from following options: basement|hardwood_floors|fireplace|disability_features|den_or_office|family_room|dining_room', None),
+        Param('outside_features', Union[str, None], 'Comma separated values. One or more from following options: swimming_pool|spa_or_hot_tub|horse_facilities', None),
+        Param('lot_views', Union[str, None], 'Comma separated values. One or more from following options: waterfront|cul_de_sac|corner_lot|golf_course_lot_or_frontage|hill_or_mountain_view|ocean_view|lake_view|river_view', None),
+        Param('community_ammenities', Union[str, None], 'Comma separated values. One or more from following options: community_swimming_pool|community_spa_or_hot_tub|community_golf|community_security_features|community_boat_facilities|tennis_court|community_clubhouse|senior_community', None),
+        Param('features_in_nyc_only', Union[str, None], 'Comma separated values. One or more from following options: furniture|dishwasher|community_doorman|pets_allowed|laundry_room|elevator|community_outdoor_space', None),
+    ]),
+    Endpoint('for_sale', '/for-sale', 'Search for-sale properties. **Parameters**: `city, state_code, location, limit, offset, sort:newest price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, property_type_nyc_only, new_construction, hide_pending_contingent, has_virtual_tours, has_3d_tours, hide_foreclosure, price_reduced, open_house, keywords, no_hoa_fee, hoa_max, days_on_realtor, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, lot_size_min, lot_size_max, home_age_max, stories, garage, heating_cooling, inside_rooms, outside_features, lot_views, community_ammenities, features_in_nyc_only`', [
+        Param('offset', Union[int, float], 'Offset results, default 0. Maximum 9800. Default: 0'),
+        Param('limit', Union[int, float], 'Number of results. Maximum 200 for Paid Plan, default 42 Default: 42'),
+        Param('state_code', str, 'State Code. Get from /location/suggest response'),
+        Param('city', str, 'City name. Get data from /location/suggest response'),
+        Param('location', Union[str, None], 'Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank', None),
+        Param('sort', Union[str, None], 'One of the following options: relevant|newest|lowest_price|highest_price|open_house_date|price_reduced_date|largest_sqft|lot_size|sold_date. Default is relevant', None),
+        Param('price_min', Union[str, None], 'Minimum list price in USD', None),
+        Param('price_max', Union[str, None], 'Maximum list price in USD', None),
+        Param('beds_min', Union[str, None], 'Minimum bedrooms', None),
+        Param('beds_max', Union[str, None], 'Maximum bedrooms', None),
+        Param('baths_min', Union[str, None], 'Minimum bathrooms', None),
+        Param('baths_max', Union[str, None], 'Maximum bathrooms', None),
+        Param('property_type', Union[str, None], 'Comma separated values. One or more from following options: multi_family|single_family|mobile|land|farm', None),
+        Param('property_type_nyc_only', Union[str, None], 'Comma separated values. One or more from following options: condo|coop|condop. For NYC listings only', None),
+        Param('new_construction', Union[str, None], 'true for New construction only. Leave blank for any', None),
+        Param('hide_pending_contingent', Union[str, None], 'true for hide pending/contingent. Leave blank for any', None),
+        Param('has_virtual_tours', Union[str, None], 'true for properties with virtual tour only. Leave blank for any', None),
+        Param('has_3d_tours', Union[str, None], 'true for properties with 3D tour only. Leave blank for any', None),
+        Param('hide_foreclosure', Union[str, None], 'true for hide foreclosure. Leave blank for any', None),
+        Param('price_reduced', Union[str, None], 'true for properties with price reduced only. Leave blank for any', None),
+        Param('open_house', Union[str, None], 'true for properties with open house only. Leave blank for any', None),
+        Param('keywords', Union[str, None], 'Comma separated values. Get popular keywords from /keywords-search-suggest response', None),
+        Param('no_hoa_fee', Union[str, None], 'true for properties without HOA fee only. Leave blank for any', None),
+        Param('hoa_max', Union[str, None], 'Maximum HOA fee in USD', None),
+        Param('days_on_realtor', Union[str, None], 'One of the following options: today|7|14|21|30', None),
+        Param('expand_search_radius', Union[str, None], 'One of the following options: 1|5|10|25|50. Expand search by radius in miles', None),
+        Param('include_nearby_areas_slug_id', Union[str, None], 'Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-sale-nearby-areas', None),
+        Param('home_size_min', Union[str, None], 'One of the following options: 750|1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500. Minimum home size in sqft', None),
+        Param('home_size_max', Union[str, None], 'One of the following options: 1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500|10000. Maximum home size in sqft', None),
+        Param('lot_size_min', Union[str, None], 'One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Minimum lot size in sqft', None),
+        Param('lot_size_max', Union[str, None], 'One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Maximum lot size in sqft', None),
+        Param('home_age_max', Union[str, None], 'Maximum home age', None),
+        Param('stories', Union[str, None], 'One of the following options: single|multi', None),
+        Param('garage', Union[str, None], 'One of the following options: 1+|2+|3+', None),
+        Param('heating_cooling', Union[str, None], 'Comma separated values. One or more from following options: central_air|central_heat|forced_air', None),
+        Param('inside_rooms', Union[str, None], 'Comma separated values. One or more comma separated from following options: basement|hardwood_floors|fireplace|disability_features|den_or_office|family_room|dining_room', None),
+        Param('outside_features', Union[str, None], 'Comma separated values. One or more from following options: swimming_pool|spa_or_hot_tub|horse_facilities', None),
+        Param('lot_views', Union[str, None], 'Comma separated values. One or more from following options: waterfront|cul_de_sac|corner_lot|golf_course_lot_or_frontage|hill_or_mountain_view|ocean_view|lake_view|river_view', None),
+        Param('community_ammenities', Union[str, None], 'Comma separated values. One or more from following options: community_swimming_pool|community_spa_or_hot_tub|community_golf|community_security_features|community_boat_facilities|tennis_court|community_clubhouse|senior_community', None),
+        Param('features_in_nyc_only', Union[str, None], 'Comma separated values. One or more from following options: furniture|dishwasher|community_doorman|pets_allowed|laundry_room|elevator|community_outdoor_space', None),
+    ]),
+    Endpoint('for_sale_similiar_homes', '/for-sale/similiar-homes', 'Get similiar homes by `property_id`', [
+        Param('property_id', Union[int, float], 'Default: 8624316600'),
+    ]),
+    Endpoint('for_sale_other_homes_in_building', '/for-sale/other-homes-in-building', 'Get other homes in same building by `property_id`', [
+        Param('property_id', Union[int, float], 'Default: 9626941405'),
+    ]),
+    Endpoint('for_sale_home_estimate_value', '/for-sale/home-estimate-value', 'Get home estimate and historical values', [
+        Param('property_id', Union[int, float], 'Default: 2061530895'),
+    ], cache_ttl=3600),
+    Endpoint('v2_sold_homes_by_zipcode', '/v2/sold-homes-by-zipcode', 'Search for-sale properties. **Parameters**: `zipcode, limit, offset, sort, max_sold_days, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, lot_size_min, lot_size_max, home_age_max`', [
+        Param('zipcode', Union[int, float], 'zipcode Default: 37932'),
+        Param('offset', Union[int, float, None], 'Offset results, default 0 Default: 0', None),
+        Param('sort', Union[str, None], 'One of the following options: sold_date | lowest_price | highest_price | lot_size | number_of_beds. Default is sold_date', None),
+        Param('max_sold_days', Union[int, float, None], 'Maximum sold days form now', None),
+        Param('price_max', Union[int, float, None], 'Maximum list price in USD Default: 0', None),
+        Param('beds_min', Union[int, float, None], 'Minimum bedrooms Default: 0', None),
+        Param('beds_max', Union[int, float, None], 'Maximum bedrooms Default: 0', None),
+        Param('baths_min', Union[int, float, None], 'Minimum bathrooms Default: 0', None),
+        Param('baths_max', Union[int, float, None], 'Maximum bathrooms Default: 0', None),
+        Param('property_type', Union[str, None], 'Comma separated values. One or more from following options: multi_family|single_family|mobile|land|farm', None),
+        Param('expand_search_radius', Union[int, float, None], 'One of the following options: 1|5|10|25|50 Default: 0', None),
+        Param('include_nearby_areas_slug_id', Union[str, None], 'Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-rent-nearby-areas', None),
+        Param('home_size_min', Union[int, float, None], 'One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 0', None),
+        Param('home_size_max', Union[int, float, None], 'One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 0', None),
+        Param('lot_size_min', Union[str, None], 'One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Minimum lot size in sqft', None),
+        Param('lot_size_max', Union[str, None], 'One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Maximum lot size in sqft', None),
+        Param('home_age_max', Union[str, None], 'Maximum home age', None),
+    ]),
+    Endpoint('sold_homes', '/sold-homes', 'Search for-sale properties. **Parameters**: `city, state_code, location, limit, offset, sort, max_sold_days, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, lot_size_min, lot_size_max, home_age_max`', [
+        Param('state_code', str, 'State Code. Get from /location/suggest response'),
+        Param('city', str, 'City name. Get data from /location/suggest response'),
+        Param('location', Union[int, float, None], 'Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank Default: 0', None),
+        Param('limit', Union[int, float, None], 'Number of results. Maximum 200 for Paid Plan, default 42 Default: 10', None),
+        Param('offset', Union[int, float, None], 'Offset results, default 0 Default: 0', None),
+        Param('sort', Union[str, None], 'One of the following options: sold_date | lowest_price | highest_price | lot_size | number_of_beds. Default is sold_date', None),
+        Param('max_sold_days', Union[int, float, None], 'Maximum sold days form now', None),
+        Param('price_min', Union[int, float, None], 'Minimum list price in USD Default: 0', None),
+        Param('price_max', Union[int, float, None], 'Maximum list price in USD Default: 0', None),
+        Param('beds_min', Union[int, float, None], 'Minimum bedrooms Default: 0', None),
+        Param('beds_max', Union[int, float, None], 'Maximum bedrooms Default: 0', None),
+        Param('baths_min', Union[int, float, None], 'Minimum bathrooms Default: 0', None),
+        Param('baths_max', Union[int, float, None], 'Maximum bathrooms Default: 0', None),
+        Param('property_type', Union[str, None], 'Comma separated values. One or more from following options: multi_family|single_family|mobile|land|farm', None),
+        Param('expand_search_radius', Union[int, float, None], 'One of the following options: 1|5|10|25|50 Default: 0', None),
+        Param('include_nearby_areas_slug_id', Union[str, None], 'Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-rent-nearby-areas', None),
+        Param('home_size_min', Union[int, float, None], 'One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 0', None),
+        Param('home_size_max', Union[int, float, None], 'One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 0', None),
+        Param('lot_size_min', Union[str, None], 'One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Minimum lot size in sqft', None),
+        Param('lot_size_max', Union[str, None], 'One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Maximum lot size in sqft', None),
+        Param('home_age_max', Union[str, None], 'Maximum home age', None),
+    ]),
+    Endpoint('v2_for_rent', '/v2/for-rent', 'Get for-rent properties. **Parameters**: `city, state_code, location, limit, offset, sort, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, in_unit_features, community_ammenities, cats_ok, dogs_ok`', [
+        Param('city', str, 'City name. Get data from /location/suggest response'),
+        Param('state_code', str, 'State Code. Get from /location/suggest response'),
+        Param('location', Union[int, float, None], 'Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank Default: 48278', None),
+        Param('limit', Union[int, float, None], 'Number of results. Maximum 200 for Paid Plan, default 42 Default: 10', None),
+        Param('offset', Union[int, float, None], 'Offset results, default 0. Maximum 9800. Default: 0', None),
+        Param('sort', Union[str, None], 'One of the following options: frehsnest|recently_added_update|lowest_price|highest_price. Default is frehsnest', None),
+        Param('price_min', Union[int, float, None], 'Minimum list price in USD Default: 1000', None),
+        Param('price_max', Union[int, float, None], 'Maximum list price in USD Default: 3000', None),
+        Param('beds_min', Union[int, float, None], 'Minimum bedrooms Default: 1', None),
+        Param('beds_max', Union[int, float, None], 'Maximum bedrooms Default: 5', None),
+        Param('baths_min', Union[int, float, None], 'Minimum bathrooms Default: 1', None),
+        Param('baths_max', Union[int, float, None], 'Maximum bathrooms Default: 5', None),
+        Param('property_type', Union[str, None], 'Comma separated values. One or more from following options: townhome,coop,single_family,apartment,condo,condop', None),
+        Param('expand_search_radius', Union[int, float, None], 'One of the following options: 1|5|10|25|50 Default: 25', None),
+        Param('include_nearby_areas_slug_id', Union[str, None], 'Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-rent-nearby-areas', None),
+        Param('home_size_min', Union[int, float, None], 'One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 500', None),
+        Param('home_size_max', Union[int, float, None], 'One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 3000', None),
+        Param('in_unit_features', Union[str, None], 'Comma separated values. One or more from following options: central_air|dishwasher|washer_dryer|furnished', None),
+        Param('community_ammenities', Union[str, None], 'Comma separated values. One or more from following options: garage_1_or_more|swimming_pool|community_doorman|community_outdoor_space|community_elevator|laundry_room|community_gym', None),
+        Param('cats_ok', Union[bool, None], 'true for Cats allowed only', None),
+        Param('dogs_ok', Union[bool, None], 'true for Dogs allowed only', None),
+    ]),
+    Endpoint('v2_for_rent_by_zipcode', '/v2/for-rent-by-zipcode', 'Get for-rent properties. **Parameters**: `zipcode, limit, offset, sort, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, in_unit_features, community_ammenities, cats_ok, dogs_ok`', [
+        Param('zipcode', Union[int, float], 'zipcode Default: 48278'),
+        Param('limit', Union[int, float, None], 'Number of results. Maximum 200 for Paid Plan, default 42 Default: 10', None),
+        Param('offset', Union[int, float, None], 'Offset results, default 0. Maximum 9800. Default: 0', None),
+        Param('sort', Union[str, None], 'One of the following options: frehsnest|recently_added_update|lowest_price|highest_price. Default is frehsnest', None),
+        Param('price_min', Union[int, float, None], 'Minimum list price in USD Default: 0', None),
+        Param('beds_min', Union[int, float, None], 'Minimum bedrooms Default: 0', None),
+        Param('beds_max', Union[int, float, None], 'Maximum bedrooms Default: 0', None),
+        Param('baths_min', Union[int, float, None], 'Minimum bathrooms Default: 0', None),
+        Param('baths_max', Union[int, float, None], 'Maximum bathrooms Default: 0', None),
+        Param('property_type', Union[str, None], 'Comma separated values. One or more from following options: townhome,coop,single_family,apartment,condo,condop', None),
+        Param('include_nearby_areas_slug_id', Union[str, None], 'Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-rent-nearby-areas', None),
+        Param('home_size_min', Union[int, float, None], 'One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 0', None),
+        Param('home_size_max', Union[int, float, None], 'One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 0', None),
+        Param('in_unit_features', Union[str, None], 'Comma separated values. One or more from following options: central_air|dishwasher|washer_dryer|furnished', None),
+        Param('community_ammenities', Union[str, None], 'Comma separated values. One or more from following options: garage_1_or_more|swimming_pool|community_doorman|community_outdoor_space|community_elevator|laundry_room|community_gym', None),
+        Param('cats_ok', Union[bool, None], 'true for Cats allowed only', None),
+        Param('dogs_ok', Union[bool, None], 'true for Dogs allowed only', None),
+    ]),
+    Endpoint('v2_for_rent_result_count', '/v2/for-rent-result-count', 'Get result count for-rent properties. **Parameters**: `city, state_code, location, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, in_unit_features, community_ammenities, cats_ok, dogs_ok`', [
+        Param('city', str, 'City name. Get data from /location/suggest response'),
+        Param('state_code', str, 'State Code. Get from /location/suggest response'),
+        Param('location', Union[int, float, None], 'Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank Default: 48278', None),
+        Param('price_min', Union[int, float, None], 'Minimum list price in USD Default: 1000', None),
+        Param('price_max', Union[int, float, None], 'Maximum list price in USD Default: 3000', None),
+        Param('beds_min', Union[int, float, None], 'Minimum bedrooms Default: 1', None),
+        Param('beds_max', Union[int, float, None], 'Maximum bedrooms Default: 5', None),
+        Param('baths_min', Union[int, float, None], 'Minimum bathrooms Default: 1', None),
+        Param('baths_max', Union[int, float, None], 'Maximum bathrooms Default: 5', None),
+        Param('property_type', Union[str, None], 'Comma separated values. One or more from following options: townhome,coop,single_family,apartment,condo,condop', None),
+        Param('expand_search_radius', Union[int, float, None], 'One of the following options: 1|5|10|25|50 Default: 25', None),
+        Param('include_nearby_areas_slug_id', Union[str, None], 'Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-rent-nearby-areas', None),
+        Param('home_size_min', Union[int, float, None], 'One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 500', None),
+        Param('home_size_max', Union[int, float, None], 'One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 3000', None),
+        Param('in_unit_features', Union[str, None], 'Comma separated values. One or more from following options: central_air|dishwasher|washer_dryer|furnished', None),
+        Param('community_ammenities', Union[str, None], 'Comma separated values. One or more from following options: garage_1_or_more|swimming_pool|community_doorman|community_outdoor_space|community_elevator|laundry_room|community_gym', None),
+        Param('cats_ok', Union[bool, None], 'true for Cats allowed only', None),
+        Param('dogs_ok', Union[bool, None], 'true for Dogs allowed only', None),
+    ]),
+    Endpoint('for_rent_similiar_homes', '/v2/for-rent/similiar-homes', 'Get similiar for-rent homes by `property_id`', [
+        Param('property_id', Union[int, float], 'Default: 1207989147'),
+    ]),
+    Endpoint('for_rent', '/for-rent', 'Get for-rent properties. **Parameters**: `city, state_code, location, limit, offset, sort, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, in_unit_features, community_ammenities, cats_ok, dogs_ok`', [
+        Param('city', str, 'City name. Get data from /location/suggest response'),
+        Param('state_code', str, 'State Code. Get from /location/suggest response'),
+        Param('location', Union[int, float, None], 'Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank Default: 48278', None),
+        Param('limit', Union[int, float, None], 'Number of results. Maximum 200 for Paid Plan, default 42 Default: 10', None),
+        Param('offset', Union[int, float, None], 'Offset results, default 0. Maximum 9800. Default: 0', None),
+        Param('sort', Union[str, None], 'One of the following options: frehsnest|recently_added_update|lowest_price|highest_price. Default is frehsnest', None),
+        Param('price_min', Union[int, float, None], 'Minimum list price in USD Default: 1000', None),
+        Param('price_max', Union[int, float, None], 'Maximum list price in USD Default: 3000', None),
+        Param('beds_min', Union[int, float, None], 'Minimum bedrooms Default: 1', None),
+        Param('beds_max', Union[int, float, None], 'Maximum bedrooms Default: 5', None),
+        Param('baths_min', Union[int, float, None], 'Minimum bathrooms Default: 1', None),
+        Param('baths_max', Union[int, float, None], 'Maximum bathrooms Default: 5', None),
+        Param('property_type', Union[str, None], 'Comma separated values. One or more from following options: townhome,coop,single_family,apartment,condo,condop', None),
+        Param('expand_search_radius', Union[int, float, None], 'One of the following options: 1|5|10|25|50 Default: 25', None),
+        Param('include_nearby_areas_slug_id', Union[str, None], 'Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-rent-nearby-areas', None),
+        Param('home_size_min', Union[int, float, None], 'One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 500', None),
+        Param('home_size_max', Union[int, float, None], 'One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 3000', None),
+        Param('in_unit_features', Union[str, None], 'Comma separated values. One or more from following options: central_air|dishwasher|washer_dryer|furnished', None),
+        Param('community_ammenities', Union[str, None], 'Comma separated values. One or more from following options: garage_1_or_more|swimming_pool|community_doorman|community_outdoor_space|community_elevator|laundry_room|community_gym', None),
+        Param('cats_ok', Union[bool, None], 'true for Cats allowed only', None),
+        Param('dogs_ok', Union[bool, None], 'true for Dogs allowed only', None),
+    ]),
+    Endpoint('finance_mortgage_calculate', '/finance/mortgage-calculate', 'Mortgage calculae', [
+        Param('show_amortization', bool),
+        Param('hoa_fees', Union[int, float], 'Default: 0'),
+        Param('percent_tax_rate', Union[int, float], 'Default: 0.5110091743119266'),
+        Param('year_term', Union[int, float], 'Default: 30'),
+        Param('percent_rate', Union[int, float], 'Default: 3.088'),
+        Param('down_payment', Union[int, float], 'Default: 239800'),
+        Param('monthly_home_insurance', Union[int, float], 'Default: 416'),
+        Param('price', Union[int, float], 'Default: 1300000'),
+    ]),
+    Endpoint('finance_rate_trends', '/finance/rate-trends', 'Get current rate trends and historical rate trends', [
+        Param('is_refinance', bool),
+    ], cache_ttl=6 * 3600),
+    Endpoint('finance_average_rate', '/finance/average-rate', 'Get average rates data', [
+        Param('postal_code', Union[int, float], 'Default: 10312'),
+    ], cache_ttl=6 * 3600),
+    Endpoint('agents_agents_search_by_zipcode', '/agents/agents-search-by-zipcode', 'Search for agents, teams, and office by zip code', [
+        Param('zipcode', str, 'Postal code. Required if search by postal_code only.'),
+        Param('agent_name', Union[str, None], 'Agent name to search.', None),
+        Param('sort', Union[str, None], 'One of the following options: agent_rating_high|recent_activity_high|recommendations_count_high|for_sale_count_high|recently_sold_high', None),
+        Param('limit', Union[int, float, None], 'Maximum is 20', None),
+        Param('offset', Union[int, float, None], 'Offset. Default is 0', None),
+        Param('recommendations_count_min', Union[int, float, None], 'Minimum recommendations count. 1 to 10. Default is Any', None),
+        Param('agent_rating_min', Union[int, float, None], 'Minimum agent rating. 1 to 5. Default is Any.', None),
+        Param('types', Union[str, None], 'One of the following options: agent | team | office', None),
+        Param('price_min', Union[int, float, None], 'Minimum list price in USD', None),
+        Param('price_max', Union[int, float, None], 'Maximum list price in USD', None),
+    ]),
+    Endpoint('agents_agents_search', '/agents/agents-search', 'Search for agents, teams and office', [
+        Param('state_code', Union[str, None], 'State code. Required if not search by postal_code.', None),
+        Param('city', Union[str, None], 'City name. Required if not search by postal_code.', None),
+        Param('postal_code', Union[str, None], 'Postal code. Required if search by postal_code only.', None),
+        Param('agent_name', Union[str, None], 'Agent name to search.', None),
+        Param('sort', Union[str, None], 'One of the following options: agent_rating_high|recent_activity_high|recommendations_count_high|for_sale_count_high|recently_sold_high', None),
+        Param('limit', Union[int, float, None], 'Maximum is 100', None),
+        Param('offset', Union[int, float, None], 'Offset. Default is 0', None),
+        Param('recommendations_count_min', Union[int, float, None], 'Minimum recommendations count. 1 to 10. Default is Any', None),
+        Param('agent_rating_min', Union[int, float, None], 'Minimum agent rating. 1 to 5. Default is Any.', None),
+        Param('types', Union[str, None], 'One of the following options: agent | team | office', None),
+        Param('price_min', Union[int, float, None], 'Minimum list price in USD', None),
+        Param('price_max', Union[int, float, None], 'Maximum list price in USD', None),
+    ]),
+    Endpoint('agents_agent_profile', '/agents/agent-profile', "Get Agent's profile by advertiser_id and nrds_id", [
+        Param('advertiser_id', str),
+        Param('nrds_id', Union[str, None], '', None),
+    ], cache_ttl=3600),
+    Endpoint('agents_agent_listings', '/agents/agent-listings', "Get Agent's listings", [
+        Param('advertiser_id', str),
+        Param('nrds_id', Union[str, None], '', None),
+        Param('page', Union[str, None], '', None),
+    ]),
+]
@@ -0,0 +1,143 @@
+import json
+import re
+from typing import Callable, Iterable, List, Tuple, Union
+
+_whitespace = re.compile(r'[ \t\n\r]*')
+_string_end = re.compile(r'(?:[^"\\]|\\.)*"', re.S)
+_structural = re.compile(r'["{}\[\]:,]')
+_decoder = json.JSONDecoder()
+
+
+class ArrayStream:
+    '''Incremental JSON decoder that hands each element of one nested array to a callback as it arrives.
+
+    Feed it the document text chunk by chunk. The first array found at any of
+    `paths` (tuples of object keys from the root) is streamed: each element is
+    decoded on its own with the json module's C scanner as soon as its text is
+    complete, passed to `on_item`, and its text dropped. The rest of the
+    document is kept as text and parsed by `close()`, which returns it with that
+    array holding whatever `on_item` returned for each element, less the Nones.
+    A document without a matching array is simply parsed whole.
+    '''
+
+    def __init__(self, paths: Iterable[Tuple[str, ...]], on_item: Callable):
+        self.paths = {tuple(path) for path in paths}
+        self.on_item = on_item
+        self.path = None
+        self.items = []
+        self._text = ''
+        self._pos = 0
+        self._envelope = []
+        self._stack = []
+        self._streaming = False
+        self._done = False
+
+    def feed(self, text: str) -> None:
+        self._text = self._text[self._pos:] + text
+        self._pos = 0
+        self._scan(final=False)
+
+    def close(self):
+        self._scan(final=True)
+        if self._streaming:
+            raise json.JSONDecodeError('Unterminated array', self._text, self._pos)
+        document = json.loads(''.join(self._envelope) + self._text[self._pos:])
+        if self.path is not None:
+            node = document
+            for key in self.path:
+                node = node[key]
+            node.extend(self.items)
+        return document
+
+    def _scan(self, final: bool) -> None:
+        while True:
+            if self._streaming:
+                if not self._scan_items(final):
+                    return
+            elif self._done or not self._scan_envelope():
+                return
+
+    def _scan_envelope(self) -> bool:
+        '''Copy envelope text up to the target array's opening bracket; False once more text is needed'''
+        text = self._text
+        while True:
+            match = _structural.search(text, self._pos)
+            if match is None:
+                return False
+            char = match.group()
+            end = match.end()
+            if char == '"':
+                string_end = _string_end.match(text, end)
+                if string_end is None:
+                    self._flush(match.start())
+                    return False
+                end = string_end.end()
+                if self._stack and self._stack[-1][0] == '{' and self._stack[-1][2]:
+                    self._stack[-1][1] = json.loads(text[match.start():end])
+            elif char in '{[':
+                if char == '[' and self._key_path() in self.paths:
+                    self._envelope.append(text[self._pos:end] + ']')
+                    self._pos = end
+                    self.path = self._key_path()
+                    self._streaming = True
+                    return True
+                self._stack.append([char, None, char == '{'])
+            elif char in '}]':
+                self._stack.pop()
+                if not self._stack:
+                    self._done = True
+            elif char == ':':
+                self._stack[-1][2] = False
+            elif self._stack[-1][0] == '{':
+                self._stack[-1][2] = True
+            self._envelope.append(text[self._pos:end])
+            self._pos = end
+            if self._done:
+                return False
+
+    def _scan_items(self, final: bool) -> bool:
+        '''Decode complete array elements; True once the closing bracket is consumed'''
+        text = self._text
+        while True:
+            position = _whitespace.match(text, self._pos).end()
+            if position < len(text) and text[position] == ',':
+                position = _whitespace.match(text, position + 1).end()
+            if position >= len(text):
+                return False
+            if text[position] == ']':
+                self._pos = position + 1
+                self._streaming = False
+                return True
+            try:
+                item, end = _decoder.raw_decode(text, position)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                return False
+            if end >= len(text) and not final:
+                # A number at the very end of the text may still be missing digits.
+                return False
+            self._pos = end
+            kept = self.on_item(item)
+            if kept is not None:
+                self.items.append(kept)
+
+    def _key_path(self) -> Union[Tuple[str, ...], None]:
+        if not self._stack or self._stack[0][0] != '{':
+            return None
+        keys = [frame[1] for frame in self._stack]
+        if any(frame[0] != '{' or frame[1] is None for frame in self._stack):
+            return None
+        return tuple(keys)
+
+    def _flush(self, position: int) -> None:
+        self._envelope.append(self._text[self._pos:position])
+        self._pos = position
+
+
+def stream_array(chunks: Iterable[str], paths: List[Tuple[str, ...]], on_item: Callable):
+    '''Decode a document from text chunks with ArrayStream'''
+    stream = ArrayStream(paths, on_item)
+    for chunk in chunks:
+        stream.feed(chunk)
+    return stream.close()
@@ -0,0 +1,369 @@
+import math
+from datetime import datetime
+from typing import List, Union
+
+from projection import listing_summary, project
+
+# NumPy is imported on first query rather than with the module, keeping it off
+# the server's startup path.
+np = None
+
+
+def _require_numpy() -> None:
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError('numpy is required to query the listing store') from None
+        np = numpy
+
+numeric_columns = ('price', 'beds', 'baths', 'sqft', 'lat', 'lon', 'list_date', 'sold_price', 'sold_date')
+text_columns = ('status', 'state_code', 'city', 'postal_code')
+
+sort_orders = {
+    'newest': ('list_date', True),
+    'oldest': ('list_date', False),
+    'lowest_price': ('price', False),
+    'highest_price': ('price', True),
+    'largest_sqft': ('sqft', True),
+    'smallest_sqft': ('sqft', False),
+    'most_beds': ('beds', True),
+}
+
+
+def _number(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def _timestamp(value) -> float:
+    if not value:
+        return float('nan')
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return float('nan')
+
+
+def listing_row(listing: dict) -> dict:
+    '''The columnar fields of one search result (v2/v3 listing layout)'''
+    description = listing.get('description') or {}
+    address = (listing.get('location') or {}).get('address') or {}
+    coordinate = address.get('coordinate') or {}
+    baths = description.get('baths')
+    if baths is None:
+        baths = description.get('baths_consolidated')
+    return {
+        'price': _number(listing.get('list_price')),
+        'beds': _number(description.get('beds')),
+        'baths': _number(str(baths).rstrip('+') if baths is not None else None),
+        'sqft': _number(description.get('sqft')),
+        'lat': _number(coordinate.get('lat')),
+        'lon': _number(coordinate.get('lon')),
+        'list_date': _timestamp(listing.get('list_date')),
+        'sold_price': _number(listing.get('last_sold_price') or description.get('sold_price')),
+        'sold_date': _timestamp(listing.get('last_sold_date') or description.get('sold_date')),
+        'status': str(listing.get('status') or '').lower(),
+        'state_code': str(address.get('state_code') or '').lower(),
+        'city': str(address.get('city') or '').lower(),
+        'postal_code': str(address.get('postal_code') or ''),
+    }
+
+
+class ListingStore:
+    '''Listings seen in search responses, keyed by `property_id`, with the filterable
+    fields kept column-wise so filters and sorts run as NumPy array operations.
+
+    Rows are appended as Python lists and packed into arrays lazily on the next
+    query. Each listing is kept projected to `fields` (the search summary, without
+    photos and other nested media, by default; None keeps it whole). Beyond
+    `max_listings` the oldest rows are dropped.
+    '''
+
+    def __init__(self, max_listings: int = 50000, fields: Union[List[str], None] = listing_summary):
+        self.max_listings = max_listings
+        self.fields = fields
+        self._listings = []
+        self._columns = {name: [] for name in numeric_columns + text_columns}
+        self._index = {}
+        self._arrays = None
+        self._spatial = None
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def add(self, listings: List[dict]) -> None:
+        for listing in listings:
+            property_id = listing.get('property_id')
+            if property_id is None:
+                continue
+            row = listing_row(listing)
+            if self.fields is not None:
+                listing = project(listing, self.fields)
+            position = self._index.get(property_id)
+            if position is None:
+                self._index[property_id] = len(self._listings)
+                self._listings.append(listing)
+                for name, value in row.items():
+                    self._columns[name].append(value)
+            else:
+                self._listings[position] = listing
+                for name, value in row.items():
+                    self._columns[name][position] = value
+            self._arrays = self._spatial = None
+        if len(self._listings) > self.max_listings:
+            self._compact(len(self._listings) - self.max_listings)
+
+    def _compact(self, drop: int) -> None:
+        self._listings = self._listings[drop:]
+        self._columns = {name: values[drop:] for name, values in self._columns.items()}
+        self._index = {listing['property_id']: position for position, listing in enumerate(self._listings)}
+        self._arrays = self._spatial = None
+
+    def arrays(self) -> dict:
+        _require_numpy()
+        if self._arrays is None:
+            self._arrays = {name: np.asarray(self._columns[name], dtype=float) for name in numeric_columns}
+            self._arrays.update({name: np.asarray(self._columns[name], dtype=object) for name in text_columns})
+        return self._arrays
+
+    def spatial(self) -> 'SpatialIndex':
+        '''Grid index over the stored coordinates, rebuilt after the store changes'''
+        arrays = self.arrays()
+        if self._spatial is None:
+            self._spatial = SpatialIndex(arrays['lat'], arrays['lon'])
+        return self._spatial
+
+    def position(self, property_id: str) -> Union[int, None]:
+        return self._index.get(property_id)
+
+    def listing(self, position: int) -> dict:
+        return self._listings[position]
+
+    def listings_at(self, positions) -> List[dict]:
+        return [self._listings[position] for position in positions]
+
+    def select(self, mask=None, sort: Union[str, None] = None) -> 'np.ndarray':
+        '''Positions of the rows passing `mask`, in `sort` order'''
+        arrays = self.arrays()
+        selected = np.flatnonzero(mask) if mask is not None else np.arange(len(self._listings))
+        if sort is not None:
+            column, descending = sort_orders[sort]
+            values = arrays[column][selected]
+            selected = selected[np.argsort(-values if descending else values, kind='stable')]
+        return selected
+
+    def filter_mask(self, state_code: Union[str, None] = None, city: Union[str, None] = None,
+                    postal_code: Union[str, None] = None, status: Union[str, None] = None,
+                    listed_after: Union[str, None] = None, **ranges) -> 'np.ndarray':
+        '''Boolean mask over all rows. `ranges` takes `<column>_min` / `<column>_max` bounds for
+        the numeric columns; rows missing a bounded value are excluded.'''
+        arrays = self.arrays()
+        mask = np.ones(len(self._listings), dtype=bool)
+        for name, value in (('state_code', state_code), ('city', city), ('status', status)):
+            if value is not None:
+                mask &= arrays[name] == value.lower()
+        if postal_code is not None:
+            mask &= arrays['postal_code'] == str(postal_code)
+        if listed_after is not None:
+            mask &= arrays['list_date'] >= _timestamp(listed_after)
+        for bound, value in ranges.items():
+            if value is None:
+                continue
+            name, _, side = bound.rpartition('_')
+            if name not in numeric_columns or side not in ('min', 'max'):
+                raise ValueError(f'Unknown range filter {bound}')
+            mask &= arrays[name] >= value if side == 'min' else arrays[name] <= value
+        return mask
+
+    def query(self, sort: Union[str, None] = None, limit: Union[int, None] = None, offset: int = 0, **filters) -> tuple:
+        '''`(total, listings)` for the stored listings matching `filters`, sorted and paged'''
+        selected = self.select(self.filter_mask(**filters), sort)
+        end = None if limit is None else offset + limit
+        return len(selected), [self._listings[position] for position in selected[offset:end]]
+
+
+earth_radius_miles = 3958.8
+miles_per_degree = 69.05
+
+
+def haversine_miles(lat, lon, lats, lons):
+    '''Great-circle distance in miles from one point to arrays of points'''
+    _require_numpy()
+    lat, lon, lats, lons = np.radians(lat), np.radians(lon), np.radians(lats), np.radians(lons)
+    a = np.sin((lats - lat) / 2) ** 2 + np.cos(lat) * np.cos(lats) * np.sin((lons - lon) / 2) ** 2
+    return 2 * earth_radius_miles * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class SpatialIndex:
+    '''Uniform lat/lon grid over listing coordinates. Each occupied cell maps to the
+    positions of the listings inside it, so queries only score nearby candidates.'''
+
+    def __init__(self, lats: 'np.ndarray', lons: 'np.ndarray', cell_degrees: float = 0.05):
+        _require_numpy()
+        self.lats = lats
+        self.lons = lons
+        self.cell_degrees = cell_degrees
+        located = np.flatnonzero(~(np.isnan(lats) | np.isnan(lons)))
+        rows = np.floor(lats[located] / cell_degrees).astype(np.int64)
+        columns = np.floor(lons[located] / cell_degrees).astype(np.int64)
+        order = np.lexsort((columns, rows))
+        located, rows, columns = located[order], rows[order], columns[order]
+        starts = np.flatnonzero(np.r_[True, (np.diff(rows) != 0) | (np.diff(columns) != 0)]) if len(located) else np.array([], dtype=np.int64)
+        ends = np.r_[starts[1:], len(located)]
+        self.located = located
+        self.bounds = (int(rows.min()), int(rows.max()), int(columns.min()), int(columns.max())) if len(located) else None
+        self.cells = {(int(rows[start]), int(columns[start])): located[start:end] for start, end in zip(starts, ends)}
+
+    def _cell(self, lat: float, lon: float) -> tuple:
+        return int(np.floor(lat / self.cell_degrees)), int(np.floor(lon / self.cell_degrees))
+
+    def _gather(self, row_range: range, column_range: range) -> 'np.ndarray':
+        if len(row_range) * len(column_range) > len(self.cells):
+            keys = [key for key in self.cells if key[0] in row_range and key[1] in column_range]
+        else:
+            keys = [(row, column) for row in row_range for column in column_range if (row, column) in self.cells]
+        return np.concatenate([self.cells[key] for key in keys]) if keys else np.array([], dtype=np.int64)
+
+    def bbox(self, south: float, west: float, north: float, east: float) -> 'np.ndarray':
+        '''Positions of listings inside the box'''
+        (row_low, column_low), (row_high, column_high) = self._cell(south, west), self._cell(north, east)
+        candidates = self._gather(range(row_low, row_high + 1), range(column_low, column_high + 1))
+        lats, lons = self.lats[candidates], self.lons[candidates]
+        return candidates[(lats >= south) & (lats <= north) & (lons >= west) & (lons <= east)]
+
+    def radius(self, lat: float, lon: float, miles: float) -> tuple:
+        '''`(positions, distances)` of listings within `miles`, nearest first'''
+        lat_span = miles / miles_per_degree
+        lon_span = miles / (miles_per_degree * max(np.cos(np.radians(min(abs(lat) + lat_span, 89.9))), 1e-6))
+        candidates = self.bbox(lat - lat_span, lon - lon_span, lat + lat_span, lon + lon_span)
+        distances = haversine_miles(lat, lon, self.lats[candidates], self.lons[candidates])
+        inside = distances <= miles
+        order = np.argsort(distances[inside], kind='stable')
+        return candidates[inside][order], distances[inside][order]
+
+    def nearest(self, lat: float, lon: float, k: int) -> tuple:
+        '''`(positions, distances)` of the `k` nearest listings, widening the searched ring of
+        cells until the k-th distance is inside the area already covered'''
+        if k <= 0 or not len(self.located):
+            return np.array([], dtype=np.int64), np.array([])
+        row, column = self._cell(lat, lon)
+        row_min, row_max, column_min, column_max = self.bounds
+        max_ring = max(row - row_min, row_max - row, column - column_min, column_max - column, 0)
+        for ring in range(max_ring + 1):
+            candidates = self._gather(range(row - ring, row + ring + 1), range(column - ring, column + ring + 1))
+            if len(candidates) < k and ring < max_ring:
+                continue
+            distances = haversine_miles(lat, lon, self.lats[candidates], self.lons[candidates])
+            order = np.argsort(distances, kind='stable')[:k]
+            covered = ring * self.cell_degrees * miles_per_degree * np.cos(np.radians(min(abs(lat) + ring * self.cell_degrees, 89.9)))
+            if (len(order) == k and distances[order[-1]] <= covered) or ring == max_ring:
+                return candidates[order], distances[order]
+
+
+def comparable_sales(store: ListingStore, subjects: List[dict], k: int = 5, max_distance_miles: float = 5.0,
+                     sold_within_days: float = 365) -> List[dict]:
+    '''Value each subject from its `k` most similar recent sales in the store.
+
+    Subjects are `listing_row`-style dicts (lat, lon, beds, baths, sqft), plus the
+    subject's own store `position` if it has one so it is never its own comp. The
+    store's spatial index supplies the listings within `max_distance_miles` of
+    each subject; those with status sold, a price and a size, sold within
+    `sold_within_days`, are scored by distance over `max_distance_miles`, bed
+    and bath differences, the log size ratio and sale age in years. The
+    estimate is the median comp price per sqft times the subject's sqft.
+    '''
+    arrays = store.arrays()
+    spatial = store.spatial()
+    now = datetime.now().timestamp()
+    eligible = ((arrays['status'] == 'sold') & (arrays['sold_price'] > 0) & (arrays['sqft'] > 0)
+                & (arrays['sold_date'] >= now - sold_within_days * 86400))
+    valuations = []
+    for subject in subjects:
+        lat, lon, beds, baths, sqft = (_number(subject.get(name)) for name in ('lat', 'lon', 'beds', 'baths', 'sqft'))
+        if math.isnan(lat) or math.isnan(lon):
+            positions, distances = np.array([], dtype=np.int64), np.array([])
+        else:
+            positions, distances = spatial.radius(lat, lon, max_distance_miles)
+        keep = eligible[positions]
+        if subject.get('position') is not None:
+            keep &= positions != subject['position']
+        positions, distances = positions[keep], distances[keep]
+        comp_sqft = arrays['sqft'][positions]
+        price_per_sqft = arrays['sold_price'][positions] / comp_sqft
+        with np.errstate(divide='ignore', invalid='ignore'):
+            score = (distances / max_distance_miles
+                     + np.nan_to_num(np.abs(arrays['beds'][positions] - beds), nan=1.0) * 0.5
+                     + np.nan_to_num(np.abs(arrays['baths'][positions] - baths), nan=1.0) * 0.5
+                     + np.nan_to_num(np.abs(np.log(comp_sqft / sqft)), nan=0.5) * 2
+                     + (now - arrays['sold_date'][positions]) / (365 * 86400))
+        chosen = np.argsort(score, kind='stable')[:k]
+        comps = [{
+            'property_id': store.listing(int(positions[index])).get('property_id'),
+            'sold_price': float(arrays['sold_price'][positions[index]]),
+            'sold_date': datetime.fromtimestamp(float(arrays['sold_date'][positions[index]])).date().isoformat(),
+            'sqft': float(comp_sqft[index]),
+            'price_per_sqft': round(float(price_per_sqft[index]), 2),
+            'distance_miles': round(float(distances[index]), 3),
+            'score': round(float(score[index]), 4),
+        } for index in chosen]
+        median = float(np.median(price_per_sqft[chosen])) if len(chosen) else None
+        valuations.append({
+            'comps': comps,
+            'price_per_sqft': round(median, 2) if median is not None else None,
+            'estimate_value': round(median * sqft) if median is not None and sqft > 0 else None,
+        })
+    return valuations
+
+
+class SavedSearch:
+    '''Last-seen state of a watched search, used to turn each poll into deltas.
+
+    `seen` maps property_id to `(list_price, list_date timestamp)`. `watermark`
+    is the newest list date seen so far; a poll sorted by newest can stop
+    paging once it reaches listings older than that.
+    '''
+
+    def __init__(self, endpoint: str, params: dict, page_size: int = 42, max_pages: int = 5):
+        self.endpoint = endpoint
+        self.params = params
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.seen = {}
+        self.watermark = None
+        self.polls = 0
+        self.listings_fetched = 0
+
+    def reached_watermark(self, listings: List[dict]) -> bool:
+        if self.watermark is None:
+            return True
+        return any(_timestamp(listing.get('list_date')) < self.watermark for listing in listings)
+
+    def update(self, listings: List[dict], complete: bool) -> dict:
+        '''Record a poll's listings (newest first) and return what was added, removed or repriced.
+        Listings count as removed only within the date window the poll covered, unless it saw the whole result set.'''
+        self.polls += 1
+        self.listings_fetched += len(listings)
+        current = {}
+        for listing in listings:
+            property_id = listing.get('property_id')
+            if property_id is not None and property_id not in current:
+                current[property_id] = (listing, _number(listing.get('list_price')), _timestamp(listing.get('list_date')))
+        added = [listing for property_id, (listing, _, _) in current.items() if property_id not in self.seen]
+        price_changed = [{'property_id': property_id, 'old_price': self.seen[property_id][0], 'new_price': price, 'listing': listing}
+                         for property_id, (listing, price, _) in current.items()
+                         if property_id in self.seen and price != self.seen[property_id][0]
+                         and not (math.isnan(price) and math.isnan(self.seen[property_id][0]))]
+        dates = [date for _, _, date in current.values() if not math.isnan(date)]
+        window_start = min(dates) if dates else float('inf')
+        removed = [property_id for property_id, (_, date) in self.seen.items()
+                   if property_id not in current and (complete or date >= window_start)]
+        for property_id in removed:
+            del self.seen[property_id]
+        self.seen.update({property_id: (price, date) for property_id, (_, price, date) in current.items()})
+        if dates:
+            self.watermark = max(dates + ([self.watermark] if self.watermark is not None else []))
+        return {'added': added, 'removed': removed, 'price_changed': price_changed}
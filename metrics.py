@@ -0,0 +1,208 @@
+import functools
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextvars import ContextVar
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Name of the MCP tool the current task is serving, so upstream work done on
+# its behalf (including coalesced and background calls it started) is
+# attributed to it.
+current_tool = ContextVar('current_tool', default='background')
+
+latency_buckets = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+size_buckets = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+class Histogram:
+    '''Fixed-bucket histogram in the Prometheus layout; quantiles are estimated as bucket upper bounds'''
+
+    def __init__(self, buckets: tuple = latency_buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+    def snapshot(self) -> dict:
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.sum / self.count if self.count else 0.0,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+        }
+
+
+class Metrics:
+    '''Labelled counters and histograms for tool calls and upstream requests.
+
+    Series are keyed by metric name plus `label=value` pairs, in the order the
+    labels are given. `snapshot()` nests them by label value for JSON;
+    `prometheus()` renders the text exposition format.
+    '''
+
+    def __init__(self):
+        self.counters = defaultdict(int)
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        with self._lock:
+            self.counters[name, tuple(labels.items())] += value
+
+    def observe(self, name: str, value: float, buckets: tuple = latency_buckets, **labels) -> None:
+        key = name, tuple(labels.items())
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def instrument(self, fn):
+        '''Wrap a tool coroutine to count and time its calls and attribute its upstream work to it'''
+        tool = fn.__name__
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            token = current_tool.set(tool)
+            start = time.perf_counter()
+            outcome = 'error'
+            try:
+                result = await fn(*args, **kwargs)
+                outcome = 'ok'
+                return result
+            finally:
+                current_tool.reset(token)
+                self.observe('tool_duration_seconds', time.perf_counter() - start, tool=tool)
+                self.inc('tool_calls_total', tool=tool, outcome=outcome)
+
+        return wrapper
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            series = [*self.counters.items(), *((key, histogram.snapshot()) for key, histogram in self.histograms.items())]
+        result = {}
+        for (name, labels), value in sorted(series, key=lambda item: item[0]):
+            node = result.setdefault(name, {})
+            for _, label in labels[:-1]:
+                node = node.setdefault(label, {})
+            node[labels[-1][1] if labels else ''] = value
+        return result
+
+    def prometheus(self, namespace: str = 'us_real_estate') -> str:
+        with self._lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted((key, (histogram.buckets, list(histogram.counts), histogram.sum, histogram.count))
+                                for key, histogram in self.histograms.items())
+        lines = []
+        typed = set()
+        for (name, labels), value in counters:
+            name = f'{namespace}_{name}'
+            if name not in typed:
+                typed.add(name)
+                lines.append(f'# TYPE {name} counter')
+            lines.append(f'{name}{_labels(labels)} {value}')
+        for (name, labels), (buckets, counts, total, count) in histograms:
+            name = f'{namespace}_{name}'
+            if name not in typed:
+                typed.add(name)
+                lines.append(f'# TYPE {name} histogram')
+            cumulative = 0
+            for bound, bucket_count in zip((*buckets, '+Inf'), counts):
+                cumulative += bucket_count
+                le = str(float(bound)) if bound != '+Inf' else bound
+                lines.append(f'{name}_bucket{_labels(labels + (("le", le),))} {cumulative}')
+            lines.append(f'{name}_sum{_labels(labels)} {total}')
+            lines.append(f'{name}_count{_labels(labels)} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(labels: tuple) -> str:
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in labels)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(labels, escaped)) + '}'
+
+
+def prometheus_gauges(name: str, stats: dict, namespace: str = 'us_real_estate') -> str:
+    '''Render the numeric entries of a `stats()` dict as gauges named `<namespace>_<name>_<key>`'''
+    lines = []
+    for key, value in stats.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            lines.append(f'# TYPE {namespace}_{name}_{key} gauge')
+            lines.append(f'{namespace}_{name}_{key} {value}')
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+class RequestTrace:
+    '''httpx `trace` extension hook recording when each connection and HTTP step starts and completes.
+
+    `phases()` gives seconds spent connecting (DNS resolution included, as
+    httpcore doesn't report it separately), in the TLS handshake, waiting for
+    the first response byte after sending, and downloading the body. Steps
+    skipped on a reused keep-alive connection are absent.
+    '''
+
+    spans = {
+        'connect': ('connect_tcp.started', 'connect_tcp.complete'),
+        'tls': ('start_tls.started', 'start_tls.complete'),
+        'ttfb': ('send_request_headers.started', 'receive_response_headers.complete'),
+        'download': ('receive_response_body.started', 'receive_response_body.complete'),
+    }
+
+    def __init__(self):
+        self.marks = {}
+
+    async def __call__(self, event: str, info: dict) -> None:
+        self.marks[event.split('.', 1)[1]] = time.perf_counter()
+
+    def phases(self) -> dict:
+        return {phase: self.marks[end] - self.marks[start] for phase, (start, end) in self.spans.items()
+                if start in self.marks and end in self.marks}
+
+
+class MetricsExporter:
+    '''Serves `render()` as Prometheus text on `/metrics` from a background thread'''
+
+    def __init__(self, port: int, render, host: str = '127.0.0.1'):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+
+    def start(self) -> 'MetricsExporter':
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,225 @@
+'''Local stand-in for the us-real-estate RapidAPI upstream.
+
+Replays responses recorded from the real API and synthesizes deterministic
+listings for searches that weren't recorded, with configurable latency, error
+rate and 429 injection. Point the server at it with RAPID_API_BASE_URL.
+
+Usage:
+    python mockupstream.py [--port 8765] [--fixtures FILE] [--latency 0.05] [--error-rate 0.01] [--throttle-rate 0.01]
+    python mockupstream.py --record FILE    # proxy to RapidAPI with RAPID_API_KEY, appending responses to FILE
+'''
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Union
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+
+from cache import make_key
+
+upstream_url = 'https://us-real-estate.p.rapidapi.com'
+
+search_paths = frozenset({
+    '/v3/for-sale', '/v2/for-sale', '/v2/for-sale-by-zipcode', '/for-sale', '/v2/sold-homes-by-zipcode', '/sold-homes',
+    '/v2/for-rent', '/v2/for-rent-by-zipcode', '/for-rent',
+})
+count_paths = frozenset({'/v2/for-sale-result-count', '/v2/for-rent-result-count'})
+detail_paths = frozenset({'/v3/property-detail', '/v2/property-detail', '/property-detail'})
+
+
+def _price(index: int) -> int:
+    return 100000 + (index * 7919) % 900000
+
+
+def _beds(index: int) -> int:
+    return 1 + index % 5
+
+
+def synthetic_listing(index: int, status: str = 'for_sale') -> dict:
+    '''A deterministic listing in the v3 search layout; the same index always gives the same listing'''
+    listing = {
+        'property_id': str(1000000000 + index),
+        'listing_id': str(2000000000 + index),
+        'status': status,
+        'list_price': _price(index),
+        'list_date': f'2024-{1 + index % 12:02d}-{1 + index % 28:02d}T00:00:00Z',
+        'description': {'type': 'single_family', 'beds': _beds(index), 'baths': 1 + index % 3,
+                        'sqft': 700 + (index * 37) % 3300, 'lot_sqft': 2000 + (index * 53) % 8000},
+        'location': {'address': {
+            'line': f'{100 + index} Main St', 'city': 'Springfield', 'state_code': 'IL',
+            'postal_code': str(62701 + index % 10),
+            'coordinate': {'lat': round(39.70 + (index % 97) / 1000, 6), 'lon': round(-89.70 + (index % 89) / 1000, 6)},
+        }},
+        'primary_photo': {'href': f'https://ap.rdcpix.com/{index}/photo-0.jpg'},
+        'photos': [{'href': f'https://ap.rdcpix.com/{index}/photo-{n}.jpg', 'tags': [{'label': 'house_view'}]} for n in range(4)],
+        'href': f'https://www.realtor.com/realestateandhomes-detail/M{1000000000 + index}',
+    }
+    if status == 'sold':
+        listing['last_sold_price'] = round(listing['list_price'] * 0.97)
+        listing['last_sold_date'] = f'2023-{1 + index % 12:02d}-{1 + index % 28:02d}'
+    return listing
+
+
+class MockUpstream:
+    '''Threaded HTTP server answering upstream paths from recorded fixtures or synthetic data.
+
+    Fixtures are JSON lines of `{"key", "status", "body"}`, keyed by the path
+    and canonical query the way the server's cache keys requests. Each request
+    first sleeps `latency` seconds (plus up to `jitter`), then fails with a 429
+    with probability `throttle_rate` or a 503 with probability `error_rate`.
+    With `record_to` set, unknown requests are proxied to RapidAPI and saved.
+    '''
+
+    def __init__(self, port: int = 0, fixtures: Union[str, None] = None, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, throttle_rate: float = 0.0, retry_after: float = 1.0,
+                 listings: int = 2000, record_to: Union[str, None] = None, seed: Union[int, None] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.listings = listings
+        self.record_to = record_to
+        self.random = random.Random(seed)
+        self.counts = Counter()
+        self.recorded = {}
+        self._lock = threading.Lock()
+        self._upstream = None
+        for path in filter(None, (fixtures, record_to)):
+            if os.path.exists(path):
+                self.load(path)
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), type('Handler', (_Handler,), {'mock': self}))
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.httpd.server_address[1]}'
+
+    def load(self, path: str) -> None:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self.recorded[entry['key']] = (entry.get('status', 200), entry['body'])
+
+    def start(self) -> 'MockUpstream':
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def stats(self) -> dict:
+        return dict(self.counts)
+
+    def respond(self, path: str, params: dict) -> tuple:
+        '''`(status, headers, body)` for one request, after latency and fault injection'''
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+        with self._lock:
+            self.counts['requests'] += 1
+            roll = self.random.random()
+        if roll < self.throttle_rate:
+            self.counts['throttled'] += 1
+            return 429, {'Retry-After': f'{self.retry_after:g}'}, {'message': 'You have exceeded the rate limit per second for your plan'}
+        if roll < self.throttle_rate + self.error_rate:
+            self.counts['errors'] += 1
+            return 503, {}, {'message': 'Service Unavailable'}
+        key = make_key(path, params)
+        if key in self.recorded:
+            self.counts['replayed'] += 1
+            status, body = self.recorded[key]
+            return status, {}, body
+        if self.record_to:
+            self.counts['recorded'] += 1
+            return self.record(key, path, params)
+        self.counts['synthesized'] += 1
+        return 200, {}, self.synthesize(path, params)
+
+    def record(self, key: str, path: str, params: dict) -> tuple:
+        if self._upstream is None:
+            self._upstream = httpx.Client(headers={'x-rapidapi-host': 'us-real-estate.p.rapidapi.com',
+                                                   'x-rapidapi-key': os.getenv('RAPID_API_KEY') or ''}, timeout=30)
+        response = self._upstream.get(f'{upstream_url}{path}', params=params)
+        body = response.json()
+        if response.is_success:
+            with self._lock:
+                self.recorded[key] = (response.status_code, body)
+                with open(self.record_to, 'a') as f:
+                    f.write(json.dumps({'key': key, 'status': response.status_code, 'body': body}) + '\n')
+        return response.status_code, {}, body
+
+    def synthesize(self, path: str, params: dict) -> dict:
+        if path in search_paths or path in count_paths:
+            status = 'sold' if 'sold' in path else 'for_rent' if 'rent' in path else 'for_sale'
+            price_min = float(params.get('price_min', 0))
+            price_max = float(params.get('price_max', float('inf')))
+            beds_min = float(params.get('beds_min', 0))
+            matches = [index for index in range(self.listings)
+                       if price_min <= _price(index) <= price_max and _beds(index) >= beds_min]
+            if path in count_paths:
+                return {'status': 200, 'data': {'total': len(matches)}}
+            offset = int(params.get('offset', 0))
+            limit = int(params.get('limit', 42))
+            results = [synthetic_listing(index, status) for index in matches[offset:offset + limit]]
+            return {'status': 200, 'data': {'home_search': {'total': len(matches), 'count': len(results), 'results': results}}}
+        if path in detail_paths:
+            index = int(params.get('property_id', 1000000000)) - 1000000000
+            return {'status': 200, 'data': synthetic_listing(index)}
+        return {'status': 200, 'data': {}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    mock = None
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        status, headers, body = self.mock.respond(url.path, dict(parse_qsl(url.query, keep_blank_values=True)))
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--fixtures', help='JSON lines file of recorded responses to replay')
+    parser.add_argument('--record', help='Proxy unknown requests to RapidAPI and append them to this file')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Up to this many extra seconds, uniformly random')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 503')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After seconds sent with a 429')
+    parser.add_argument('--listings', type=int, default=2000, help='Size of the synthetic listing set')
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args()
+    mock = MockUpstream(args.port, args.fixtures, args.latency, args.jitter, args.error_rate, args.throttle_rate,
+                        args.retry_after, args.listings, args.record, args.seed)
+    print(f'Serving on {mock.url}; run the server with RAPID_API_BASE_URL={mock.url}')
+    try:
+        mock.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(json.dumps(mock.stats()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+from typing import List, Union
+
+# NumPy is imported by the first vectorized call rather than with the module;
+# the scalar `calculate` never needs it.
+np = None
+
+
+def _require_numpy() -> None:
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError('numpy is required for vectorized mortgage calculations') from None
+        np = numpy
+
+
+def _principal_and_interest(loan: float, percent_rate: float, year_term: float) -> float:
+    months = year_term * 12
+    rate = percent_rate / 1200
+    if rate == 0:
+        return loan / months
+    return loan * rate / (1 - (1 + rate) ** -months)
+
+
+def amortization_schedule(loan: float, percent_rate: float, year_term: float) -> List[dict]:
+    '''Month-by-month split of the fixed payment into principal and interest'''
+    payment = _principal_and_interest(loan, percent_rate, year_term)
+    rate = percent_rate / 1200
+    balance = loan
+    schedule = []
+    for month in range(1, int(round(year_term * 12)) + 1):
+        interest = balance * rate
+        principal = min(payment - interest, balance)
+        balance -= principal
+        schedule.append({
+            'month': month,
+            'year': (month - 1) // 12 + 1,
+            'principal': round(principal, 2),
+            'interest': round(interest, 2),
+            'total_payment': round(principal + interest, 2),
+            'remaining_balance': round(max(balance, 0.0), 2),
+        })
+    return schedule
+
+
+def calculate(price: float, down_payment: float, percent_rate: float, year_term: float, percent_tax_rate: float,
+              monthly_home_insurance: float, hoa_fees: float, show_amortization: bool = False) -> dict:
+    '''Monthly cost of a fixed-rate mortgage, in the `finance/mortgage-calculate` response layout'''
+    if year_term <= 0:
+        raise ValueError(f'year_term must be greater than 0, got {year_term}')
+    loan = price - down_payment
+    principal_and_interest = _principal_and_interest(loan, percent_rate, year_term)
+    monthly_property_taxes = price * percent_tax_rate / 100 / 12
+    monthly_payment = principal_and_interest + monthly_property_taxes + monthly_home_insurance + hoa_fees
+    total_principal_and_interest = principal_and_interest * year_term * 12
+    mortgage = {
+        'loan_amount': round(loan, 2),
+        'rate': percent_rate,
+        'term': year_term,
+        'monthly_payment': round(monthly_payment, 2),
+        'principal_and_interest': round(principal_and_interest, 2),
+        'monthly_property_taxes': round(monthly_property_taxes, 2),
+        'monthly_home_insurance': round(monthly_home_insurance, 2),
+        'hoa_fees': round(hoa_fees, 2),
+        'total_interest': round(total_principal_and_interest - loan, 2),
+        'total_payment': round(total_principal_and_interest, 2),
+    }
+    if show_amortization:
+        mortgage['amortization_schedule'] = amortization_schedule(loan, percent_rate, year_term)
+    return {'status': 200, 'data': {'mortgage': mortgage}}
+
+
+def calculate_many(price, down_payment, percent_rate, year_term, percent_tax_rate,
+                   monthly_home_insurance, hoa_fees) -> dict:
+    '''Vectorized `calculate` without the schedule: every argument may be a scalar or an
+    array, and they broadcast against each other. Returns a dict of NumPy arrays.'''
+    _require_numpy()
+    price, down_payment, percent_rate, year_term, percent_tax_rate, monthly_home_insurance, hoa_fees = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in
+          (price, down_payment, percent_rate, year_term, percent_tax_rate, monthly_home_insurance, hoa_fees)))
+    invalid = ~(year_term > 0)
+    if invalid.any():
+        raise ValueError(f'year_term must be greater than 0, got {year_term[invalid].flat[0]:g}')
+    loan = price - down_payment
+    months = year_term * 12
+    rate = percent_rate / 1200
+    with np.errstate(divide='ignore', invalid='ignore'):
+        amortized = loan * rate / (1 - (1 + rate) ** -months)
+        principal_and_interest = np.where(rate == 0, loan / months, amortized)
+    monthly_property_taxes = price * percent_tax_rate / 100 / 12
+    total_payment = principal_and_interest * months
+    return {
+        'loan_amount': loan,
+        'monthly_payment': principal_and_interest + monthly_property_taxes + monthly_home_insurance + hoa_fees,
+        'principal_and_interest': principal_and_interest,
+        'monthly_property_taxes': monthly_property_taxes,
+        'total_interest': total_payment - loan,
+        'total_payment': total_payment,
+    }
+
+
+def scenario_grid(price: float, down_payments: List[float], percent_rates: List[float], year_terms: List[float],
+                  percent_tax_rate: float, monthly_home_insurance: float, hoa_fees: float) -> List[dict]:
+    '''Evaluate every (down payment, rate, term) combination in one vectorized pass'''
+    _require_numpy()
+    down, rate, term = np.meshgrid(np.asarray(down_payments, dtype=float), np.asarray(percent_rates, dtype=float),
+                                   np.asarray(year_terms, dtype=float), indexing='ij')
+    results = calculate_many(price, down.ravel(), rate.ravel(), term.ravel(), percent_tax_rate, monthly_home_insurance, hoa_fees)
+    columns = {'down_payment': down.ravel(), 'percent_rate': rate.ravel(), 'year_term': term.ravel(),
+               **{name: np.round(values, 2) for name, values in results.items()}}
+    return [dict(zip(columns, row)) for row in zip(*(column.tolist() for column in columns.values()))]
+
+
+def affordability(prices, hoa_fees, down_payment_percent: float, percent_rate: float, year_term: float,
+                  percent_tax_rate: float, monthly_home_insurance: float, monthly_income: Union[float, None] = None,
+                  monthly_debts: float = 0, front_end_limit: float = 0.28, back_end_limit: float = 0.36) -> dict:
+    '''Payments for many listing prices at once, plus debt-to-income ratios when `monthly_income` is given'''
+    _require_numpy()
+    prices = np.asarray(prices, dtype=float)
+    results = calculate_many(prices, prices * down_payment_percent / 100, percent_rate, year_term,
+                             percent_tax_rate, monthly_home_insurance, hoa_fees)
+    if monthly_income:
+        results['front_end_ratio'] = results['monthly_payment'] / monthly_income
+        results['back_end_ratio'] = (results['monthly_payment'] + monthly_debts) / monthly_income
+        results['affordable'] = (results['front_end_ratio'] <= front_end_limit) & (results['back_end_ratio'] <= back_end_limit)
+    return results
@@ -0,0 +1,157 @@
+from typing import Callable, List, Tuple, Union
+
+# Named field selections. Paths are dotted; lists along the way are walked
+# element by element, and `*` matches every key of an object.
+search_summary = [
+    'status',
+    'data.home_search.total',
+    'data.home_search.count',
+    'data.home_search.results.property_id',
+    'data.home_search.results.listing_id',
+    'data.home_search.results.status',
+    'data.home_search.results.list_price',
+    'data.home_search.results.list_date',
+    'data.home_search.results.price_reduced_amount',
+    'data.home_search.results.description.type',
+    'data.home_search.results.description.beds',
+    'data.home_search.results.description.baths',
+    'data.home_search.results.description.sqft',
+    'data.home_search.results.description.lot_sqft',
+    'data.home_search.results.location.address.line',
+    'data.home_search.results.location.address.city',
+    'data.home_search.results.location.address.state_code',
+    'data.home_search.results.location.address.postal_code',
+    'data.home_search.results.location.address.coordinate',
+    'data.home_search.results.primary_photo.href',
+    'data.home_search.results.href',
+]
+
+# The fields of one search result kept by the local listing store: the search
+# summary, plus the sale and HOA fields comps and affordability read.
+listing_summary = [path[len('data.home_search.results.'):] for path in search_summary if path.startswith('data.home_search.results.')] + [
+    'last_sold_price',
+    'last_sold_date',
+    'description.sold_price',
+    'description.sold_date',
+    'description.baths_consolidated',
+    'hoa.fee',
+]
+
+detail_summary = [
+    'status',
+    'data.property_id',
+    'data.listing_id',
+    'data.status',
+    'data.list_price',
+    'data.list_date',
+    'data.last_sold_price',
+    'data.last_sold_date',
+    'data.description.type',
+    'data.description.beds',
+    'data.description.baths',
+    'data.description.sqft',
+    'data.description.lot_sqft',
+    'data.description.year_built',
+    'data.location.address',
+    'data.hoa',
+    'data.href',
+]
+
+presets = {
+    'summary': search_summary + detail_summary[1:],
+    'search_summary': search_summary,
+    'detail_summary': detail_summary,
+    'no_media': ['-data.home_search.results.photos', '-data.home_search.results.virtual_tours',
+                 '-data.photos', '-data.virtual_tours', '-data.matterport'],
+}
+
+
+def _tree(paths: List[str]) -> dict:
+    tree = {}
+    for path in paths:
+        node = tree
+        parts = path.split('.')
+        for part in parts[:-1]:
+            child = node.setdefault(part, {})
+            if child is True:
+                break
+            node = child
+        else:
+            node[parts[-1]] = True
+    return tree
+
+
+def _include(value, tree: Union[dict, bool]):
+    if tree is True:
+        return value
+    if isinstance(value, list):
+        return [_include(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    result = {}
+    for key, item in value.items():
+        subtree = tree.get(key, tree.get('*'))
+        if subtree is not None:
+            result[key] = _include(item, subtree)
+    return result
+
+
+def _exclude(value, tree: dict):
+    if isinstance(value, list):
+        return [_exclude(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    result = {}
+    for key, item in value.items():
+        subtree = tree.get(key, tree.get('*'))
+        if subtree is True:
+            continue
+        result[key] = _exclude(item, subtree) if subtree is not None else item
+    return result
+
+
+def resolve_fields(fields: Union[str, List[str], None]) -> List[str]:
+    '''Expand preset names in a field selection into their paths'''
+    if fields is None:
+        return []
+    if isinstance(fields, str):
+        fields = [fields]
+    paths = []
+    for field in fields:
+        paths.extend(presets.get(field, [field]))
+    return paths
+
+
+def projector(fields: Union[str, List[str], None]) -> Callable:
+    '''Compile a field selection into a function projecting one document, for applying it many times'''
+    paths = resolve_fields(fields)
+    includes = _tree([path for path in paths if not path.startswith('-')])
+    excludes = _tree([path[1:] for path in paths if path.startswith('-')])
+
+    def select(document):
+        if includes:
+            document = _include(document, includes)
+        if excludes:
+            document = _exclude(document, excludes)
+        return document
+    return select
+
+
+def project(document, fields: Union[str, List[str], None]):
+    '''Keep only the selected fields of a response. `-path` entries are removed instead;
+    with only removals, everything else is kept.'''
+    return projector(fields)(document)
+
+
+def project_item(item, path: Tuple[str, ...], select: Callable):
+    '''Apply a `projector` to one element of the list found at `path` (object keys from the root) the
+    way it applies inside the whole document; None when the selection drops that list.'''
+    document = [item]
+    for key in reversed(path):
+        document = {key: document}
+    document = select(document)
+    for key in path:
+        if not isinstance(document, dict) or key not in document:
+            return None
+        document = document[key]
+    return document[0] if document else None
@@ -0,0 +1,204 @@
+import asyncio
+import random
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Union
+
+
+class QuotaExceeded(Exception):
+    '''Raised instead of calling upstream once the RapidAPI quota budget is spent'''
+
+
+class TokenBucket:
+    '''Async token bucket: `rate` tokens per second, holding at most `burst`. Waiters are served in FIFO order.'''
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.acquired = 0
+        self.waited = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            start = time.monotonic()
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    self.acquired += 1
+                    self.waited += now - start
+                    return
+                await asyncio.sleep(max(self.blocked_until - now, (1 - self.tokens) / self.rate))
+
+    def pause(self, seconds: float) -> None:
+        '''Hand out no tokens for `seconds`, e.g. after upstream answered 429'''
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+
+class RateLimiter:
+    '''Token buckets per API key, plus per (key, endpoint) for endpoints listed in `endpoint_limits`.
+
+    `endpoint_limits` maps an endpoint path to `(rate, burst)`. A `rate` of 0
+    disables the per-key bucket.
+    '''
+
+    def __init__(self, rate: float, burst: float, endpoint_limits: Union[Mapping[str, tuple], None] = None):
+        self.rate = rate
+        self.burst = burst
+        self.endpoint_limits = dict(endpoint_limits or {})
+        self._buckets = {}
+
+    def _bucket(self, scope: tuple, rate: float, burst: float) -> TokenBucket:
+        bucket = self._buckets.get(scope)
+        if bucket is None:
+            bucket = self._buckets[scope] = TokenBucket(rate, burst)
+        return bucket
+
+    async def acquire(self, key: str, endpoint: str) -> None:
+        if self.rate > 0:
+            await self._bucket((key,), self.rate, self.burst).acquire()
+        if endpoint in self.endpoint_limits:
+            await self._bucket((key, endpoint), *self.endpoint_limits[endpoint]).acquire()
+
+    def pause(self, key: str, seconds: float) -> None:
+        if self.rate > 0:
+            self._bucket((key,), self.rate, self.burst).pause(seconds)
+
+    def stats(self) -> dict:
+        return {
+            '/'.join(scope[1:]) or 'key': {'acquired': bucket.acquired, 'waited_seconds': bucket.waited, 'tokens': bucket.tokens}
+            for scope, bucket in self._buckets.items()
+        }
+
+
+def parse_endpoint_limits(text: str) -> dict:
+    '''Parse comma-separated `path:rate:burst` entries into `endpoint_limits` for RateLimiter'''
+    limits = {}
+    for entry in filter(None, (part.strip() for part in text.split(','))):
+        try:
+            path, rate, burst = entry.split(':')
+            limit = float(rate), float(burst)
+        except ValueError:
+            raise ValueError(f'Invalid endpoint rate limit {entry!r}, expected path:rate:burst') from None
+        if not path.startswith('/') or limit[0] <= 0 or limit[1] < 1:
+            raise ValueError(f'Invalid endpoint rate limit {entry!r}: the path starts with /, rate > 0, burst >= 1')
+        limits[path] = limit
+    return limits
+
+
+class QuotaBudget:
+    '''Tracks the RapidAPI plan quota from `x-ratelimit-requests-*` response headers.
+
+    Calls are refused once the remaining quota falls to `reserve`, or once
+    `daily_budget` upstream calls (if set) have been made this UTC day. Each
+    call's cost comes off `remaining` as it is let through, so concurrent calls
+    can't all spend the same last units before a response reports the new count.
+    '''
+
+    def __init__(self, reserve: int = 0, daily_budget: Union[int, None] = None):
+        self.reserve = reserve
+        self.daily_budget = daily_budget
+        self.limit = None
+        self.remaining = None
+        self.resets_at = None
+        self.day = None
+        self.used_today = 0
+        self.refused = 0
+
+    def check(self, cost: int = 1) -> None:
+        '''Reserve `cost` requests of quota for an upstream call, or raise QuotaExceeded'''
+        today = datetime.now(timezone.utc).date()
+        if self.day != today:
+            self.day, self.used_today = today, 0
+        if self.resets_at is not None and time.time() >= self.resets_at:
+            self.remaining = self.resets_at = None
+        if self.remaining is not None and self.remaining - cost < self.reserve:
+            self.refused += 1
+            raise QuotaExceeded(f'RapidAPI quota exhausted ({self.remaining} requests left, reserve {self.reserve})')
+        if self.daily_budget is not None and self.used_today + cost > self.daily_budget:
+            self.refused += 1
+            raise QuotaExceeded(f'Daily request budget of {self.daily_budget} spent')
+        self.used_today += cost
+        if self.remaining is not None:
+            self.remaining -= cost
+
+    def record(self, headers: Mapping[str, str]) -> None:
+        limit = headers.get('x-ratelimit-requests-limit')
+        remaining = headers.get('x-ratelimit-requests-remaining')
+        reset = headers.get('x-ratelimit-requests-reset')
+        if limit is not None and limit.isdigit():
+            self.limit = int(limit)
+        if remaining is not None and remaining.lstrip('-').isdigit():
+            self.remaining = int(remaining)
+        if reset is not None and reset.isdigit():
+            self.resets_at = time.time() + int(reset)
+
+    def stats(self) -> dict:
+        return {
+            'limit': self.limit,
+            'remaining': self.remaining,
+            'resets_in_seconds': max(0.0, self.resets_at - time.time()) if self.resets_at is not None else None,
+            'reserve': self.reserve,
+            'daily_budget': self.daily_budget,
+            'used_today': self.used_today,
+            'refused': self.refused,
+        }
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Union[float, None]:
+    '''Parse a `Retry-After` header given either as seconds or as an HTTP date'''
+    value = headers.get('retry-after')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    '''Capped exponential backoff with full jitter, bounded by a per-call deadline.
+
+    An upstream `Retry-After` replaces the computed delay. A retry is skipped if
+    its delay would end past the deadline, so a call never runs much longer
+    than `deadline` seconds.
+    '''
+
+    retry_statuses = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.25, max_delay: float = 4.0, deadline: float = 30.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retries = Counter()
+        self.exhausted = Counter()
+
+    def delay(self, attempt: int, retry_after: Union[float, None] = None) -> float:
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def allows(self, endpoint: str, attempt: int, delay: float, deadline: float) -> bool:
+        '''Whether another attempt fits; counts the retry or the give-up against `endpoint`'''
+        if attempt + 1 < self.max_attempts and time.monotonic() + delay < deadline:
+            self.retries[endpoint] += 1
+            return True
+        self.exhausted[endpoint] += 1
+        return False
+
+    def stats(self) -> dict:
+        return {'retries': dict(self.retries), 'exhausted': dict(self.exhausted)}
@@ -1,1114 +1,934 @@
-import requests
-from datetime import datetime
+import httpx
+from datetime import datetime, timezone
 from typing import Union, Literal, List
-from mcp.server import FastMCP
 from pydantic import Field
 from typing import Annotated
-from mcp.server.fastmcp import FastMCP
-from fastmcp import FastMCP, Context
+from fastmcp import FastMCP
 import os
+import json
+import asyncio
+import codecs
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from dotenv import load_dotenv
+import mortgage
+from metrics import Metrics, MetricsExporter, RequestTrace, current_tool, prometheus_gauges, size_buckets
+from endpoints import Endpoint, Pipeline, make_tool, registry
+from listings import ListingStore, SavedSearch, comparable_sales, listing_row
+from cache import DiskCache, ResponseCache, SingleFlight, make_key
+from projection import project, project_item, projector
+from jsonstream import ArrayStream
+from toolschemas import ToolSchemas, default_path as default_schema_path
+from ratelimit import QuotaBudget, RateLimiter, RetryPolicy, parse_endpoint_limits, retry_after_seconds
 load_dotenv()
 rapid_api_key = os.getenv("RAPID_API_KEY")
 
 __rapidapi_url__ = 'https://rapidapi.com/datascraper/api/us-real-estate'
 
-mcp = FastMCP('us-real-estate')
-
-@mcp.tool()
-def v3_property_detail(property_id: Annotated[str, Field(description='')]) -> dict: 
-    '''Get property detail data by `property_id`'''
-    url = 'https://us-real-estate.p.rapidapi.com/v3/property-detail'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'property_id': property_id,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def v2_property_detail(property_id: Annotated[Union[int, float], Field(description='Default: 3199790641')]) -> dict: 
-    '''Get property detail data by `property_id` V2'''
-    url = 'https://us-real-estate.p.rapidapi.com/v2/property-detail'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'property_id': property_id,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def property_detail(property_id: Annotated[str, Field(description='')]) -> dict: 
-    '''Get property detail data by `property_id`'''
-    url = 'https://us-real-estate.p.rapidapi.com/property-detail'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'property_id': property_id,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def property_by_mls_id(mls_id: Annotated[str, Field(description='')]) -> dict: 
-    '''Search properties by MLS ID'''
-    url = 'https://us-real-estate.p.rapidapi.com/property-by-mls-id'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'mls_id': mls_id,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def keywords_search_suggest(keyword_text: Annotated[str, Field(description='')],
-                            limit: Annotated[Union[int, float, None], Field(description='Default: 10')] = None) -> dict: 
-    '''Get keyword search suggestion for `keyword_seach` parameters in `/for-sale` endpoint'''
-    url = 'https://us-real-estate.p.rapidapi.com/keywords-search-suggest'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'keyword_text': keyword_text,
-        'limit': limit,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def location_suggest(input: Annotated[str, Field(description='Part of location name')]) -> dict: 
-    '''Get location suggestion / autocomplete **Required Parameter**: `input` **Optional Parameter**:'''
-    url = 'https://us-real-estate.p.rapidapi.com/location/suggest'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'input': input,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def location_for_sale_nearby_areas(area_type: Annotated[str, Field(description='One of the following options: city|neighborhood')],
-                                   city: Annotated[Union[str, None], Field(description='')] = None,
-                                   neighborhood: Annotated[Union[str, None], Field(description='')] = None,
-                                   postal_code: Annotated[Union[str, None], Field(description='')] = None,
-                                   state_code: Annotated[Union[str, None], Field(description='')] = None) -> dict: 
-    '''Get nearby areas for **include_nearby_areas_slug_id** parameter in **/for-sale** endpoint. Get by (area_type="city" & city & state_code) or by (area_type="neighborhood" & city & state_code & neighborhood) or by (area_type="postal_code" & postal_code)'''
-    url = 'https://us-real-estate.p.rapidapi.com/location/for-sale-nearby-areas'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'area_type': area_type,
-        'city': city,
-        'neighborhood': neighborhood,
-        'postal_code': postal_code,
-        'state_code': state_code,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def location_for_sale_nearby_areas_by_postal_code(postal_code: Annotated[str, Field(description='')]) -> dict: 
-    '''Get nearby areas by `postal_code` for **include_nearby_areas_slug_id** parameter in **/for-sale** endpoint.'''
-    url = 'https://us-real-estate.p.rapidapi.com/location/for-sale-nearby-areas-by-postal-code'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'postal_code': postal_code,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def location_for_rent_nearby_areas(area_type: Annotated[str, Field(description='One of the following options: city|postal_code|neighborhood')],
-                                   city: Annotated[Union[str, None], Field(description='')] = None,
-                                   neighborhood: Annotated[Union[str, None], Field(description='')] = None,
-                                   state_code: Annotated[Union[str, None], Field(description='')] = None,
-                                   postal_code: Annotated[Union[int, float, None], Field(description='Default: 14218')] = None) -> dict: 
-    '''Get nearby areas for **include_nearby_areas_slug_id** parameter in **/for-rent**. Get by (area_type="city" & city & state_code) or by (area_type="neighborhood" & city & state_code & neighborhood) or by (area_type="postal_code" & postal_code)'''
-    url = 'https://us-real-estate.p.rapidapi.com/location/for-rent-nearby-areas'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'area_type': area_type,
-        'city': city,
-        'neighborhood': neighborhood,
-        'state_code': state_code,
-        'postal_code': postal_code,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def location_schools(postal_code: Annotated[Union[int, float, None], Field(description='Default: 14218')] = None,
-                     city: Annotated[Union[str, None], Field(description='')] = None,
-                     state_code: Annotated[Union[str, None], Field(description='')] = None,
-                     neighborhood: Annotated[Union[str, None], Field(description='')] = None) -> dict: 
-    '''Get schools near a location by (**state_code & city**) or by (**state_code & city & neighborhood**) or by **postal_code**'''
-    url = 'https://us-real-estate.p.rapidapi.com/location/schools'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'postal_code': postal_code,
-        'city': city,
-        'state_code': state_code,
-        'neighborhood': neighborhood,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def location_commute_time(origins: Annotated[str, Field(description='Origin location: address, city+state_code, neighborhood, postal_code, etc')],
-                          destinations: Annotated[str, Field(description='Destination location: address, city+state_code, neighborhood, postal_code, etc')],
-                          mode: Annotated[str, Field(description='One of the following options: driving|walking|bicycling|transit')]) -> dict: 
-    '''Get commute time from origins to destinations with one of following mode: walking|driving|bicycling|transit'''
-    url = 'https://us-real-estate.p.rapidapi.com/location/commute-time'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'origins': origins,
-        'destinations': destinations,
-        'mode': mode,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def location_noise_score(longitude: Annotated[Union[int, float], Field(description='Default: -73.95471')],
-                         latitude: Annotated[Union[int, float], Field(description='Default: 40.769135')]) -> dict: 
-    '''Get location noise score by (**latitude & longitude**)'''
-    url = 'https://us-real-estate.p.rapidapi.com/location/noise-score'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'longitude': longitude,
-        'latitude': latitude,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def v3_for_sale(state_code: Annotated[str, Field(description='State Code. Get from /location/suggest response')],
-                city: Annotated[Union[str, None], Field(description='City name. Get data from /location/suggest response')] = None,
-                sort: Annotated[Union[str, None], Field(description='One of the following options: relevant|newest|lowest_price|highest_price|open_house_date|price_reduced_date|largest_sqft|lot_size|sold_date. Default is newest')] = None,
-                offset: Annotated[Union[int, float, None], Field(description='Offset results, default 0. Maximum 9800. Default: 0')] = None,
-                limit: Annotated[Union[int, float, None], Field(description='Number of results. Maximum 200 for Paid Plan, default 42 Default: 42')] = None,
-                location: Annotated[Union[str, None], Field(description='Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank')] = None,
-                price_min: Annotated[Union[str, None], Field(description='Minimum list price in USD')] = None,
-                price_max: Annotated[Union[str, None], Field(description='Maximum list price in USD')] = None,
-                beds_min: Annotated[Union[str, None], Field(description='Minimum bedrooms')] = None,
-                beds_max: Annotated[Union[str, None], Field(description='Maximum bedrooms')] = None,
-                baths_min: Annotated[Union[str, None], Field(description='Minimum bathrooms')] = None,
-                baths_max: Annotated[Union[str, None], Field(description='Maximum bathrooms')] = None,
-                property_type: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: multi_family|single_family|mobile|land|farm')] = None,
-                property_type_nyc_only: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: condo|coop|condop. For NYC listings only')] = None,
-                new_construction: Annotated[Union[str, None], Field(description='true for New construction only. Leave blank for any')] = None,
-                hide_pending_contingent: Annotated[Union[str, None], Field(description='true for hide pending/contingent. Leave blank for any')] = None,
-                has_virtual_tours: Annotated[Union[str, None], Field(description='true for properties with virtual tour only. Leave blank for any')] = None,
-                has_3d_tours: Annotated[Union[str, None], Field(description='true for properties with 3D tour only. Leave blank for any')] = None,
-                hide_foreclosure: Annotated[Union[str, None], Field(description='true for hide foreclosure. Leave blank for any')] = None,
-                price_reduced: Annotated[Union[str, None], Field(description='true for properties with price reduced only. Leave blank for any')] = None,
-                open_house: Annotated[Union[str, None], Field(description='true for properties with open house only. Leave blank for any')] = None,
-                keywords: Annotated[Union[str, None], Field(description='Comma separated values. Get popular keywords from /keywords-search-suggest response')] = None,
-                no_hoa_fee: Annotated[Union[str, None], Field(description='true for properties without HOA fee only. Leave blank for any')] = None,
-                hoa_max: Annotated[Union[str, None], Field(description='Maximum HOA fee in USD')] = None,
-                days_on_realtor: Annotated[Union[str, None], Field(description='One of the following options: today|7|14|21|30')] = None,
-                expand_search_radius: Annotated[Union[str, None], Field(description='One of the following options: 1|5|10|25|50. Expand search by radius in miles')] = None,
-                include_nearby_areas_slug_id: Annotated[Union[str, None], Field(description='Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-sale-nearby-areas')] = None,
-                home_size_min: Annotated[Union[str, None], Field(description='One of the following options: 750|1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500. Minimum home size in sqft')] = None,
-                home_size_max: Annotated[Union[str, None], Field(description='One of the following options: 1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500|10000. Maximum home size in sqft')] = None,
-                lot_size_min: Annotated[Union[str, None], Field(description='One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Minimum lot size in sqft')] = None,
-                lot_size_max: Annotated[Union[str, None], Field(description='One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Maximum lot size in sqft')] = None,
-                home_age_max: Annotated[Union[str, None], Field(description='Maximum home age')] = None,
-                stories: Annotated[Union[str, None], Field(description='One of the following options: single|multi')] = None,
-                garage: Annotated[Union[str, None], Field(description='One of the following options: 1+|2+|3+')] = None,
-                heating_cooling: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: central_air|central_heat|forced_air')] = None,
-                inside_rooms: Annotated[Union[str, None], Field(description='Comma separated values. One or more comma separated from following options: basement|hardwood_floors|fireplace|disability_features|den_or_office|family_room|dining_room')] = None,
-                outside_features: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: swimming_pool|spa_or_hot_tub|horse_facilities')] = None,
-                lot_views: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: waterfront|cul_de_sac|corner_lot|golf_course_lot_or_frontage|hill_or_mountain_view|ocean_view|lake_view|river_view')] = None,
-                community_ammenities: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: community_swimming_pool|community_spa_or_hot_tub|community_golf|community_security_features|community_boat_facilities|tennis_court|community_clubhouse|senior_community')] = None,
-                features_in_nyc_only: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: furniture|dishwasher|community_doorman|pets_allowed|laundry_room|elevator|community_outdoor_space')] = None) -> dict: 
-    '''Search for-sale properties. **Parameters**: ` **state_code**,city, location, sort, limit, offset, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, property_type_nyc_only, new_construction, hide_pending_contingent, has_virtual_tours, has_3d_tours, hide_foreclosure, price_reduced, open_house, keywords, no_hoa_fee, hoa_max, days_on_realtor, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, lot_size_min, lot_size_max, home_age_max, stories, garage, heating_cooling, inside_rooms, outside_features, lot_views, community_ammenities, features_in_nyc_only`'''
-    url = 'https://us-real-estate.p.rapidapi.com/v3/for-sale'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'state_code': state_code,
-        'city': city,
-        'sort': sort,
-        'offset': offset,
-        'limit': limit,
-        'location': location,
-        'price_min': price_min,
-        'price_max': price_max,
-        'beds_min': beds_min,
-        'beds_max': beds_max,
-        'baths_min': baths_min,
-        'baths_max': baths_max,
-        'property_type': property_type,
-        'property_type_nyc_only': property_type_nyc_only,
-        'new_construction': new_construction,
-        'hide_pending_contingent': hide_pending_contingent,
-        'has_virtual_tours': has_virtual_tours,
-        'has_3d_tours': has_3d_tours,
-        'hide_foreclosure': hide_foreclosure,
-        'price_reduced': price_reduced,
-        'open_house': open_house,
-        'keywords': keywords,
-        'no_hoa_fee': no_hoa_fee,
-        'hoa_max': hoa_max,
-        'days_on_realtor': days_on_realtor,
-        'expand_search_radius': expand_search_radius,
-        'include_nearby_areas_slug_id': include_nearby_areas_slug_id,
-        'home_size_min': home_size_min,
-        'home_size_max': home_size_max,
-        'lot_size_min': lot_size_min,
-        'lot_size_max': lot_size_max,
-        'home_age_max': home_age_max,
-        'stories': stories,
-        'garage': garage,
-        'heating_cooling': heating_cooling,
-        'inside_rooms': inside_rooms,
-        'outside_features': outside_features,
-        'lot_views': lot_views,
-        'community_ammenities': community_ammenities,
-        'features_in_nyc_only': features_in_nyc_only,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def v2_for_sale(offset: Annotated[Union[int, float], Field(description='Offset results, default 0. Maximum 9800. Default: 0')],
-                limit: Annotated[Union[int, float], Field(description='Number of results. Maximum 200 for Paid Plan, default 42 Default: 42')],
-                state_code: Annotated[str, Field(description='State Code. Get from /location/suggest response')],
-                city: Annotated[str, Field(description='City name. Get data from /location/suggest response')],
-                location: Annotated[Union[str, None], Field(description='Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank')] = None,
-                sort: Annotated[Union[str, None], Field(description='One of the following options: relevant|newest|lowest_price|highest_price|open_house_date|price_reduced_date|largest_sqft|lot_size|sold_date. Default is relevant')] = None,
-                price_min: Annotated[Union[str, None], Field(description='Minimum list price in USD')] = None,
-                price_max: Annotated[Union[str, None], Field(description='Maximum list price in USD')] = None,
-                beds_min: Annotated[Union[str, None], Field(description='Minimum bedrooms')] = None,
-                beds_max: Annotated[Union[str, None], Field(description='Maximum bedrooms')] = None,
-                baths_min: Annotated[Union[str, None], Field(description='Minimum bathrooms')] = None,
-                baths_max: Annotated[Union[str, None], Field(description='Maximum bathrooms')] = None,
-                property_type: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: multi_family|single_family|mobile|land|farm')] = None,
-                property_type_nyc_only: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: condo|coop|condop. For NYC listings only')] = None,
-                new_construction: Annotated[Union[str, None], Field(description='true for New construction only. Leave blank for any')] = None,
-                hide_pending_contingent: Annotated[Union[str, None], Field(description='true for hide pending/contingent. Leave blank for any')] = None,
-                has_virtual_tours: Annotated[Union[str, None], Field(description='true for properties with virtual tour only. Leave blank for any')] = None,
-                has_3d_tours: Annotated[Union[str, None], Field(description='true for properties with 3D tour only. Leave blank for any')] = None,
-                hide_foreclosure: Annotated[Union[str, None], Field(description='true for hide foreclosure. Leave blank for any')] = None,
-                price_reduced: Annotated[Union[str, None], Field(description='true for properties with price reduced only. Leave blank for any')] = None,
-                open_house: Annotated[Union[str, None], Field(description='true for properties with open house only. Leave blank for any')] = None,
-                keywords: Annotated[Union[str, None], Field(description='Comma separated values. Get popular keywords from /keywords-search-suggest response')] = None,
-                no_hoa_fee: Annotated[Union[str, None], Field(description='true for properties without HOA fee only. Leave blank for any')] = None,
-                hoa_max: Annotated[Union[str, None], Field(description='Maximum HOA fee in USD')] = None,
-                days_on_realtor: Annotated[Union[str, None], Field(description='One of the following options: today|7|14|21|30')] = None,
-                expand_search_radius: Annotated[Union[str, None], Field(description='One of the following options: 1|5|10|25|50. Expand search by radius in miles')] = None,
-                include_nearby_areas_slug_id: Annotated[Union[str, None], Field(description='Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-sale-nearby-areas')] = None,
-                home_size_min: Annotated[Union[str, None], Field(description='One of the following options: 750|1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500. Minimum home size in sqft')] = None,
-                home_size_max: Annotated[Union[str, None], Field(description='One of the following options: 1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500|10000. Maximum home size in sqft')] = None,
-                lot_size_min: Annotated[Union[str, None], Field(description='One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Minimum lot size in sqft')] = None,
-                lot_size_max: Annotated[Union[str, None], Field(description='One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Maximum lot size in sqft')] = None,
-                home_age_max: Annotated[Union[str, None], Field(description='Maximum home age')] = None,
-                stories: Annotated[Union[str, None], Field(description='One of the following options: single|multi')] = None,
-                garage: Annotated[Union[str, None], Field(description='One of the following options: 1+|2+|3+')] = None,
-                heating_cooling: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: central_air|central_heat|forced_air')] = None,
-                inside_rooms: Annotated[Union[str, None], Field(description='Comma separated values. One or more comma separated from following options: basement|hardwood_floors|fireplace|disability_features|den_or_office|family_room|dining_room')] = None,
-                outside_features: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: swimming_pool|spa_or_hot_tub|horse_facilities')] = None,
-                lot_views: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: waterfront|cul_de_sac|corner_lot|golf_course_lot_or_frontage|hill_or_mountain_view|ocean_view|lake_view|river_view')] = None,
-                community_ammenities: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: community_swimming_pool|community_spa_or_hot_tub|community_golf|community_security_features|community_boat_facilities|tennis_court|community_clubhouse|senior_community')] = None,
-                features_in_nyc_only: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: furniture|dishwasher|community_doorman|pets_allowed|laundry_room|elevator|community_outdoor_space')] = None) -> dict: 
-    '''Search for-sale properties. **Parameters**: `city, state_code, location, limit, offset, sort:newest price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, property_type_nyc_only, new_construction, hide_pending_contingent, has_virtual_tours, has_3d_tours, hide_foreclosure, price_reduced, open_house, keywords, no_hoa_fee, hoa_max, days_on_realtor, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, lot_size_min, lot_size_max, home_age_max, stories, garage, heating_cooling, inside_rooms, outside_features, lot_views, community_ammenities, features_in_nyc_only`'''
-    url = 'https://us-real-estate.p.rapidapi.com/v2/for-sale'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'offset': offset,
-        'limit': limit,
-        'state_code': state_code,
-        'city': city,
-        'location': location,
-        'sort': sort,
-        'price_min': price_min,
-        'price_max': price_max,
-        'beds_min': beds_min,
-        'beds_max': beds_max,
-        'baths_min': baths_min,
-        'baths_max': baths_max,
-        'property_type': property_type,
-        'property_type_nyc_only': property_type_nyc_only,
-        'new_construction': new_construction,
-        'hide_pending_contingent': hide_pending_contingent,
-        'has_virtual_tours': has_virtual_tours,
-        'has_3d_tours': has_3d_tours,
-        'hide_foreclosure': hide_foreclosure,
-        'price_reduced': price_reduced,
-        'open_house': open_house,
-        'keywords': keywords,
-        'no_hoa_fee': no_hoa_fee,
-        'hoa_max': hoa_max,
-        'days_on_realtor': days_on_realtor,
-        'expand_search_radius': expand_search_radius,
-        'include_nearby_areas_slug_id': include_nearby_areas_slug_id,
-        'home_size_min': home_size_min,
-        'home_size_max': home_size_max,
-        'lot_size_min': lot_size_min,
-        'lot_size_max': lot_size_max,
-        'home_age_max': home_age_max,
-        'stories': stories,
-        'garage': garage,
-        'heating_cooling': heating_cooling,
-        'inside_rooms': inside_rooms,
-        'outside_features': outside_features,
-        'lot_views': lot_views,
-        'community_ammenities': community_ammenities,
-        'features_in_nyc_only': features_in_nyc_only,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def v2_for_sale_by_zipcode(zipcode: Annotated[str, Field(description='zipcode')],
-                           offset: Annotated[Union[int, float, None], Field(description='Offset results, default 0. Maximum 9800. Default: 0')] = None,
-                           limit: Annotated[Union[int, float, None], Field(description='Number of results. Maximum 200 for Paid Plan, default 42 Default: 42')] = None,
-                           sort: Annotated[Union[str, None], Field(description='One of the following options: relevant|newest|lowest_price|highest_price|open_house_date|price_reduced_date|largest_sqft|lot_size|sold_date. Default is relevant')] = None,
-                           price_min: Annotated[Union[str, None], Field(description='Minimum list price in USD')] = None,
-                           price_max: Annotated[Union[str, None], Field(description='Maximum list price in USD')] = None,
-                           beds_min: Annotated[Union[str, None], Field(description='Minimum bedrooms')] = None,
-                           beds_max: Annotated[Union[str, None], Field(description='Maximum bedrooms')] = None,
-                           baths_min: Annotated[Union[str, None], Field(description='Minimum bathrooms')] = None,
-                           baths_max: Annotated[Union[str, None], Field(description='Maximum bathrooms')] = None,
-                           property_type: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: multi_family|single_family|mobile|land|farm')] = None,
-                           property_type_nyc_only: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: condo|coop|condop. For NYC listings only')] = None,
-                           new_construction: Annotated[Union[str, None], Field(description='true for New construction only. Leave blank for any')] = None,
-                           hide_pending_contingent: Annotated[Union[str, None], Field(description='true for hide pending/contingent. Leave blank for any')] = None,
-                           has_virtual_tours: Annotated[Union[str, None], Field(description='true for properties with virtual tour only. Leave blank for any')] = None,
-                           has_3d_tours: Annotated[Union[str, None], Field(description='true for properties with 3D tour only. Leave blank for any')] = None,
-                           hide_foreclosure: Annotated[Union[str, None], Field(description='true for hide foreclosure. Leave blank for any')] = None,
-                           price_reduced: Annotated[Union[str, None], Field(description='true for properties with price reduced only. Leave blank for any')] = None,
-                           open_house: Annotated[Union[str, None], Field(description='true for properties with open house only. Leave blank for any')] = None,
-                           keywords: Annotated[Union[str, None], Field(description='Comma separated values. Get popular keywords from /keywords-search-suggest response')] = None,
-                           no_hoa_fee: Annotated[Union[str, None], Field(description='true for properties without HOA fee only. Leave blank for any')] = None,
-                           hoa_max: Annotated[Union[str, None], Field(description='Maximum HOA fee in USD')] = None,
-                           days_on_realtor: Annotated[Union[str, None], Field(description='One of the following options: today|7|14|21|30')] = None,
-                           expand_search_radius: Annotated[Union[str, None], Field(description='One of the following options: 1|5|10|25|50. Expand search by radius in miles')] = None,
-                           include_nearby_areas_slug_id: Annotated[Union[str, None], Field(description='Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-sale-nearby-areas')] = None,
-                           home_size_min: Annotated[Union[str, None], Field(description='One of the following options: 750|1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500. Minimum home size in sqft')] = None,
-                           home_size_max: Annotated[Union[str, None], Field(description='One of the following options: 1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500|10000. Maximum home size in sqft')] = None,
-                           lot_size_min: Annotated[Union[str, None], Field(description='One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Minimum lot size in sqft')] = None,
-                           lot_size_max: Annotated[Union[str, None], Field(description='One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Maximum lot size in sqft')] = None,
-                           home_age_max: Annotated[Union[str, None], Field(description='Maximum home age')] = None,
-                           stories: Annotated[Union[str, None], Field(description='One of the following options: single|multi')] = None,
-                           garage: Annotated[Union[str, None], Field(description='One of the following options: 1+|2+|3+')] = None,
-                           heating_cooling: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: central_air|central_heat|forced_air')] = None,
-                           inside_rooms: Annotated[Union[str, None], Field(description='Comma separated values. One or more comma separated from following options: basement|hardwood_floors|fireplace|disability_features|den_or_office|family_room|dining_room')] = None,
-                           outside_features: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: swimming_pool|spa_or_hot_tub|horse_facilities')] = None,
-                           lot_views: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: waterfront|cul_de_sac|corner_lot|golf_course_lot_or_frontage|hill_or_mountain_view|ocean_view|lake_view|river_view')] = None,
-                           community_ammenities: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: community_swimming_pool|community_spa_or_hot_tub|community_golf|community_security_features|community_boat_facilities|tennis_court|community_clubhouse|senior_community')] = None,
-                           features_in_nyc_only: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: furniture|dishwasher|community_doorman|pets_allowed|laundry_room|elevator|community_outdoor_space')] = None) -> dict: 
-    '''Search for-sale properties. **Parameters**: `zipcode, limit, offset, sort:newest price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, property_type_nyc_only, new_construction, hide_pending_contingent, has_virtual_tours, has_3d_tours, hide_foreclosure, price_reduced, open_house, keywords, no_hoa_fee, hoa_max, days_on_realtor, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, lot_size_min, lot_size_max, home_age_max, stories, garage, heating_cooling, inside_rooms, outside_features, lot_views, community_ammenities, features_in_nyc_only`'''
-    url = 'https://us-real-estate.p.rapidapi.com/v2/for-sale-by-zipcode'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'zipcode': zipcode,
-        'offset': offset,
-        'limit': limit,
-        'sort': sort,
-        'price_min': price_min,
-        'price_max': price_max,
-        'beds_min': beds_min,
-        'beds_max': beds_max,
-        'baths_min': baths_min,
-        'baths_max': baths_max,
-        'property_type': property_type,
-        'property_type_nyc_only': property_type_nyc_only,
-        'new_construction': new_construction,
-        'hide_pending_contingent': hide_pending_contingent,
-        'has_virtual_tours': has_virtual_tours,
-        'has_3d_tours': has_3d_tours,
-        'hide_foreclosure': hide_foreclosure,
-        'price_reduced': price_reduced,
-        'open_house': open_house,
-        'keywords': keywords,
-        'no_hoa_fee': no_hoa_fee,
-        'hoa_max': hoa_max,
-        'days_on_realtor': days_on_realtor,
-        'expand_search_radius': expand_search_radius,
-        'include_nearby_areas_slug_id': include_nearby_areas_slug_id,
-        'home_size_min': home_size_min,
-        'home_size_max': home_size_max,
-        'lot_size_min': lot_size_min,
-        'lot_size_max': lot_size_max,
-        'home_age_max': home_age_max,
-        'stories': stories,
-        'garage': garage,
-        'heating_cooling': heating_cooling,
-        'inside_rooms': inside_rooms,
-        'outside_features': outside_features,
-        'lot_views': lot_views,
-        'community_ammenities': community_ammenities,
-        'features_in_nyc_only': features_in_nyc_only,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def v2_for_sale_result_count(state_code: Annotated[str, Field(description='State Code. Get from /location/suggest response')],
-                             city: Annotated[str, Field(description='City name. Get data from /location/suggest response')],
-                             location: Annotated[Union[str, None], Field(description='Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank')] = None,
-                             price_min: Annotated[Union[str, None], Field(description='Minimum list price in USD')] = None,
-                             price_max: Annotated[Union[str, None], Field(description='Maximum list price in USD')] = None,
-                             beds_min: Annotated[Union[str, None], Field(description='Minimum bedrooms')] = None,
-                             beds_max: Annotated[Union[str, None], Field(description='Maximum bedrooms')] = None,
-                             baths_min: Annotated[Union[str, None], Field(description='Minimum bathrooms')] = None,
-                             baths_max: Annotated[Union[str, None], Field(description='Maximum bathrooms')] = None,
-                             property_type_nyc_only: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: condo|coop|condop. For NYC listings only')] = None,
-                             new_construction: Annotated[Union[str, None], Field(description='true for New construction only. Leave blank for any')] = None,
-                             hide_pending_contingent: Annotated[Union[str, None], Field(description='true for hide pending/contingent. Leave blank for any')] = None,
-                             has_virtual_tours: Annotated[Union[str, None], Field(description='true for properties with virtual tour only. Leave blank for any')] = None,
-                             has_3d_tours: Annotated[Union[str, None], Field(description='true for properties with 3D tour only. Leave blank for any')] = None,
-                             hide_foreclosure: Annotated[Union[str, None], Field(description='true for hide foreclosure. Leave blank for any')] = None,
-                             price_reduced: Annotated[Union[str, None], Field(description='true for properties with price reduced only. Leave blank for any')] = None,
-                             open_house: Annotated[Union[str, None], Field(description='true for properties with open house only. Leave blank for any')] = None,
-                             keywords: Annotated[Union[str, None], Field(description='Comma separated values. Get popular keywords from /keywords-search-suggest response')] = None,
-                             no_hoa_fee: Annotated[Union[str, None], Field(description='true for properties without HOA fee only. Leave blank for any')] = None,
-                             hoa_max: Annotated[Union[str, None], Field(description='Maximum HOA fee in USD')] = None,
-                             days_on_realtor: Annotated[Union[str, None], Field(description='One of the following options: today|7|14|21|30')] = None,
-                             expand_search_radius: Annotated[Union[str, None], Field(description='One of the following options: 1|5|10|25|50. Expand search by radius in miles')] = None,
-                             include_nearby_areas_slug_id: Annotated[Union[str, None], Field(description='Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-sale-nearby-areas')] = None,
-                             home_size_min: Annotated[Union[str, None], Field(description='One of the following options: 750|1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500. Minimum home size in sqft')] = None,
-                             home_size_max: Annotated[Union[str, None], Field(description='One of the following options: 1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500|10000. Maximum home size in sqft')] = None,
-                             lot_size_min: Annotated[Union[str, None], Field(description='One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Minimum lot size in sqft')] = None,
-                             lot_size_max: Annotated[Union[str, None], Field(description='One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Maximum lot size in sqft')] = None,
-                             home_age_max: Annotated[Union[str, None], Field(description='Maximum home age')] = None,
-                             stories: Annotated[Union[str, None], Field(description='One of the following options: single|multi')] = None,
-                             garage: Annotated[Union[str, None], Field(description='One of the following options: 1+|2+|3+')] = None,
-                             heating_cooling: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: central_air|central_heat|forced_air')] = None,
-                             inside_rooms: Annotated[Union[str, None], Field(description='Comma separated values. One or more comma separated from following options: basement|hardwood_floors|fireplace|disability_features|den_or_office|family_room|dining_room')] = None,
-                             outside_features: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: swimming_pool|spa_or_hot_tub|horse_facilities')] = None,
-                             lot_views: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: waterfront|cul_de_sac|corner_lot|golf_course_lot_or_frontage|hill_or_mountain_view|ocean_view|lake_view|river_view')] = None,
-                             community_ammenities: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: community_swimming_pool|community_spa_or_hot_tub|community_golf|community_security_features|community_boat_facilities|tennis_court|community_clubhouse|senior_community')] = None,
-                             features_in_nyc_only: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: furniture|dishwasher|community_doorman|pets_allowed|laundry_room|elevator|community_outdoor_space')] = None) -> dict: 
-    '''Get for-sale search result count. **Parameters**: `city, state_code, location, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, property_type_nyc_only, new_construction, hide_pending_contingent, has_virtual_tours, has_3d_tours, hide_foreclosure, price_reduced, open_house, keywords, no_hoa_fee, hoa_max, days_on_realtor, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, lot_size_min, lot_size_max, home_age_max, stories, garage, heating_cooling, inside_rooms, outside_features, lot_views, community_ammenities, features_in_nyc_only`'''
-    url = 'https://us-real-estate.p.rapidapi.com/v2/for-sale-result-count'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'state_code': state_code,
-        'city': city,
-        'location': location,
-        'price_min': price_min,
-        'price_max': price_max,
-        'beds_min': beds_min,
-        'beds_max': beds_max,
-        'baths_min': baths_min,
-        'baths_max': baths_max,
-        'property_type_nyc_only': property_type_nyc_only,
-        'new_construction': new_construction,
-        'hide_pending_contingent': hide_pending_contingent,
-        'has_virtual_tours': has_virtual_tours,
-        'has_3d_tours': has_3d_tours,
-        'hide_foreclosure': hide_foreclosure,
-        'price_reduced': price_reduced,
-        'open_house': open_house,
-        'keywords': keywords,
-        'no_hoa_fee': no_hoa_fee,
-        'hoa_max': hoa_max,
-        'days_on_realtor': days_on_realtor,
-        'expand_search_radius': expand_search_radius,
-        'include_nearby_areas_slug_id': include_nearby_areas_slug_id,
-        'home_size_min': home_size_min,
-        'home_size_max': home_size_max,
-        'lot_size_min': lot_size_min,
-        'lot_size_max': lot_size_max,
-        'home_age_max': home_age_max,
-        'stories': stories,
-        'garage': garage,
-        'heating_cooling': heating_cooling,
-        'inside_rooms': inside_rooms,
-        'outside_features': outside_features,
-        'lot_views': lot_views,
-        'community_ammenities': community_ammenities,
-        'features_in_nyc_only': features_in_nyc_only,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def for_sale(offset: Annotated[Union[int, float], Field(description='Offset results, default 0. Maximum 9800. Default: 0')],
-             limit: Annotated[Union[int, float], Field(description='Number of results. Maximum 200 for Paid Plan, default 42 Default: 42')],
-             state_code: Annotated[str, Field(description='State Code. Get from /location/suggest response')],
-             city: Annotated[str, Field(description='City name. Get data from /location/suggest response')],
-             location: Annotated[Union[str, None], Field(description='Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank')] = None,
-             sort: Annotated[Union[str, None], Field(description='One of the following options: relevant|newest|lowest_price|highest_price|open_house_date|price_reduced_date|largest_sqft|lot_size|sold_date. Default is relevant')] = None,
-             price_min: Annotated[Union[str, None], Field(description='Minimum list price in USD')] = None,
-             price_max: Annotated[Union[str, None], Field(description='Maximum list price in USD')] = None,
-             beds_min: Annotated[Union[str, None], Field(description='Minimum bedrooms')] = None,
-             beds_max: Annotated[Union[str, None], Field(description='Maximum bedrooms')] = None,
-             baths_min: Annotated[Union[str, None], Field(description='Minimum bathrooms')] = None,
-             baths_max: Annotated[Union[str, None], Field(description='Maximum bathrooms')] = None,
-             property_type: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: multi_family|single_family|mobile|land|farm')] = None,
-             property_type_nyc_only: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: condo|coop|condop. For NYC listings only')] = None,
-             new_construction: Annotated[Union[str, None], Field(description='true for New construction only. Leave blank for any')] = None,
-             hide_pending_contingent: Annotated[Union[str, None], Field(description='true for hide pending/contingent. Leave blank for any')] = None,
-             has_virtual_tours: Annotated[Union[str, None], Field(description='true for properties with virtual tour only. Leave blank for any')] = None,
-             has_3d_tours: Annotated[Union[str, None], Field(description='true for properties with 3D tour only. Leave blank for any')] = None,
-             hide_foreclosure: Annotated[Union[str, None], Field(description='true for hide foreclosure. Leave blank for any')] = None,
-             price_reduced: Annotated[Union[str, None], Field(description='true for properties with price reduced only. Leave blank for any')] = None,
-             open_house: Annotated[Union[str, None], Field(description='true for properties with open house only. Leave blank for any')] = None,
-             keywords: Annotated[Union[str, None], Field(description='Comma separated values. Get popular keywords from /keywords-search-suggest response')] = None,
-             no_hoa_fee: Annotated[Union[str, None], Field(description='true for properties without HOA fee only. Leave blank for any')] = None,
-             hoa_max: Annotated[Union[str, None], Field(description='Maximum HOA fee in USD')] = None,
-             days_on_realtor: Annotated[Union[str, None], Field(description='One of the following options: today|7|14|21|30')] = None,
-             expand_search_radius: Annotated[Union[str, None], Field(description='One of the following options: 1|5|10|25|50. Expand search by radius in miles')] = None,
-             include_nearby_areas_slug_id: Annotated[Union[str, None], Field(description='Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-sale-nearby-areas')] = None,
-             home_size_min: Annotated[Union[str, None], Field(description='One of the following options: 750|1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500. Minimum home size in sqft')] = None,
-             home_size_max: Annotated[Union[str, None], Field(description='One of the following options: 1000|1250|1500|1750|2000|2250|2500|2750|3000|3250|3500|3750|5000|7500|10000. Maximum home size in sqft')] = None,
-             lot_size_min: Annotated[Union[str, None], Field(description='One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Minimum lot size in sqft')] = None,
-             lot_size_max: Annotated[Union[str, None], Field(description='One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Maximum lot size in sqft')] = None,
-             home_age_max: Annotated[Union[str, None], Field(description='Maximum home age')] = None,
-             stories: Annotated[Union[str, None], Field(description='One of the following options: single|multi')] = None,
-             garage: Annotated[Union[str, None], Field(description='One of the following options: 1+|2+|3+')] = None,
-             heating_cooling: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: central_air|central_heat|forced_air')] = None,
-             inside_rooms: Annotated[Union[str, None], Field(description='Comma separated values. One or more comma separated from following options: basement|hardwood_floors|fireplace|disability_features|den_or_office|family_room|dining_room')] = None,
-             outside_features: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: swimming_pool|spa_or_hot_tub|horse_facilities')] = None,
-             lot_views: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: waterfront|cul_de_sac|corner_lot|golf_course_lot_or_frontage|hill_or_mountain_view|ocean_view|lake_view|river_view')] = None,
-             community_ammenities: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: community_swimming_pool|community_spa_or_hot_tub|community_golf|community_security_features|community_boat_facilities|tennis_court|community_clubhouse|senior_community')] = None,
-             features_in_nyc_only: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: furniture|dishwasher|community_doorman|pets_allowed|laundry_room|elevator|community_outdoor_space')] = None) -> dict: 
-    '''Search for-sale properties. **Parameters**: `city, state_code, location, limit, offset, sort:newest price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, property_type_nyc_only, new_construction, hide_pending_contingent, has_virtual_tours, has_3d_tours, hide_foreclosure, price_reduced, open_house, keywords, no_hoa_fee, hoa_max, days_on_realtor, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, lot_size_min, lot_size_max, home_age_max, stories, garage, heating_cooling, inside_rooms, outside_features, lot_views, community_ammenities, features_in_nyc_only`'''
-    url = 'https://us-real-estate.p.rapidapi.com/for-sale'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'offset': offset,
-        'limit': limit,
-        'state_code': state_code,
-        'city': city,
-        'location': location,
-        'sort': sort,
-        'price_min': price_min,
-        'price_max': price_max,
-        'beds_min': beds_min,
-        'beds_max': beds_max,
-        'baths_min': baths_min,
-        'baths_max': baths_max,
-        'property_type': property_type,
-        'property_type_nyc_only': property_type_nyc_only,
-        'new_construction': new_construction,
-        'hide_pending_contingent': hide_pending_contingent,
-        'has_virtual_tours': has_virtual_tours,
-        'has_3d_tours': has_3d_tours,
-        'hide_foreclosure': hide_foreclosure,
-        'price_reduced': price_reduced,
-        'open_house': open_house,
-        'keywords': keywords,
-        'no_hoa_fee': no_hoa_fee,
-        'hoa_max': hoa_max,
-        'days_on_realtor': days_on_realtor,
-        'expand_search_radius': expand_search_radius,
-        'include_nearby_areas_slug_id': include_nearby_areas_slug_id,
-        'home_size_min': home_size_min,
-        'home_size_max': home_size_max,
-        'lot_size_min': lot_size_min,
-        'lot_size_max': lot_size_max,
-        'home_age_max': home_age_max,
-        'stories': stories,
-        'garage': garage,
-        'heating_cooling': heating_cooling,
-        'inside_rooms': inside_rooms,
-        'outside_features': outside_features,
-        'lot_views': lot_views,
-        'community_ammenities': community_ammenities,
-        'features_in_nyc_only': features_in_nyc_only,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def for_sale_similiar_homes(property_id: Annotated[Union[int, float], Field(description='Default: 8624316600')]) -> dict: 
-    '''Get similiar homes by `property_id`'''
-    url = 'https://us-real-estate.p.rapidapi.com/for-sale/similiar-homes'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'property_id': property_id,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def for_sale_other_homes_in_building(property_id: Annotated[Union[int, float], Field(description='Default: 9626941405')]) -> dict: 
-    '''Get other homes in same building by `property_id`'''
-    url = 'https://us-real-estate.p.rapidapi.com/for-sale/other-homes-in-building'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'property_id': property_id,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def for_sale_home_estimate_value(property_id: Annotated[Union[int, float], Field(description='Default: 2061530895')]) -> dict: 
-    '''Get home estimate and historical values'''
-    url = 'https://us-real-estate.p.rapidapi.com/for-sale/home-estimate-value'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'property_id': property_id,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def v2_sold_homes_by_zipcode(zipcode: Annotated[Union[int, float], Field(description='zipcode Default: 37932')],
-                             offset: Annotated[Union[int, float, None], Field(description='Offset results, default 0 Default: 0')] = None,
-                             sort: Annotated[Union[str, None], Field(description='One of the following options: sold_date | lowest_price | highest_price | lot_size | number_of_beds. Default is sold_date')] = None,
-                             max_sold_days: Annotated[Union[int, float, None], Field(description='Maximum sold days form now')] = None,
-                             price_max: Annotated[Union[int, float, None], Field(description='Maximum list price in USD Default: 0')] = None,
-                             beds_min: Annotated[Union[int, float, None], Field(description='Minimum bedrooms Default: 0')] = None,
-                             beds_max: Annotated[Union[int, float, None], Field(description='Maximum bedrooms Default: 0')] = None,
-                             baths_min: Annotated[Union[int, float, None], Field(description='Minimum bathrooms Default: 0')] = None,
-                             baths_max: Annotated[Union[int, float, None], Field(description='Maximum bathrooms Default: 0')] = None,
-                             property_type: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: multi_family|single_family|mobile|land|farm')] = None,
-                             expand_search_radius: Annotated[Union[int, float, None], Field(description='One of the following options: 1|5|10|25|50 Default: 0')] = None,
-                             include_nearby_areas_slug_id: Annotated[Union[str, None], Field(description='Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-rent-nearby-areas')] = None,
-                             home_size_min: Annotated[Union[int, float, None], Field(description='One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 0')] = None,
-                             home_size_max: Annotated[Union[int, float, None], Field(description='One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 0')] = None,
-                             lot_size_min: Annotated[Union[str, None], Field(description='One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Minimum lot size in sqft')] = None,
-                             lot_size_max: Annotated[Union[str, None], Field(description='One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Maximum lot size in sqft')] = None,
-                             home_age_max: Annotated[Union[str, None], Field(description='Maximum home age')] = None) -> dict: 
-    '''Search for-sale properties. **Parameters**: `zipcode, limit, offset, sort, max_sold_days, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, lot_size_min, lot_size_max, home_age_max`'''
-    url = 'https://us-real-estate.p.rapidapi.com/v2/sold-homes-by-zipcode'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'zipcode': zipcode,
-        'offset': offset,
-        'sort': sort,
-        'max_sold_days': max_sold_days,
-        'price_max': price_max,
-        'beds_min': beds_min,
-        'beds_max': beds_max,
-        'baths_min': baths_min,
-        'baths_max': baths_max,
-        'property_type': property_type,
-        'expand_search_radius': expand_search_radius,
-        'include_nearby_areas_slug_id': include_nearby_areas_slug_id,
-        'home_size_min': home_size_min,
-        'home_size_max': home_size_max,
-        'lot_size_min': lot_size_min,
-        'lot_size_max': lot_size_max,
-        'home_age_max': home_age_max,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def sold_homes(state_code: Annotated[str, Field(description='State Code. Get from /location/suggest response')],
-               city: Annotated[str, Field(description='City name. Get data from /location/suggest response')],
-               location: Annotated[Union[int, float, None], Field(description='Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank Default: 0')] = None,
-               limit: Annotated[Union[int, float, None], Field(description='Number of results. Maximum 200 for Paid Plan, default 42 Default: 10')] = None,
-               offset: Annotated[Union[int, float, None], Field(description='Offset results, default 0 Default: 0')] = None,
-               sort: Annotated[Union[str, None], Field(description='One of the following options: sold_date | lowest_price | highest_price | lot_size | number_of_beds. Default is sold_date')] = None,
-               max_sold_days: Annotated[Union[int, float, None], Field(description='Maximum sold days form now')] = None,
-               price_min: Annotated[Union[int, float, None], Field(description='Minimum list price in USD Default: 0')] = None,
-               price_max: Annotated[Union[int, float, None], Field(description='Maximum list price in USD Default: 0')] = None,
-               beds_min: Annotated[Union[int, float, None], Field(description='Minimum bedrooms Default: 0')] = None,
-               beds_max: Annotated[Union[int, float, None], Field(description='Maximum bedrooms Default: 0')] = None,
-               baths_min: Annotated[Union[int, float, None], Field(description='Minimum bathrooms Default: 0')] = None,
-               baths_max: Annotated[Union[int, float, None], Field(description='Maximum bathrooms Default: 0')] = None,
-               property_type: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: multi_family|single_family|mobile|land|farm')] = None,
-               expand_search_radius: Annotated[Union[int, float, None], Field(description='One of the following options: 1|5|10|25|50 Default: 0')] = None,
-               include_nearby_areas_slug_id: Annotated[Union[str, None], Field(description='Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-rent-nearby-areas')] = None,
-               home_size_min: Annotated[Union[int, float, None], Field(description='One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 0')] = None,
-               home_size_max: Annotated[Union[int, float, None], Field(description='One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 0')] = None,
-               lot_size_min: Annotated[Union[str, None], Field(description='One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Minimum lot size in sqft')] = None,
-               lot_size_max: Annotated[Union[str, None], Field(description='One of the following options: 2000|300|4000|5000|7500|10890|21780|43560|87120|217800|435600|653400|871200. Maximum lot size in sqft')] = None,
-               home_age_max: Annotated[Union[str, None], Field(description='Maximum home age')] = None) -> dict: 
-    '''Search for-sale properties. **Parameters**: `city, state_code, location, limit, offset, sort, max_sold_days, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, lot_size_min, lot_size_max, home_age_max`'''
-    url = 'https://us-real-estate.p.rapidapi.com/sold-homes'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'state_code': state_code,
-        'city': city,
-        'location': location,
-        'limit': limit,
-        'offset': offset,
-        'sort': sort,
-        'max_sold_days': max_sold_days,
-        'price_min': price_min,
-        'price_max': price_max,
-        'beds_min': beds_min,
-        'beds_max': beds_max,
-        'baths_min': baths_min,
-        'baths_max': baths_max,
-        'property_type': property_type,
-        'expand_search_radius': expand_search_radius,
-        'include_nearby_areas_slug_id': include_nearby_areas_slug_id,
-        'home_size_min': home_size_min,
-        'home_size_max': home_size_max,
-        'lot_size_min': lot_size_min,
-        'lot_size_max': lot_size_max,
-        'home_age_max': home_age_max,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def v2_for_rent(city: Annotated[str, Field(description='City name. Get data from /location/suggest response')],
-                state_code: Annotated[str, Field(description='State Code. Get from /location/suggest response')],
-                location: Annotated[Union[int, float, None], Field(description='Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank Default: 48278')] = None,
-                limit: Annotated[Union[int, float, None], Field(description='Number of results. Maximum 200 for Paid Plan, default 42 Default: 10')] = None,
-                offset: Annotated[Union[int, float, None], Field(description='Offset results, default 0. Maximum 9800. Default: 0')] = None,
-                sort: Annotated[Union[str, None], Field(description='One of the following options: frehsnest|recently_added_update|lowest_price|highest_price. Default is frehsnest')] = None,
-                price_min: Annotated[Union[int, float, None], Field(description='Minimum list price in USD Default: 1000')] = None,
-                price_max: Annotated[Union[int, float, None], Field(description='Maximum list price in USD Default: 3000')] = None,
-                beds_min: Annotated[Union[int, float, None], Field(description='Minimum bedrooms Default: 1')] = None,
-                beds_max: Annotated[Union[int, float, None], Field(description='Maximum bedrooms Default: 5')] = None,
-                baths_min: Annotated[Union[int, float, None], Field(description='Minimum bathrooms Default: 1')] = None,
-                baths_max: Annotated[Union[int, float, None], Field(description='Maximum bathrooms Default: 5')] = None,
-                property_type: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: townhome,coop,single_family,apartment,condo,condop')] = None,
-                expand_search_radius: Annotated[Union[int, float, None], Field(description='One of the following options: 1|5|10|25|50 Default: 25')] = None,
-                include_nearby_areas_slug_id: Annotated[Union[str, None], Field(description='Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-rent-nearby-areas')] = None,
-                home_size_min: Annotated[Union[int, float, None], Field(description='One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 500')] = None,
-                home_size_max: Annotated[Union[int, float, None], Field(description='One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 3000')] = None,
-                in_unit_features: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: central_air|dishwasher|washer_dryer|furnished')] = None,
-                community_ammenities: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: garage_1_or_more|swimming_pool|community_doorman|community_outdoor_space|community_elevator|laundry_room|community_gym')] = None,
-                cats_ok: Annotated[Union[bool, None], Field(description='true for Cats allowed only')] = None,
-                dogs_ok: Annotated[Union[bool, None], Field(description='true for Dogs allowed only')] = None) -> dict: 
-    '''Get for-rent properties. **Parameters**: `city, state_code, location, limit, offset, sort, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, in_unit_features, community_ammenities, cats_ok, dogs_ok`'''
-    url = 'https://us-real-estate.p.rapidapi.com/v2/for-rent'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'city': city,
-        'state_code': state_code,
-        'location': location,
-        'limit': limit,
-        'offset': offset,
-        'sort': sort,
-        'price_min': price_min,
-        'price_max': price_max,
-        'beds_min': beds_min,
-        'beds_max': beds_max,
-        'baths_min': baths_min,
-        'baths_max': baths_max,
-        'property_type': property_type,
-        'expand_search_radius': expand_search_radius,
-        'include_nearby_areas_slug_id': include_nearby_areas_slug_id,
-        'home_size_min': home_size_min,
-        'home_size_max': home_size_max,
-        'in_unit_features': in_unit_features,
-        'community_ammenities': community_ammenities,
-        'cats_ok': cats_ok,
-        'dogs_ok': dogs_ok,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def v2_for_rent_by_zipcode(zipcode: Annotated[Union[int, float], Field(description='zipcode Default: 48278')],
-                           limit: Annotated[Union[int, float, None], Field(description='Number of results. Maximum 200 for Paid Plan, default 42 Default: 10')] = None,
-                           offset: Annotated[Union[int, float, None], Field(description='Offset results, default 0. Maximum 9800. Default: 0')] = None,
-                           sort: Annotated[Union[str, None], Field(description='One of the following options: frehsnest|recently_added_update|lowest_price|highest_price. Default is frehsnest')] = None,
-                           price_min: Annotated[Union[int, float, None], Field(description='Minimum list price in USD Default: 0')] = None,
-                           beds_min: Annotated[Union[int, float, None], Field(description='Minimum bedrooms Default: 0')] = None,
-                           beds_max: Annotated[Union[int, float, None], Field(description='Maximum bedrooms Default: 0')] = None,
-                           baths_min: Annotated[Union[int, float, None], Field(description='Minimum bathrooms Default: 0')] = None,
-                           baths_max: Annotated[Union[int, float, None], Field(description='Maximum bathrooms Default: 0')] = None,
-                           property_type: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: townhome,coop,single_family,apartment,condo,condop')] = None,
-                           include_nearby_areas_slug_id: Annotated[Union[str, None], Field(description='Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-rent-nearby-areas')] = None,
-                           home_size_min: Annotated[Union[int, float, None], Field(description='One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 0')] = None,
-                           home_size_max: Annotated[Union[int, float, None], Field(description='One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 0')] = None,
-                           in_unit_features: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: central_air|dishwasher|washer_dryer|furnished')] = None,
-                           community_ammenities: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: garage_1_or_more|swimming_pool|community_doorman|community_outdoor_space|community_elevator|laundry_room|community_gym')] = None,
-                           cats_ok: Annotated[Union[bool, None], Field(description='true for Cats allowed only')] = None,
-                           dogs_ok: Annotated[Union[bool, None], Field(description='true for Dogs allowed only')] = None) -> dict: 
-    '''Get for-rent properties. **Parameters**: `zipcode, limit, offset, sort, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, in_unit_features, community_ammenities, cats_ok, dogs_ok`'''
-    url = 'https://us-real-estate.p.rapidapi.com/v2/for-rent-by-zipcode'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'zipcode': zipcode,
-        'limit': limit,
-        'offset': offset,
-        'sort': sort,
-        'price_min': price_min,
-        'beds_min': beds_min,
-        'beds_max': beds_max,
-        'baths_min': baths_min,
-        'baths_max': baths_max,
-        'property_type': property_type,
-        'include_nearby_areas_slug_id': include_nearby_areas_slug_id,
-        'home_size_min': home_size_min,
-        'home_size_max': home_size_max,
-        'in_unit_features': in_unit_features,
-        'community_ammenities': community_ammenities,
-        'cats_ok': cats_ok,
-        'dogs_ok': dogs_ok,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def v2_for_rent_result_count(city: Annotated[str, Field(description='City name. Get data from /location/suggest response')],
-                             state_code: Annotated[str, Field(description='State Code. Get from /location/suggest response')],
-                             location: Annotated[Union[int, float, None], Field(description='Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank Default: 48278')] = None,
-                             price_min: Annotated[Union[int, float, None], Field(description='Minimum list price in USD Default: 1000')] = None,
-                             price_max: Annotated[Union[int, float, None], Field(description='Maximum list price in USD Default: 3000')] = None,
-                             beds_min: Annotated[Union[int, float, None], Field(description='Minimum bedrooms Default: 1')] = None,
-                             beds_max: Annotated[Union[int, float, None], Field(description='Maximum bedrooms Default: 5')] = None,
-                             baths_min: Annotated[Union[int, float, None], Field(description='Minimum bathrooms Default: 1')] = None,
-                             baths_max: Annotated[Union[int, float, None], Field(description='Maximum bathrooms Default: 5')] = None,
-                             property_type: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: townhome,coop,single_family,apartment,condo,condop')] = None,
-                             expand_search_radius: Annotated[Union[int, float, None], Field(description='One of the following options: 1|5|10|25|50 Default: 25')] = None,
-                             include_nearby_areas_slug_id: Annotated[Union[str, None], Field(description='Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-rent-nearby-areas')] = None,
-                             home_size_min: Annotated[Union[int, float, None], Field(description='One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 500')] = None,
-                             home_size_max: Annotated[Union[int, float, None], Field(description='One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 3000')] = None,
-                             in_unit_features: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: central_air|dishwasher|washer_dryer|furnished')] = None,
-                             community_ammenities: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: garage_1_or_more|swimming_pool|community_doorman|community_outdoor_space|community_elevator|laundry_room|community_gym')] = None,
-                             cats_ok: Annotated[Union[bool, None], Field(description='true for Cats allowed only')] = None,
-                             dogs_ok: Annotated[Union[bool, None], Field(description='true for Dogs allowed only')] = None) -> dict: 
-    '''Get result count for-rent properties. **Parameters**: `city, state_code, location, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, in_unit_features, community_ammenities, cats_ok, dogs_ok`'''
-    url = 'https://us-real-estate.p.rapidapi.com/v2/for-rent-result-count'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'city': city,
-        'state_code': state_code,
-        'location': location,
-        'price_min': price_min,
-        'price_max': price_max,
-        'beds_min': beds_min,
-        'beds_max': beds_max,
-        'baths_min': baths_min,
-        'baths_max': baths_max,
-        'property_type': property_type,
-        'expand_search_radius': expand_search_radius,
-        'include_nearby_areas_slug_id': include_nearby_areas_slug_id,
-        'home_size_min': home_size_min,
-        'home_size_max': home_size_max,
-        'in_unit_features': in_unit_features,
-        'community_ammenities': community_ammenities,
-        'cats_ok': cats_ok,
-        'dogs_ok': dogs_ok,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def for_rent_similiar_homes(property_id: Annotated[Union[int, float], Field(description='Default: 1207989147')]) -> dict: 
-    '''Get similiar for-rent homes by `property_id`'''
-    url = 'https://us-real-estate.p.rapidapi.com/v2/for-rent/similiar-homes'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'property_id': property_id,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def for_rent(city: Annotated[str, Field(description='City name. Get data from /location/suggest response')],
-             state_code: Annotated[str, Field(description='State Code. Get from /location/suggest response')],
-             location: Annotated[Union[int, float, None], Field(description='Additional Location detail, could be neighborhood or postal_code or leave it blank. Get from /location/suggest response. Default is blank Default: 48278')] = None,
-             limit: Annotated[Union[int, float, None], Field(description='Number of results. Maximum 200 for Paid Plan, default 42 Default: 10')] = None,
-             offset: Annotated[Union[int, float, None], Field(description='Offset results, default 0. Maximum 9800. Default: 0')] = None,
-             sort: Annotated[Union[str, None], Field(description='One of the following options: frehsnest|recently_added_update|lowest_price|highest_price. Default is frehsnest')] = None,
-             price_min: Annotated[Union[int, float, None], Field(description='Minimum list price in USD Default: 1000')] = None,
-             price_max: Annotated[Union[int, float, None], Field(description='Maximum list price in USD Default: 3000')] = None,
-             beds_min: Annotated[Union[int, float, None], Field(description='Minimum bedrooms Default: 1')] = None,
-             beds_max: Annotated[Union[int, float, None], Field(description='Maximum bedrooms Default: 5')] = None,
-             baths_min: Annotated[Union[int, float, None], Field(description='Minimum bathrooms Default: 1')] = None,
-             baths_max: Annotated[Union[int, float, None], Field(description='Maximum bathrooms Default: 5')] = None,
-             property_type: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: townhome,coop,single_family,apartment,condo,condop')] = None,
-             expand_search_radius: Annotated[Union[int, float, None], Field(description='One of the following options: 1|5|10|25|50 Default: 25')] = None,
-             include_nearby_areas_slug_id: Annotated[Union[str, None], Field(description='Comma separated values. Expand search by including nearby areas. Get slug_id from /location/for-rent-nearby-areas')] = None,
-             home_size_min: Annotated[Union[int, float, None], Field(description='One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 500')] = None,
-             home_size_max: Annotated[Union[int, float, None], Field(description='One of the following options: 500|750|1000|1250|1500|1750|2000|2250|2500|2750|3000 Default: 3000')] = None,
-             in_unit_features: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: central_air|dishwasher|washer_dryer|furnished')] = None,
-             community_ammenities: Annotated[Union[str, None], Field(description='Comma separated values. One or more from following options: garage_1_or_more|swimming_pool|community_doorman|community_outdoor_space|community_elevator|laundry_room|community_gym')] = None,
-             cats_ok: Annotated[Union[bool, None], Field(description='true for Cats allowed only')] = None,
-             dogs_ok: Annotated[Union[bool, None], Field(description='true for Dogs allowed only')] = None) -> dict: 
-    '''Get for-rent properties. **Parameters**: `city, state_code, location, limit, offset, sort, price_min, price_max, beds_min, beds_max, baths_min, baths_max, property_type, expand_search_radius, include_nearby_areas_slug_id, home_size_min, home_size_max, in_unit_features, community_ammenities, cats_ok, dogs_ok`'''
-    url = 'https://us-real-estate.p.rapidapi.com/for-rent'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'city': city,
-        'state_code': state_code,
-        'location': location,
-        'limit': limit,
-        'offset': offset,
-        'sort': sort,
-        'price_min': price_min,
-        'price_max': price_max,
-        'beds_min': beds_min,
-        'beds_max': beds_max,
-        'baths_min': baths_min,
-        'baths_max': baths_max,
-        'property_type': property_type,
-        'expand_search_radius': expand_search_radius,
-        'include_nearby_areas_slug_id': include_nearby_areas_slug_id,
-        'home_size_min': home_size_min,
-        'home_size_max': home_size_max,
-        'in_unit_features': in_unit_features,
-        'community_ammenities': community_ammenities,
-        'cats_ok': cats_ok,
-        'dogs_ok': dogs_ok,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def finance_mortgage_calculate(show_amortization: Annotated[bool, Field(description='')],
-                               hoa_fees: Annotated[Union[int, float], Field(description='Default: 0')],
-                               percent_tax_rate: Annotated[Union[int, float], Field(description='Default: 0.5110091743119266')],
-                               year_term: Annotated[Union[int, float], Field(description='Default: 30')],
-                               percent_rate: Annotated[Union[int, float], Field(description='Default: 3.088')],
-                               down_payment: Annotated[Union[int, float], Field(description='Default: 239800')],
-                               monthly_home_insurance: Annotated[Union[int, float], Field(description='Default: 416')],
-                               price: Annotated[Union[int, float], Field(description='Default: 1300000')]) -> dict: 
-    '''Mortgage calculae'''
-    url = 'https://us-real-estate.p.rapidapi.com/finance/mortgage-calculate'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'show_amortization': show_amortization,
-        'hoa_fees': hoa_fees,
-        'percent_tax_rate': percent_tax_rate,
-        'year_term': year_term,
-        'percent_rate': percent_rate,
-        'down_payment': down_payment,
-        'monthly_home_insurance': monthly_home_insurance,
-        'price': price,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def finance_rate_trends(is_refinance: Annotated[bool, Field(description='')]) -> dict: 
-    '''Get current rate trends and historical rate trends'''
-    url = 'https://us-real-estate.p.rapidapi.com/finance/rate-trends'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'is_refinance': is_refinance,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def finance_average_rate(postal_code: Annotated[Union[int, float], Field(description='Default: 10312')]) -> dict: 
-    '''Get average rates data'''
-    url = 'https://us-real-estate.p.rapidapi.com/finance/average-rate'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'postal_code': postal_code,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def agents_agents_search_by_zipcode(zipcode: Annotated[str, Field(description='Postal code. Required if search by postal_code only.')],
-                                    agent_name: Annotated[Union[str, None], Field(description='Agent name to search.')] = None,
-                                    sort: Annotated[Union[str, None], Field(description='One of the following options: agent_rating_high|recent_activity_high|recommendations_count_high|for_sale_count_high|recently_sold_high')] = None,
-                                    limit: Annotated[Union[int, float, None], Field(description='Maximum is 20')] = None,
-                                    offset: Annotated[Union[int, float, None], Field(description='Offset. Default is 0')] = None,
-                                    recommendations_count_min: Annotated[Union[int, float, None], Field(description='Minimum recommendations count. 1 to 10. Default is Any')] = None,
-                                    agent_rating_min: Annotated[Union[int, float, None], Field(description='Minimum agent rating. 1 to 5. Default is Any.')] = None,
-                                    types: Annotated[Union[str, None], Field(description='One of the following options: agent | team | office')] = None,
-                                    price_min: Annotated[Union[int, float, None], Field(description='Minimum list price in USD')] = None,
-                                    price_max: Annotated[Union[int, float, None], Field(description='Maximum list price in USD')] = None) -> dict: 
-    '''Search for agents, teams, and office by zip code'''
-    url = 'https://us-real-estate.p.rapidapi.com/agents/agents-search-by-zipcode'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'zipcode': zipcode,
-        'agent_name': agent_name,
-        'sort': sort,
-        'limit': limit,
-        'offset': offset,
-        'recommendations_count_min': recommendations_count_min,
-        'agent_rating_min': agent_rating_min,
-        'types': types,
-        'price_min': price_min,
-        'price_max': price_max,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def agents_agents_search(state_code: Annotated[Union[str, None], Field(description='State code. Required if not search by postal_code.')] = None,
-                         city: Annotated[Union[str, None], Field(description='City name. Required if not search by postal_code.')] = None,
-                         postal_code: Annotated[Union[str, None], Field(description='Postal code. Required if search by postal_code only.')] = None,
-                         agent_name: Annotated[Union[str, None], Field(description='Agent name to search.')] = None,
-                         sort: Annotated[Union[str, None], Field(description='One of the following options: agent_rating_high|recent_activity_high|recommendations_count_high|for_sale_count_high|recently_sold_high')] = None,
-                         limit: Annotated[Union[int, float, None], Field(description='Maximum is 100')] = None,
-                         offset: Annotated[Union[int, float, None], Field(description='Offset. Default is 0')] = None,
-                         recommendations_count_min: Annotated[Union[int, float, None], Field(description='Minimum recommendations count. 1 to 10. Default is Any')] = None,
-                         agent_rating_min: Annotated[Union[int, float, None], Field(description='Minimum agent rating. 1 to 5. Default is Any.')] = None,
-                         types: Annotated[Union[str, None], Field(description='One of the following options: agent | team | office')] = None,
-                         price_min: Annotated[Union[int, float, None], Field(description='Minimum list price in USD')] = None,
-                         price_max: Annotated[Union[int, float, None], Field(description='Maximum list price in USD')] = None) -> dict: 
-    '''Search for agents, teams and office'''
-    url = 'https://us-real-estate.p.rapidapi.com/agents/agents-search'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'state_code': state_code,
-        'city': city,
-        'postal_code': postal_code,
-        'agent_name': agent_name,
-        'sort': sort,
-        'limit': limit,
-        'offset': offset,
-        'recommendations_count_min': recommendations_count_min,
-        'agent_rating_min': agent_rating_min,
-        'types': types,
-        'price_min': price_min,
-        'price_max': price_max,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def agents_agent_profile(advertiser_id: Annotated[str, Field(description='')],
-                         nrds_id: Annotated[Union[str, None], Field(description='')] = None) -> dict: 
-    '''Get Agent's profile by advertiser_id and nrds_id'''
-    url = 'https://us-real-estate.p.rapidapi.com/agents/agent-profile'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'advertiser_id': advertiser_id,
-        'nrds_id': nrds_id,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
-@mcp.tool()
-def agents_agent_listings(advertiser_id: Annotated[str, Field(description='')],
-                          nrds_id: Annotated[Union[str, None], Field(description='')] = None,
-                          page: Annotated[Union[str, None], Field(description='')] = None) -> dict: 
-    '''Get Agent's listings'''
-    url = 'https://us-real-estate.p.rapidapi.com/agents/agent-listings'
-    headers = {'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key}
-    payload = {
-        'advertiser_id': advertiser_id,
-        'nrds_id': nrds_id,
-        'page': page,
-    }
-    payload = {k: v for k, v in payload.items() if v is not None}
-    response = requests.get(url, headers=headers, params=payload)
-    return response.json()
-
+base_url = os.getenv('RAPID_API_BASE_URL', 'https://us-real-estate.p.rapidapi.com').rstrip('/')
+
+# Connection pool settings for the shared async HTTP client. `pool_maxsize`
+# caps the open connections to the upstream host, all of which are kept alive
+# between tool calls.
+pool_maxsize = int(os.getenv('HTTP_POOL_MAXSIZE', '32'))
+connect_timeout = float(os.getenv('HTTP_CONNECT_TIMEOUT', '5'))
+read_timeout = float(os.getenv('HTTP_READ_TIMEOUT', '30'))
+
+client = None
+client_lock = threading.Lock()
+
+def _client() -> httpx.AsyncClient:
+    '''The shared client, created on first use rather than at import: loading the CA bundle
+    for its TLS context is the slowest single step of startup. The lifespan builds it in a
+    worker thread while the MCP session is set up.'''
+    global client
+    with client_lock:
+        if client is None:
+            client = httpx.AsyncClient(
+                headers={'x-rapidapi-host': 'us-real-estate.p.rapidapi.com', 'x-rapidapi-key': rapid_api_key or ''},
+                limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            )
+        return client
+
+# Seconds a successful response stays cached, per endpoint path, from the
+# endpoint registry. Endpoints without a cache_ttl always go upstream.
+cache_ttls = {endpoint.path: endpoint.cache_ttl for endpoint in registry if endpoint.cache_ttl}
+
+# RapidAPI quota units one upstream call uses, per endpoint path.
+endpoint_costs = {endpoint.path: endpoint.cost for endpoint in registry}
+
+# Seconds past its TTL a cached response may still be served: straight away
+# while it is refreshed in the background, and flagged `stale` if that refresh
+# fails. CACHE_STALE_TTL applies to every cached endpoint unless overridden
+# per path in cache_stale_ttls.
+cache_stale_ttl = float(os.getenv('CACHE_STALE_TTL', str(24 * 3600)))
+cache_stale_ttls = {}
+revalidate_backoff = float(os.getenv('CACHE_REVALIDATE_BACKOFF', '30'))
+
+response_cache = ResponseCache(
+    max_entries=int(os.getenv('CACHE_MAX_ENTRIES', '2048')),
+    max_bytes=int(os.getenv('CACHE_MAX_BYTES', str(64 * 1024 * 1024))),
+)
+
+# Optional on-disk tier behind the in-memory cache, shared by every server
+# process pointed at the same CACHE_DB_PATH so restarts don't start cold. Its
+# SQLite calls block, so they run in worker threads off the event loop.
+disk_cache = DiskCache(
+    os.getenv('CACHE_DB_PATH'),
+    max_bytes=int(os.getenv('CACHE_DB_MAX_BYTES', str(256 * 1024 * 1024))),
+) if os.getenv('CACHE_DB_PATH') else None
+
+inflight = SingleFlight()
+
+# Client-side throttling so agents sharing a RAPID_API_KEY stay under the plan's
+# rate limit. It is off unless RATE_LIMIT_RPS sets a per-key rate (with
+# RATE_LIMIT_BURST); RATE_LIMIT_ENDPOINTS adds tighter buckets for individual
+# endpoint paths, e.g. `/v3/for-sale:2:4,/v2/for-sale:1:2` for `path:rate:burst`.
+endpoint_rate_limits = parse_endpoint_limits(os.getenv('RATE_LIMIT_ENDPOINTS', ''))
+
+rate_limiter = RateLimiter(
+    rate=float(os.getenv('RATE_LIMIT_RPS', '0')),
+    burst=float(os.getenv('RATE_LIMIT_BURST', '10')),
+    endpoint_limits=endpoint_rate_limits,
+)
+
+quota = QuotaBudget(
+    reserve=int(os.getenv('QUOTA_RESERVE', '0')),
+    daily_budget=int(os.getenv('QUOTA_DAILY_BUDGET')) if os.getenv('QUOTA_DAILY_BUDGET') else None,
+)
+
+retry_policy = RetryPolicy(
+    max_attempts=int(os.getenv('RETRY_MAX_ATTEMPTS', '3')),
+    base_delay=float(os.getenv('RETRY_BASE_DELAY', '0.25')),
+    max_delay=float(os.getenv('RETRY_MAX_DELAY', '4')),
+    deadline=float(os.getenv('RETRY_DEADLINE', '30')),
+)
+
+# Per-tool and per-endpoint latency, size, cache and retry metrics, returned by
+# the server_stats tool. METRICS_PORT additionally serves them as Prometheus
+# text on http://127.0.0.1:<port>/metrics.
+metrics = Metrics()
+metrics_port = int(os.getenv('METRICS_PORT', '0'))
+
+def _record_attempt(path: str, trace: RequestTrace, response: Union[httpx.Response, None]) -> None:
+    for phase, seconds in trace.phases().items():
+        metrics.observe('upstream_phase_seconds', seconds, endpoint=path, phase=phase)
+    metrics.inc('upstream_requests_total', endpoint=path, status=str(response.status_code) if response is not None else 'error')
+    if response is not None:
+        try:
+            size = len(response.content)
+        except httpx.ResponseNotRead:
+            size = response.num_bytes_downloaded
+        metrics.observe('upstream_response_bytes', size, size_buckets, endpoint=path)
+
+async def _stream(url: str, payload: dict, timeout: httpx.Timeout, trace: RequestTrace, consume) -> httpx.Response:
+    '''GET `url` and hand a 2xx response to `consume` while its body is still downloading; other bodies are read whole'''
+    async with _client().stream('GET', url, params=payload, timeout=timeout, extensions={'trace': trace}) as response:
+        if response.is_success:
+            await consume(response)
+        else:
+            await response.aread()
+    return response
+
+async def _fetch(url: str, path: str, payload: dict, key: str, ttl: float, consume=None) -> httpx.Response:
+    '''Call upstream with quota, rate limiting and retries, and cache a 2xx body for `ttl` seconds.
+    With `consume`, each 2xx body is streamed into `await consume(response)` instead of being read.'''
+    deadline = time.monotonic() + retry_policy.deadline
+    attempt = 0
+    while True:
+        quota.check(endpoint_costs.get(path, 1))
+        await rate_limiter.acquire(rapid_api_key or '', path)
+        remaining = max(0.1, deadline - time.monotonic())
+        trace = RequestTrace()
+        try:
+            timeout = httpx.Timeout(min(read_timeout, remaining), connect=min(connect_timeout, remaining))
+            if consume is None:
+                response = await _client().get(url, params=payload, timeout=timeout, extensions={'trace': trace})
+            else:
+                response = await _stream(url, payload, timeout, trace, consume)
+        except httpx.TransportError:
+            _record_attempt(path, trace, None)
+            delay = retry_policy.delay(attempt)
+            if not retry_policy.allows(path, attempt, delay, deadline):
+                raise
+        else:
+            _record_attempt(path, trace, response)
+            quota.record(response.headers)
+            if response.status_code not in retry_policy.retry_statuses:
+                break
+            retry_after = retry_after_seconds(response.headers)
+            if response.status_code == 429:
+                rate_limiter.pause(rapid_api_key or '', retry_after if retry_after is not None else 1.0)
+            delay = retry_policy.delay(attempt, retry_after)
+            if not retry_policy.allows(path, attempt, delay, deadline):
+                break
+        metrics.inc('tool_retries_total', tool=current_tool.get())
+        await asyncio.sleep(delay)
+        attempt += 1
+    if ttl and response.is_success:
+        stale_ttl = cache_stale_ttls.get(path, cache_stale_ttl)
+        response_cache.put(key, response.content, ttl, stale_ttl)
+        if disk_cache is not None:
+            await asyncio.to_thread(disk_cache.put, key, response.content, ttl, stale_ttl)
+    return response
+
+revalidations = set()
+revalidate_errors = {}
+
+def _revalidate(url: str, path: str, payload: dict, key: str, ttl: float) -> None:
+    '''Refresh a stale cache entry in the background. After a failed refresh the key
+    is left alone for `revalidate_backoff` seconds so an outage doesn't turn every hit into a call.'''
+    if inflight.pending(key):
+        return
+    failure = revalidate_errors.get(key)
+    if failure is not None and time.monotonic() - failure[1] < revalidate_backoff:
+        return
+
+    async def refresh():
+        try:
+            response = await inflight.do(key, lambda: _fetch(url, path, payload, key, ttl))
+        except Exception as error:
+            revalidate_errors[key] = (f'{type(error).__name__}: {error}', time.monotonic())
+        else:
+            if response.is_success:
+                revalidate_errors.pop(key, None)
+            else:
+                revalidate_errors[key] = (f'HTTP {response.status_code}', time.monotonic())
+
+    task = asyncio.create_task(refresh())
+    revalidations.add(task)
+    task.add_done_callback(revalidations.discard)
+
+# Listing searches that page with `offset`/`limit`, by tool name.
+paginated_endpoints = {
+    'v3_for_sale': '/v3/for-sale',
+    'v2_for_sale': '/v2/for-sale',
+    'v2_for_sale_by_zipcode': '/v2/for-sale-by-zipcode',
+    'for_sale': '/for-sale',
+    'v2_sold_homes_by_zipcode': '/v2/sold-homes-by-zipcode',
+    'sold_homes': '/sold-homes',
+    'v2_for_rent': '/v2/for-rent',
+    'v2_for_rent_by_zipcode': '/v2/for-rent-by-zipcode',
+    'for_rent': '/for-rent',
+}
+
+max_offset = 9800
+
+listing_paths = frozenset(paginated_endpoints.values())
+
+# The latest LISTING_STORE_MAX search results the server has seen, in search-summary form, for the local_* tools.
+listing_store = ListingStore(max_listings=int(os.getenv('LISTING_STORE_MAX', '50000')))
+
+def _listing_page(body: dict) -> tuple:
+    '''Pull `(results, total)` out of a search response; total is None when the endpoint doesn't report it'''
+    data = body.get('data') if isinstance(body, dict) else None
+    if not isinstance(data, dict):
+        return [], None
+    search = data.get('home_search') if isinstance(data.get('home_search'), dict) else data
+    results = search.get('results') or []
+    total = search.get('total')
+    return results, total if isinstance(total, int) else None
+
+# Response bodies are parsed with orjson when it is installed: it reads the bytes
+# directly instead of first decoding them to a str, shares repeated object keys
+# across listings, and parses multi-megabyte search pages about a third faster.
+# It is imported on the first decode to stay off the startup path.
+json_loads = None
+
+def _json_loads(body: bytes):
+    global json_loads
+    if json_loads is None:
+        try:
+            import orjson
+            json_loads = orjson.loads
+        except ImportError:
+            json_loads = json.loads
+    try:
+        return json_loads(body)
+    except ValueError:
+        if json_loads is json.loads:
+            raise
+        # Documents orjson refuses but json accepts, e.g. integers beyond 64 bits or NaN.
+        return json.loads(body)
+
+def _decode(path: str, body: bytes):
+    start = time.perf_counter()
+    document = _json_loads(body)
+    metrics.observe('json_decode_seconds', time.perf_counter() - start, endpoint=path)
+    metrics.inc('tool_response_bytes_total', len(body), tool=current_tool.get())
+    return document
+
+async def _get(url: str, payload: dict, raise_for_status: bool = False) -> dict:
+    '''Issue a GET against the RapidAPI endpoint over the shared keep-alive client, through the response cache.
+    Identical concurrent requests share a single upstream call. Stale cache entries are served immediately and
+    refreshed in the background. With `raise_for_status`, a final non-2xx response raises httpx.HTTPStatusError
+    instead of returning its error body.'''
+    path = url[len(base_url):]
+    ttl = cache_ttls.get(path, 0)
+    key = make_key(url, payload)
+    if ttl:
+        entry = response_cache.get(key)
+        if entry is None:
+            cached = await _load_from_disk(key)
+            if cached is not None:
+                body, fresh_left = cached
+                entry = body, fresh_left > 0
+        metrics.inc('tool_cache_lookups_total', tool=current_tool.get(), result='miss' if entry is None else 'hit' if entry[1] else 'stale')
+        if entry is not None:
+            body, fresh = entry
+            document = _decode(path, body)
+            if not fresh:
+                _revalidate(url, path, payload, key, ttl)
+                if key in revalidate_errors and isinstance(document, dict):
+                    document = {**document, 'stale': True, 'stale_reason': revalidate_errors[key][0]}
+            return _observe(path, document)
+    response = await inflight.do(key, lambda: _fetch(url, path, payload, key, ttl))
+    document = _decode(path, response.content)
+    if raise_for_status and not response.is_success:
+        message = document.get('message') if isinstance(document, dict) else None
+        raise httpx.HTTPStatusError(f'HTTP {response.status_code}: {message or response.reason_phrase}',
+                                    request=response.request, response=response)
+    return _observe(path, document)
+
+async def _load_from_disk(key: str) -> Union[tuple, None]:
+    '''`(body, seconds_fresh)` for a disk tier entry, copied into the memory tier; None without one'''
+    if disk_cache is None:
+        return None
+    cached = await asyncio.to_thread(disk_cache.get, key)
+    if cached is None:
+        return None
+    body, fresh_left, left = cached
+    response_cache.put(key, body, max(fresh_left, 0), left - max(fresh_left, 0))
+    return body, fresh_left
+
+# Where the listings of a search response sit, for streaming them out of the page.
+result_paths = [('data', 'home_search', 'results'), ('data', 'results')]
+
+async def _get_streamed(url: str, payload: dict, fields) -> dict:
+    '''Like _get() for an uncached search page, but decoded while it downloads. Each listing is added to the
+    listing store and cut down to `fields` as soon as its text is complete, so the full page is never held
+    in memory at once.'''
+    path = url[len(base_url):]
+    key = make_key(url, payload)
+    select = projector(fields)
+    decoded = {}
+
+    async def consume(response: httpx.Response) -> None:
+        decoded.clear()
+        pending = []
+
+        def on_item(listing):
+            pending.append(listing)
+            return project_item(listing, stream.path, select)
+
+        stream = ArrayStream(result_paths, on_item)
+        text = codecs.getincrementaldecoder('utf-8')()
+        seconds = 0.0
+        size = 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            start = time.perf_counter()
+            stream.feed(text.decode(chunk))
+            seconds += time.perf_counter() - start
+            listing_store.add(pending)
+            pending.clear()
+        start = time.perf_counter()
+        stream.feed(text.decode(b'', final=True))
+        decoded['document'] = stream.close()
+        seconds += time.perf_counter() - start
+        listing_store.add(pending)
+        metrics.observe('json_decode_seconds', seconds, endpoint=path)
+        metrics.inc('tool_response_bytes_total', size, tool=current_tool.get())
+
+    async def fetch() -> tuple:
+        response = await _fetch(url, path, payload, key, 0, consume)
+        return response, decoded.get('document') if response.is_success else None
+
+    # Callers asking for other fields need their own projection, so they don't share the call.
+    response, document = await inflight.do(f'{key}#fields={json.dumps(fields)}', fetch)
+    return document if document is not None else _decode(path, response.content)
+
+def _observe(path: str, document: dict) -> dict:
+    '''Index the listings of every search response, fresh or cached, into the local listing store'''
+    if path in listing_paths:
+        listing_store.add(_listing_page(document)[0])
+    return document
+
+# finance_mortgage_calculate is pure arithmetic and can be answered locally with
+# MORTGAGE_CALCULATE_LOCAL set. It goes upstream by default until the local
+# layout is checked against recorded responses (tests/test_mortgage_parity.py).
+local_mortgage_calculate = os.getenv('MORTGAGE_CALCULATE_LOCAL', '').lower() in ('1', 'true', 'yes')
+
+# Requests kept warm in the cache by the background refresher: `(path, payload)`
+# pairs, refreshed once their cached copy is within `warm_refresh_ahead` seconds
+# of expiring. Rate trends are always included; WARM_POSTAL_CODES adds average
+# rates and schools for each listed postal code.
+warm_set = [('/finance/rate-trends', {'is_refinance': True}), ('/finance/rate-trends', {'is_refinance': False})]
+for postal_code in filter(None, os.getenv('WARM_POSTAL_CODES', '').replace(' ', '').split(',')):
+    warm_set += [('/finance/average-rate', {'postal_code': postal_code}), ('/location/schools', {'postal_code': postal_code})]
+
+warm_interval = float(os.getenv('WARM_INTERVAL', '60'))
+warm_refresh_ahead = float(os.getenv('WARM_REFRESH_AHEAD', '600'))
+warm_daily_budget = int(os.getenv('WARM_DAILY_BUDGET', '500'))
+warm_stats = {'refreshed': 0, 'skipped_budget': 0, 'errors': 0, 'day': None, 'used_today': 0}
+
+async def _warm_once() -> None:
+    '''Refresh every warm-set entry that is missing from both cache tiers or about to expire'''
+    for path, payload in warm_set:
+        url = f'{base_url}{path}'
+        key = make_key(url, payload)
+        remaining = response_cache.remaining(key)
+        if remaining is None:
+            cached = await _load_from_disk(key)
+            remaining = cached[1] if cached is not None and cached[1] > 0 else None
+        if remaining is not None and remaining > warm_refresh_ahead:
+            continue
+        today = datetime.now(timezone.utc).date()
+        if warm_stats['day'] != today:
+            warm_stats['day'], warm_stats['used_today'] = today, 0
+        if warm_stats['used_today'] >= warm_daily_budget or (quota.remaining is not None and quota.remaining <= quota.reserve + len(warm_set)):
+            warm_stats['skipped_budget'] += 1
+            continue
+        warm_stats['used_today'] += 1
+        try:
+            await inflight.do(key, lambda: _fetch(url, path, payload, key, cache_ttls.get(path, 0)))
+            warm_stats['refreshed'] += 1
+        except Exception:
+            warm_stats['errors'] += 1
+
+async def _warm_loop() -> None:
+    while True:
+        await _warm_once()
+        await asyncio.sleep(warm_interval)
+
+def prometheus_metrics() -> str:
+    '''All metrics, plus the cache, coalescing and quota counters, in Prometheus text format'''
+    text = metrics.prometheus()
+    text += prometheus_gauges('response_cache', response_cache.stats())
+    if disk_cache is not None:
+        text += prometheus_gauges('disk_cache', disk_cache.stats())
+    text += prometheus_gauges('inflight', inflight.stats())
+    text += prometheus_gauges('quota', quota.stats())
+    text += prometheus_gauges('warmer', warm_stats)
+    return text
+
+metrics_exporter = None
+
+@asynccontextmanager
+async def lifespan(server):
+    '''Run the cache warmer, and the metrics exporter if METRICS_PORT is set, for as long as the server is up.
+    WARM_INTERVAL=0 disables the warmer.'''
+    global metrics_exporter
+    asyncio.get_running_loop().run_in_executor(None, _client)
+    task = asyncio.create_task(_warm_loop()) if warm_interval > 0 and warm_set else None
+    exporter = None
+    if metrics_port and metrics_exporter is None:
+        exporter = metrics_exporter = MetricsExporter(metrics_port, prometheus_metrics).start()
+    try:
+        yield
+    finally:
+        if task is not None:
+            task.cancel()
+        if exporter is not None:
+            exporter.stop()
+            metrics_exporter = None
+
+mcp = FastMCP('us-real-estate', lifespan=lifespan)
+
+# Registers tools like mcp.tool(), taking each input schema from the precomputed
+# tool_schemas.json while it still matches the tool's signature. Run
+# `python toolschemas.py` after changing a tool to refresh it.
+tool_schemas = ToolSchemas(os.getenv('TOOL_SCHEMA_CACHE', default_schema_path))
+tool = tool_schemas.tool(mcp)
+
+async def _call_endpoint(endpoint: Endpoint, arguments: dict) -> dict:
+    return await _get(f'{base_url}{endpoint.path}', endpoint.payload(arguments))
+
+async def _project_fields(endpoint: Endpoint, arguments: dict, call_next) -> dict:
+    '''Apply the `fields` selection of endpoints that take one'''
+    response = await call_next(endpoint, arguments)
+    return project(response, arguments['fields']) if 'fields' in arguments else response
+
+async def _stream_listings(endpoint: Endpoint, arguments: dict, call_next) -> dict:
+    '''Stream-decode uncached search pages when a `fields` selection is given, projecting each listing as it arrives'''
+    if arguments.get('fields') and endpoint.path in listing_paths and not cache_ttls.get(endpoint.path):
+        return await _get_streamed(f'{base_url}{endpoint.path}', endpoint.payload(arguments), arguments['fields'])
+    return await call_next(endpoint, arguments)
+
+async def _local_mortgage(endpoint: Endpoint, arguments: dict, call_next) -> dict:
+    '''Answer finance_mortgage_calculate locally when MORTGAGE_CALCULATE_LOCAL is set'''
+    if endpoint.path == '/finance/mortgage-calculate' and local_mortgage_calculate:
+        return mortgage.calculate(**arguments)
+    return await call_next(endpoint, arguments)
+
+# Every registry endpoint tool runs through this pipeline, then _get(). Add
+# cross-cutting stages with endpoint_pipeline.use(stage).
+endpoint_pipeline = Pipeline(_call_endpoint, [_project_fields, _local_mortgage, _stream_listings])
+
+for spec in registry:
+    tool(metrics.instrument(make_tool(spec, endpoint_pipeline)))
+
+
+async def iter_listings(path: str, params: dict, page_size: int = 200, prefetch: int = 4,
+                        max_results: Union[int, None] = None) -> AsyncIterator[dict]:
+    '''Yield every listing of a search, keeping up to `prefetch` pages in flight ahead of the consumer.
+    The first page is fetched on its own so the total it reports bounds the pages requested after it.
+    Listings repeated across page boundaries are yielded once, keyed by `property_id`.'''
+    url = f'{base_url}{path}'
+    params = {k: v for k, v in params.items() if v is not None and k not in ('offset', 'limit')}
+    last_offset = max_offset
+    next_offset = 0
+    pending = deque()
+    seen = set()
+    emitted = 0
+    window = 1
+
+    def schedule():
+        nonlocal next_offset
+        while len(pending) < window and next_offset <= last_offset:
+            pending.append((next_offset, asyncio.ensure_future(_get(url, {**params, 'offset': next_offset, 'limit': page_size}))))
+            next_offset += page_size
+
+    try:
+        schedule()
+        while pending:
+            offset, page = pending.popleft()
+            results, total = _listing_page(await page)
+            if total is not None:
+                last_offset = min(last_offset, total - 1)
+            for listing in results:
+                property_id = listing.get('property_id')
+                if property_id is not None:
+                    if property_id in seen:
+                        continue
+                    seen.add(property_id)
+                yield listing
+                emitted += 1
+                if max_results is not None and emitted >= max_results:
+                    return
+            if not results or (total is None and len(results) < page_size):
+                return
+            window = max(1, prefetch)
+            schedule()
+    finally:
+        for _, page in pending:
+            page.cancel()
+
+@tool
+@metrics.instrument
+async def search_all_pages(endpoint: Annotated[Literal['v3_for_sale', 'v2_for_sale', 'v2_for_sale_by_zipcode', 'for_sale', 'v2_sold_homes_by_zipcode', 'sold_homes', 'v2_for_rent', 'v2_for_rent_by_zipcode', 'for_rent'], Field(description='Search tool to page through')],
+                           params: Annotated[dict, Field(description='Arguments for that tool, without offset and limit')],
+                           max_results: Annotated[Union[int, None], Field(description='Stop once this many unique listings are collected')] = None,
+                           page_size: Annotated[int, Field(description='Listings per upstream page. Maximum 200 for Paid Plan. Default: 200', ge=1, le=200)] = 200,
+                           prefetch: Annotated[int, Field(description='Pages fetched concurrently ahead of consumption. Default: 4', ge=1)] = 4) -> dict: 
+    '''Collect all pages of a listing search (up to offset 9800), de-duplicated by `property_id`'''
+    results = [listing async for listing in iter_listings(paginated_endpoints[endpoint], params, page_size, prefetch, max_results)]
+    return {'count': len(results), 'results': results}
+
+# Search tools whose full result set can be sized up front, with the count endpoint to ask.
+result_count_endpoints = {
+    'v3_for_sale': '/v2/for-sale-result-count',
+    'v2_for_sale': '/v2/for-sale-result-count',
+    'for_sale': '/v2/for-sale-result-count',
+    'v2_for_rent': '/v2/for-rent-result-count',
+    'for_rent': '/v2/for-rent-result-count',
+}
+
+def _count_value(body: dict) -> Union[int, None]:
+    '''Pull the listing total out of a result-count response'''
+    data = body.get('data') if isinstance(body, dict) else None
+    if isinstance(data, dict):
+        search = data.get('home_search') if isinstance(data.get('home_search'), dict) else data
+        data = search.get('total', search.get('count'))
+    return int(data) if isinstance(data, (int, float)) and not isinstance(data, bool) else None
+
+async def result_count(endpoint: str, params: dict) -> Union[int, None]:
+    url = f'{base_url}{result_count_endpoints[endpoint]}'
+    payload = {k: v for k, v in params.items() if v is not None and k not in ('sort', 'offset', 'limit')}
+    return _count_value(await _get(url, payload))
+
+def plan_pages(total: int, page_size: int) -> List[tuple]:
+    '''The `(offset, limit)` windows covering `total` listings, stopping at the offset ceiling'''
+    return [(offset, min(page_size, total - offset)) for offset in range(0, min(total, max_offset + 1), page_size)]
+
+async def fetch_pages(endpoint: str, params: dict, windows: List[tuple], semaphore: asyncio.Semaphore) -> List[dict]:
+    '''Fetch the given `(offset, limit)` windows of a search in parallel, bounded by `semaphore`'''
+    url = f'{base_url}{paginated_endpoints[endpoint]}'
+    params = {k: v for k, v in params.items() if v is not None and k not in ('offset', 'limit')}
+
+    async def fetch(offset, limit):
+        async with semaphore:
+            results, _ = _listing_page(await _get(url, {**params, 'offset': offset, 'limit': limit}))
+            return results
+
+    return [listing for page in await asyncio.gather(*(fetch(*window) for window in windows)) for listing in page]
+
+def _unique_listings(listings: List[dict]) -> List[dict]:
+    seen = set()
+    unique = []
+    for listing in listings:
+        property_id = listing.get('property_id')
+        if property_id is not None:
+            if property_id in seen:
+                continue
+            seen.add(property_id)
+        unique.append(listing)
+    return unique
+
+@tool
+@metrics.instrument
+async def bulk_fetch_listings(endpoint: Annotated[Literal['v3_for_sale', 'v2_for_sale', 'for_sale', 'v2_for_rent', 'for_rent'], Field(description='Search tool to pull in full')],
+                              params: Annotated[dict, Field(description='Arguments for that tool, without offset and limit')],
+                              page_size: Annotated[int, Field(description='Listings per upstream page. Maximum 200 for Paid Plan. Default: 200', ge=1, le=200)] = 200,
+                              concurrency: Annotated[int, Field(description='Pages fetched in parallel. Default: 8', ge=1)] = 8) -> dict: 
+    '''Pull every listing of a search: one result-count call, then all pages in parallel, de-duplicated by `property_id`'''
+    total = await result_count(endpoint, params)
+    if total is None:
+        results = [listing async for listing in iter_listings(paginated_endpoints[endpoint], params, page_size, concurrency)]
+        return {'total': None, 'count': len(results), 'truncated': False, 'results': results}
+    windows = plan_pages(total, page_size)
+    results = _unique_listings(await fetch_pages(endpoint, params, windows, asyncio.Semaphore(concurrency)))
+    return {'total': total, 'count': len(results), 'truncated': total > sum(limit for _, limit in windows), 'results': results}
+
+def _split_search(params: dict) -> Union[List[dict], None]:
+    '''Partition a search into disjoint sub-searches: halve the price band, then split by bedroom count'''
+    low = int(float(params.get('price_min') or 0))
+    high = int(float(params['price_max'])) if params.get('price_max') is not None else None
+    if high is None:
+        middle = max(2 * low, 500000)
+        return [{**params, 'price_min': low, 'price_max': middle}, {**params, 'price_min': middle + 1, 'price_max': None}]
+    if high > low:
+        middle = (low + high) // 2
+        return [{**params, 'price_min': low, 'price_max': middle}, {**params, 'price_min': middle + 1, 'price_max': high}]
+    if params.get('beds_min') is None and params.get('beds_max') is None:
+        return [{**params, 'beds_min': beds, 'beds_max': beds} for beds in range(5)] + [{**params, 'beds_min': 5}]
+    return None
+
+async def partition_search(endpoint: str, params: dict, capacity: int, total: Union[int, None] = None) -> List[tuple]:
+    '''Recursively split a search until every part's count fits in `capacity`; returns `(params, total)` leaves.
+    Every part is counted rather than derived from its parent, since a split can leave listings out (the bedroom
+    split never matches listings without a bed count); the leaf totals then sum to less than the search's.'''
+    if total is None:
+        total = await result_count(endpoint, params)
+    parts = _split_search(params) if total is not None and total > capacity else None
+    if parts is None:
+        return [(params, total)]
+    counts = await asyncio.gather(*(result_count(endpoint, part) for part in parts))
+    if any(count is None for count in counts):
+        return [(params, total)]
+    leaves = await asyncio.gather(*(partition_search(endpoint, part, capacity, count) for part, count in zip(parts, counts) if count))
+    return [leaf for group in leaves for leaf in group]
+
+@tool
+@metrics.instrument
+async def crawl_listings(endpoint: Annotated[Literal['v3_for_sale', 'v2_for_sale', 'for_sale', 'v2_for_rent', 'for_rent'], Field(description='Search tool to crawl')],
+                         params: Annotated[dict, Field(description='Arguments for that tool, without offset and limit')],
+                         page_size: Annotated[int, Field(description='Listings per upstream page. Maximum 200 for Paid Plan. Default: 200', ge=1, le=200)] = 200,
+                         concurrency: Annotated[int, Field(description='Upstream requests in parallel. Default: 8', ge=1)] = 8) -> dict: 
+    '''Pull every listing of a search past the 9800 offset ceiling by splitting it into price (then bedroom) bands that each fit, de-duplicated by `property_id`'''
+    capacity = (max_offset // page_size + 1) * page_size
+    total = await result_count(endpoint, params)
+    partitions = await partition_search(endpoint, params, capacity, total)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def crawl(part, part_total):
+        if part_total is None:
+            return [listing async for listing in iter_listings(paginated_endpoints[endpoint], part, page_size, concurrency)]
+        return await fetch_pages(endpoint, part, plan_pages(part_total, page_size), semaphore)
+
+    pages = await asyncio.gather(*(crawl(part, part_total) for part, part_total in partitions))
+    results = _unique_listings([listing for page in pages for listing in page])
+    # A part without a count was paged until it ran out, so it was cut short only if it reached the ceiling.
+    sizes = [part_total if part_total is not None else len(page) for (_, part_total), page in zip(partitions, pages)]
+    return {
+        'total': total,
+        'count': len(results),
+        'partitions': len(partitions),
+        'truncated': any(size >= capacity if part_total is None else size > capacity for (_, part_total), size in zip(partitions, sizes))
+                     or (total is not None and sum(sizes) < total),
+        'results': results,
+    }
+
+@tool
+@metrics.instrument
+async def quota_status() -> dict: 
+    '''Remaining RapidAPI quota as last reported by upstream, and client-side rate limiter state'''
+    return {'quota': quota.stats(), 'rate_limiter': rate_limiter.stats()}
+
+@tool
+@metrics.instrument
+async def server_stats(format: Annotated[Literal['json', 'prometheus'], Field(description='json for a nested summary, prometheus for the text exposition format. Default: json')] = 'json') -> Union[dict, str]: 
+    '''Per-tool call counts and latency, per-endpoint upstream timings (connect/TLS/time to first byte/download), JSON decode time,
+    response sizes, cache hit ratios, retries and cache warmer refreshes since the server started'''
+    if format == 'prometheus':
+        return prometheus_metrics()
+    return {
+        'metrics': metrics.snapshot(),
+        'response_cache': response_cache.stats(),
+        'disk_cache': disk_cache.stats() if disk_cache is not None else None,
+        'inflight': inflight.stats(),
+        'retries': retry_policy.stats(),
+        'quota': quota.stats(),
+        'warmer': {**warm_stats, 'day': warm_stats['day'].isoformat() if warm_stats['day'] else None},
+    }
+
+property_detail_endpoints = {
+    'v3': '/v3/property-detail',
+    'v2': '/v2/property-detail',
+    'v1': '/property-detail',
+}
+
+@tool
+@metrics.instrument
+async def batch_property_detail(property_ids: Annotated[List[str], Field(description='Property IDs, e.g. from a for-sale search')],
+                                version: Annotated[Literal['v3', 'v2', 'v1'], Field(description='Which property detail endpoint to use. Default: v3')] = 'v3',
+                                concurrency: Annotated[int, Field(description='Upstream requests in parallel. Default: 8', ge=1)] = 8) -> dict: 
+    '''Get property detail data for many `property_id`s at once. Cached details are served locally; failures are reported per id'''
+    url = f'{base_url}{property_detail_endpoints[version]}'
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(property_id):
+        async with semaphore:
+            return await _get(url, {'property_id': property_id}, raise_for_status=True)
+
+    ids = list(dict.fromkeys(property_ids))
+    outcomes = await asyncio.gather(*(fetch(property_id) for property_id in ids), return_exceptions=True)
+    results = {}
+    errors = {}
+    for property_id, outcome in zip(ids, outcomes):
+        if isinstance(outcome, Exception):
+            errors[property_id] = f'{type(outcome).__name__}: {outcome}'
+        else:
+            results[property_id] = outcome
+    return {'results': results, 'errors': errors}
+
+@tool
+@metrics.instrument
+async def finance_mortgage_scenarios(price: Annotated[Union[int, float], Field(description='Home price in USD')],
+                                     down_payments: Annotated[List[Union[int, float]], Field(description='Down payments in USD to compare')],
+                                     percent_rates: Annotated[List[Union[int, float]], Field(description='Annual interest rates in percent to compare')],
+                                     year_terms: Annotated[Union[List[Union[int, float]], None], Field(description='Loan terms in years to compare. Default: [30]')] = None,
+                                     percent_tax_rate: Annotated[Union[int, float], Field(description='Annual property tax rate in percent. Default: 0')] = 0,
+                                     monthly_home_insurance: Annotated[Union[int, float], Field(description='Default: 0')] = 0,
+                                     hoa_fees: Annotated[Union[int, float], Field(description='Monthly HOA fees. Default: 0')] = 0) -> dict: 
+    '''Mortgage calculation for every combination of down payment, rate and term, computed locally in one pass'''
+    scenarios = mortgage.scenario_grid(price, down_payments, percent_rates, year_terms or [30],
+                                       percent_tax_rate, monthly_home_insurance, hoa_fees)
+    return {'count': len(scenarios), 'scenarios': scenarios}
+
+def _find_rate(document) -> Union[float, None]:
+    '''First numeric `rate`/`average_rate` value in a finance response, searched depth-first'''
+    if isinstance(document, dict):
+        for key in ('average_rate', 'rate'):
+            value = document.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return float(value)
+        children = document.values()
+    elif isinstance(document, list):
+        children = document
+    else:
+        return None
+    for child in children:
+        rate = _find_rate(child)
+        if rate is not None:
+            return rate
+    return None
+
+@tool
+@metrics.instrument
+async def finance_affordability_sweep(listings: Annotated[Union[dict, List[dict], None], Field(description='A for-sale search response or its list of listings; list_price and hoa.fee are read from each')] = None,
+                                      prices: Annotated[Union[List[Union[int, float]], None], Field(description='List prices in USD, when not passing listings')] = None,
+                                      hoa_fees: Annotated[Union[List[Union[int, float]], None], Field(description='Monthly HOA fee per price, when not passing listings')] = None,
+                                      down_payment_percent: Annotated[Union[int, float], Field(description='Down payment as percent of price. Default: 20')] = 20,
+                                      percent_rate: Annotated[Union[int, float, None], Field(description='Annual interest rate in percent. Looked up with finance_average_rate for postal_code when omitted')] = None,
+                                      postal_code: Annotated[Union[int, float, str, None], Field(description='Postal code used to look up the average rate')] = None,
+                                      year_term: Annotated[Union[int, float], Field(description='Default: 30')] = 30,
+                                      percent_tax_rate: Annotated[Union[int, float], Field(description='Annual property tax rate in percent. Default: 0')] = 0,
+                                      monthly_home_insurance: Annotated[Union[int, float], Field(description='Default: 0')] = 0,
+                                      monthly_income: Annotated[Union[int, float, None], Field(description='Gross monthly income, to compute debt-to-income ratios')] = None,
+                                      monthly_debts: Annotated[Union[int, float], Field(description='Other monthly debt payments. Default: 0')] = 0) -> dict: 
+    '''Monthly payment, total interest and affordability for every listing of a search in one vectorized pass.
+    Listings without a list price are returned with null figures'''
+    if isinstance(listings, dict):
+        listings, _ = _listing_page(listings)
+    if listings is not None:
+        ids = [listing.get('property_id') for listing in listings]
+        prices = [listing.get('list_price') for listing in listings]
+        hoa_fees = [(listing.get('hoa') or {}).get('fee') or 0 for listing in listings]
+    else:
+        ids = [None] * len(prices or [])
+        if hoa_fees is not None and len(hoa_fees) != len(prices or []):
+            raise ValueError(f'hoa_fees needs one entry per price: got {len(hoa_fees)} for {len(prices or [])} prices')
+    if not prices:
+        return {'count': 0, 'percent_rate': percent_rate, 'results': []}
+    if percent_rate is None:
+        if postal_code is None:
+            raise ValueError('percent_rate or postal_code is required')
+        percent_rate = _find_rate(await _get(f'{base_url}/finance/average-rate', {'postal_code': postal_code}))
+        if percent_rate is None:
+            raise ValueError(f'No average rate available for postal code {postal_code}')
+    priced = [i for i, price in enumerate(prices) if isinstance(price, (int, float)) and price > 0]
+    results = mortgage.affordability([prices[i] for i in priced], [hoa_fees[i] for i in priced] if hoa_fees else 0, down_payment_percent,
+                                     percent_rate, year_term, percent_tax_rate, monthly_home_insurance, monthly_income, monthly_debts)
+    columns = {name: (values.round(4) if values.dtype.kind == 'f' else values).tolist() for name, values in results.items()}
+    rows = [{'property_id': property_id, 'price': price, **dict.fromkeys(columns)} for property_id, price in zip(ids, prices)]
+    for position, i in enumerate(priced):
+        rows[i].update({name: column[position] for name, column in columns.items()})
+    return {'count': len(rows), 'percent_rate': percent_rate, 'results': rows}
+
+@tool
+@metrics.instrument
+async def local_search(state_code: Annotated[Union[str, None], Field(description='State code')] = None,
+                       city: Annotated[Union[str, None], Field(description='City name')] = None,
+                       postal_code: Annotated[Union[str, None], Field(description='Postal code')] = None,
+                       status: Annotated[Union[str, None], Field(description='Listing status, e.g. for_sale|for_rent|sold')] = None,
+                       price_min: Annotated[Union[int, float, None], Field(description='Minimum list price in USD')] = None,
+                       price_max: Annotated[Union[int, float, None], Field(description='Maximum list price in USD')] = None,
+                       beds_min: Annotated[Union[int, float, None], Field(description='Minimum bedrooms')] = None,
+                       beds_max: Annotated[Union[int, float, None], Field(description='Maximum bedrooms')] = None,
+                       baths_min: Annotated[Union[int, float, None], Field(description='Minimum bathrooms')] = None,
+                       baths_max: Annotated[Union[int, float, None], Field(description='Maximum bathrooms')] = None,
+                       sqft_min: Annotated[Union[int, float, None], Field(description='Minimum home size in sqft')] = None,
+                       sqft_max: Annotated[Union[int, float, None], Field(description='Maximum home size in sqft')] = None,
+                       listed_after: Annotated[Union[str, None], Field(description='Only listings listed on or after this ISO date')] = None,
+                       sort: Annotated[Union[Literal['newest', 'oldest', 'lowest_price', 'highest_price', 'largest_sqft', 'smallest_sqft', 'most_beds'], None], Field(description='Sort order. Default is store order')] = None,
+                       limit: Annotated[int, Field(description='Number of results. Default: 42')] = 42,
+                       offset: Annotated[int, Field(description='Offset results. Default: 0')] = 0,
+                       fields: Annotated[Union[str, List[str], None], Field(description='Fields to return, as for v3_for_sale')] = None) -> dict: 
+    '''Filter and sort listings already retrieved by earlier searches, without calling upstream. Run a search tool first for areas not yet covered.
+    Stored listings keep the search_summary fields (no photos or other media)'''
+    total, results = listing_store.query(
+        sort=sort, limit=limit, offset=offset, state_code=state_code, city=city, postal_code=postal_code, status=status,
+        listed_after=listed_after, price_min=price_min, price_max=price_max, beds_min=beds_min, beds_max=beds_max,
+        baths_min=baths_min, baths_max=baths_max, sqft_min=sqft_min, sqft_max=sqft_max)
+    return project({'status': 200, 'data': {'home_search': {'total': total, 'count': len(results), 'results': results}}}, fields)
+
+def _nearby_response(positions, distances, total: int) -> dict:
+    results = [{**listing, 'distance_miles': round(float(distance), 3)}
+               for listing, distance in zip(listing_store.listings_at(positions), distances)]
+    return {'status': 200, 'data': {'home_search': {'total': total, 'count': len(results), 'results': results}}}
+
+@tool
+@metrics.instrument
+async def local_radius_search(latitude: Annotated[Union[int, float], Field(description='Center latitude')],
+                              longitude: Annotated[Union[int, float], Field(description='Center longitude')],
+                              radius_miles: Annotated[Union[int, float], Field(description='Search radius in miles')],
+                              limit: Annotated[int, Field(description='Number of results, nearest first. Default: 42')] = 42,
+                              fields: Annotated[Union[str, List[str], None], Field(description='Fields to return, as for v3_for_sale')] = None) -> dict: 
+    '''Listings already retrieved by earlier searches within a radius of a point, nearest first, without calling upstream.
+    Stored listings keep the search_summary fields (no photos or other media)'''
+    positions, distances = listing_store.spatial().radius(latitude, longitude, radius_miles)
+    return project(_nearby_response(positions[:limit], distances[:limit], len(positions)), fields)
+
+@tool
+@metrics.instrument
+async def local_bbox_search(south: Annotated[Union[int, float], Field(description='Minimum latitude')],
+                            west: Annotated[Union[int, float], Field(description='Minimum longitude')],
+                            north: Annotated[Union[int, float], Field(description='Maximum latitude')],
+                            east: Annotated[Union[int, float], Field(description='Maximum longitude')],
+                            limit: Annotated[int, Field(description='Number of results. Default: 42')] = 42,
+                            fields: Annotated[Union[str, List[str], None], Field(description='Fields to return, as for v3_for_sale')] = None) -> dict: 
+    '''Listings already retrieved by earlier searches inside a latitude/longitude box, without calling upstream.
+    Stored listings keep the search_summary fields (no photos or other media)'''
+    positions = listing_store.spatial().bbox(south, west, north, east)
+    results = listing_store.listings_at(positions[:limit])
+    return project({'status': 200, 'data': {'home_search': {'total': len(positions), 'count': len(results), 'results': results}}}, fields)
+
+@tool
+@metrics.instrument
+async def local_nearest(latitude: Annotated[Union[int, float], Field(description='Latitude')],
+                        longitude: Annotated[Union[int, float], Field(description='Longitude')],
+                        k: Annotated[int, Field(description='Number of listings. Default: 10')] = 10,
+                        fields: Annotated[Union[str, List[str], None], Field(description='Fields to return, as for v3_for_sale')] = None) -> dict: 
+    '''The k listings nearest to a point among those already retrieved by earlier searches, without calling upstream.
+    Stored listings keep the search_summary fields (no photos or other media)'''
+    positions, distances = listing_store.spatial().nearest(latitude, longitude, k)
+    return project(_nearby_response(positions, distances, len(positions)), fields)
+
+async def _subject_row(subject: Union[str, dict]) -> dict:
+    '''Columnar attributes of a comps subject: a stored or fetched property_id, a listing, or explicit attributes'''
+    if isinstance(subject, dict):
+        if 'latitude' in subject or 'lat' in subject:
+            return {'lat': subject.get('latitude', subject.get('lat')), 'lon': subject.get('longitude', subject.get('lon')),
+                    'beds': subject.get('beds'), 'baths': subject.get('baths'), 'sqft': subject.get('sqft')}
+        return listing_row(subject)
+    position = listing_store.position(subject)
+    if position is not None:
+        return {**listing_row(listing_store.listing(position)), 'position': position}
+    detail = await _get(f'{base_url}/v3/property-detail', {'property_id': subject})
+    return listing_row(detail.get('data') or {})
+
+@tool
+@metrics.instrument
+async def local_comps(subjects: Annotated[List[Union[str, dict]], Field(description='Properties to value: property_ids, listings, or {latitude, longitude, beds, baths, sqft} objects')],
+                      k: Annotated[int, Field(description='Comparable sales per subject. Default: 5')] = 5,
+                      max_distance_miles: Annotated[Union[int, float], Field(description='Only use sales within this distance. Default: 5')] = 5,
+                      sold_within_days: Annotated[Union[int, float], Field(description='Only use sales this recent. Default: 365')] = 365) -> dict: 
+    '''Estimate values from the k most similar recent sales among sold listings already retrieved (run sold_homes or v2_sold_homes_by_zipcode first)'''
+    rows = await asyncio.gather(*(_subject_row(subject) for subject in subjects))
+    valuations = comparable_sales(listing_store, list(rows), k, max_distance_miles, sold_within_days)
+    return {'count': len(valuations), 'results': [{'subject': subject if isinstance(subject, str) else subject.get('property_id'), **valuation}
+                                                 for subject, valuation in zip(subjects, valuations)]}
+
+saved_searches = {}
+
+# Each watchable search's newest-first sort; the rent endpoints spell theirs differently.
+newest_sorts = {
+    'v3_for_sale': 'newest',
+    'v2_for_sale': 'newest',
+    'v2_for_sale_by_zipcode': 'newest',
+    'for_sale': 'newest',
+    'v2_for_rent': 'frehsnest',
+    'for_rent': 'frehsnest',
+}
+
+async def _poll(search: SavedSearch) -> dict:
+    url = f'{base_url}{paginated_endpoints[search.endpoint]}'
+    params = {k: v for k, v in search.params.items() if v is not None and k not in ('offset', 'limit', 'sort')}
+    fetched = []
+    complete = False
+    for page in range(search.max_pages):
+        offset = page * search.page_size
+        if offset > max_offset:
+            break
+        results, total = _listing_page(await _get(url, {**params, 'sort': newest_sorts[search.endpoint], 'offset': offset, 'limit': search.page_size}))
+        fetched.extend(results)
+        if not results or (total is not None and offset + len(results) >= total):
+            complete = True
+            break
+        if search.reached_watermark(results):
+            break
+    deltas = search.update(fetched, complete)
+    return {'fetched': len(fetched), 'tracked': len(search.seen), **deltas}
+
+@tool
+@metrics.instrument
+async def watch_search(name: Annotated[str, Field(description='Name for this saved search')],
+                       endpoint: Annotated[Literal['v3_for_sale', 'v2_for_sale', 'for_sale', 'v2_for_sale_by_zipcode', 'v2_for_rent', 'for_rent'], Field(description='Search tool to watch')],
+                       params: Annotated[dict, Field(description='Arguments for that tool, without offset, limit and sort')],
+                       page_size: Annotated[int, Field(description='Listings per upstream page. Default: 42')] = 42,
+                       max_pages: Annotated[int, Field(description='Most pages fetched per poll. Default: 5')] = 5) -> dict: 
+    '''Save a search and take its baseline; later poll_search calls return only what changed since the previous poll'''
+    search = saved_searches[name] = SavedSearch(endpoint, params, page_size, max_pages)
+    return await _poll(search)
+
+@tool
+@metrics.instrument
+async def poll_search(name: Annotated[str, Field(description='Name of a search saved with watch_search')]) -> dict: 
+    '''Listings added, removed or price-changed since the last poll of a saved search, paging newest-first only until already-seen listings'''
+    if name not in saved_searches:
+        raise ValueError(f'No saved search named {name!r}')
+    return await _poll(saved_searches[name])
+
+@tool
+@metrics.instrument
+async def unwatch_search(name: Annotated[str, Field(description='Name of a search saved with watch_search')]) -> dict: 
+    '''Forget a saved search'''
+    return {'removed': saved_searches.pop(name, None) is not None}
 
 
 if __name__ == '__main__':
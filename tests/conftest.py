@@ -0,0 +1,31 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    '''Start a MockUpstream with the given options and point the server at it, with a fresh client,
+    rate limiter, quota and retry counters'''
+    import server
+    from mockupstream import MockUpstream
+    from ratelimit import QuotaBudget, RateLimiter, RetryPolicy
+    limiter, policy = server.rate_limiter, server.retry_policy
+    monkeypatch.setattr(server, 'rate_limiter', RateLimiter(limiter.rate, limiter.burst, limiter.endpoint_limits))
+    monkeypatch.setattr(server, 'quota', QuotaBudget(server.quota.reserve, server.quota.daily_budget))
+    monkeypatch.setattr(server, 'retry_policy', RetryPolicy(policy.max_attempts, policy.base_delay, policy.max_delay, policy.deadline))
+    mocks = []
+
+    def start(**options):
+        mock = MockUpstream(**options).start()
+        mocks.append(mock)
+        monkeypatch.setattr(server, 'base_url', mock.url)
+        monkeypatch.setattr(server, 'client', None)
+        return mock
+
+    yield start
+    for mock in mocks:
+        mock.stop()
@@ -0,0 +1,26 @@
+import asyncio
+
+import pytest
+
+import server
+
+
+def sweep(**arguments):
+    return asyncio.run(server.finance_affordability_sweep.fn(percent_rate=6.5, **arguments))
+
+
+def test_listings_without_a_price_get_null_figures():
+    listings = [{'property_id': '1', 'list_price': 300000, 'hoa': {'fee': 200}},
+                {'property_id': '2', 'list_price': None, 'hoa': {'fee': 200}},
+                {'property_id': '3'}]
+    outcome = sweep(listings=listings, monthly_income=4000, monthly_home_insurance=100)
+    first, unpriced, missing = outcome['results']
+    assert first['monthly_payment'] > 1500 and first['affordable'] is False
+    for row in (unpriced, missing):
+        assert row['monthly_payment'] is None
+        assert row['affordable'] is None
+
+
+def test_mismatched_hoa_fees_are_rejected():
+    with pytest.raises(ValueError, match='hoa_fees'):
+        sweep(prices=[300000, 400000], hoa_fees=[100])
@@ -0,0 +1,17 @@
+import asyncio
+import json
+
+import server
+from cache import make_key
+
+
+def test_upstream_error_bodies_are_reported_as_errors(upstream, tmp_path):
+    fixtures = tmp_path / 'fixtures.jsonl'
+    fixtures.write_text(json.dumps({'key': make_key('/v3/property-detail', {'property_id': '1000000404'}),
+                                    'status': 404, 'body': {'message': 'Property not found'}}) + '\n')
+    upstream(fixtures=str(fixtures))
+    outcome = asyncio.run(server.batch_property_detail.fn(['1000000001', '1000000404']))
+    assert list(outcome['results']) == ['1000000001']
+    assert outcome['results']['1000000001']['data']['property_id'] == '1000000001'
+    assert list(outcome['errors']) == ['1000000404']
+    assert 'Property not found' in outcome['errors']['1000000404']
@@ -0,0 +1,28 @@
+from listings import ListingStore, comparable_sales, listing_row
+from mockupstream import synthetic_listing
+
+
+def test_only_sold_listings_are_comps():
+    sold = synthetic_listing(1, 'sold')
+    resold = {**synthetic_listing(2, 'for_sale'), 'last_sold_price': 250000, 'last_sold_date': sold['last_sold_date']}
+    store = ListingStore()
+    store.add([sold, resold])
+    [valuation] = comparable_sales(store, [listing_row(synthetic_listing(3))], k=5, max_distance_miles=50, sold_within_days=100000)
+    assert [comp['property_id'] for comp in valuation['comps']] == [sold['property_id']]
+
+
+def test_subject_is_never_its_own_comp():
+    listings = [synthetic_listing(index, 'sold') for index in (1, 2)]
+    store = ListingStore()
+    store.add(listings)
+    position = store.position(listings[0]['property_id'])
+    [valuation] = comparable_sales(store, [{**listing_row(listings[0]), 'position': position}], k=5,
+                                   max_distance_miles=50, sold_within_days=100000)
+    assert [comp['property_id'] for comp in valuation['comps']] == [listings[1]['property_id']]
+
+
+def test_subject_without_a_location_gets_no_estimate():
+    store = ListingStore()
+    store.add([synthetic_listing(1, 'sold')])
+    [valuation] = comparable_sales(store, [{'beds': 3, 'sqft': 1500}], sold_within_days=100000)
+    assert valuation == {'comps': [], 'price_per_sqft': None, 'estimate_value': None}
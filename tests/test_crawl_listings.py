@@ -0,0 +1,45 @@
+import asyncio
+
+import server
+
+
+def crawl(**options):
+    return asyncio.run(server.crawl_listings.fn('v3_for_sale', {'state_code': 'IL'}, **options))
+
+
+def test_partitions_cover_a_search_past_the_offset_ceiling(upstream, monkeypatch):
+    upstream(listings=500)
+    monkeypatch.setattr(server, 'max_offset', 100)
+    outcome = crawl(page_size=50)
+    assert outcome['partitions'] > 1
+    assert outcome['total'] == outcome['count'] == 500
+    assert not outcome['truncated']
+
+
+def test_search_without_a_count_is_paged_through(upstream, monkeypatch):
+    upstream(listings=500)
+
+    async def no_count(endpoint, params):
+        return None
+
+    monkeypatch.setattr(server, 'result_count', no_count)
+    outcome = crawl(page_size=100)
+    assert outcome['total'] is None
+    assert outcome['count'] == 500
+    assert not outcome['truncated']
+
+
+def test_listings_no_part_matches_mark_the_crawl_truncated(upstream, monkeypatch):
+    upstream(listings=500)
+    monkeypatch.setattr(server, 'max_offset', 100)
+    count = server.result_count
+
+    async def count_with_unmatched(endpoint, params):
+        total = await count(endpoint, params)
+        return total + 7 if params.get('price_max') is None and params.get('price_min') is None else total
+
+    monkeypatch.setattr(server, 'result_count', count_with_unmatched)
+    outcome = crawl(page_size=50)
+    assert outcome['total'] == 507
+    assert outcome['count'] == 500
+    assert outcome['truncated']
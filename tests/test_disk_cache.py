@@ -0,0 +1,85 @@
+import asyncio
+import os
+
+import server
+from cache import DiskCache, ResponseCache
+
+
+def stored_bytes(cache: DiskCache) -> int:
+    return cache.stats()['bytes']
+
+
+def test_running_total_follows_writes_replacements_and_evictions(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache.db'), max_bytes=20000, level=0)
+    for index in range(30):
+        cache.put(f'key-{index}', os.urandom(1000), ttl=60)
+        cache.put(f'key-{index // 2}', os.urandom(500 + index), ttl=60)
+        assert cache._size == stored_bytes(cache)
+    assert cache.evictions > 0
+    assert stored_bytes(cache) <= cache.max_bytes
+    cache.clear()
+    assert cache._size == stored_bytes(cache) == 0
+
+
+def test_total_picks_up_other_processes_writes(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    cache = DiskCache(path, max_bytes=10 ** 9, refresh_every=5)
+    other = DiskCache(path)
+    cache.put('mine', b'x' * 100, ttl=60)
+    other.put('theirs', os.urandom(2000), ttl=60)
+    assert cache._size < stored_bytes(cache)
+    for index in range(cache.refresh_every):
+        cache.put(f'mine-{index}', b'x' * 100, ttl=60)
+    assert cache._size == stored_bytes(cache)
+
+
+def test_total_is_not_summed_on_every_write(tmp_path, monkeypatch):
+    cache = DiskCache(str(tmp_path / 'cache.db'), refresh_every=100)
+    sums = []
+    total = cache._total
+    monkeypatch.setattr(cache, '_total', lambda: sums.append(1) or total())
+    for index in range(250):
+        cache.put(f'key-{index}', b'body', ttl=60)
+    assert len(sums) == 3
+
+
+def accessed(cache: DiskCache, key: str) -> float:
+    return cache._conn.execute('SELECT accessed FROM entries WHERE key = ?', (key,)).fetchone()[0]
+
+
+def test_read_times_are_written_back_in_batches(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache.db'), touch_batch=3)
+    for key in ('a', 'b', 'c'):
+        cache.put(key, b'body', ttl=60)
+    written = {key: accessed(cache, key) for key in 'abc'}
+    cache.get('a')
+    cache.get('b')
+    assert {key: accessed(cache, key) for key in 'abc'} == written
+    cache.get('c')
+    assert all(accessed(cache, key) > written[key] for key in 'abc')
+
+
+def test_eviction_sees_unflushed_reads(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache.db'), max_bytes=2500, level=0)
+    cache.put('old', os.urandom(1000), ttl=60)
+    cache.put('new', os.urandom(1000), ttl=60)
+    assert cache.get('old') is not None
+    cache.put('newest', os.urandom(1000), ttl=60)
+    assert cache.get('old') is not None
+    assert cache.get('new') is None
+
+
+def test_server_reads_through_the_disk_tier(upstream, monkeypatch, tmp_path):
+    mock = upstream()
+    monkeypatch.setattr(server, 'disk_cache', DiskCache(str(tmp_path / 'cache.db')))
+    url = f'{server.base_url}/finance/rate-trends'
+
+    async def get_after_restart():
+        monkeypatch.setattr(server, 'response_cache', ResponseCache())
+        return await server._get(url, {'is_refinance': False})
+
+    first = asyncio.run(get_after_restart())
+    second = asyncio.run(get_after_restart())
+    assert first == second
+    assert mock.counts['requests'] == 1
+    assert server.disk_cache.hits == 1
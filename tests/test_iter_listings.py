@@ -0,0 +1,37 @@
+import asyncio
+
+import pydantic
+import pytest
+
+import server
+
+
+def collect(**options):
+    async def run():
+        return [listing async for listing in server.iter_listings('/v3/for-sale', {'city': 'Springfield'}, **options)]
+    return asyncio.run(run())
+
+
+def test_small_result_set_is_fetched_with_one_request(upstream):
+    mock = upstream(listings=150)
+    listings = collect(page_size=200, prefetch=4)
+    assert len(listings) == 150
+    assert mock.counts['requests'] == 1
+
+
+def test_pages_stop_at_the_reported_total(upstream):
+    mock = upstream(listings=450)
+    listings = collect(page_size=100, prefetch=4)
+    assert len({listing['property_id'] for listing in listings}) == 450
+    assert mock.counts['requests'] == 5
+
+
+def test_zero_prefetch_still_pages_through(upstream):
+    upstream(listings=450)
+    assert len(collect(page_size=100, prefetch=0)) == 450
+
+
+def test_search_all_pages_rejects_empty_pages_and_prefetch():
+    for arguments in ({'prefetch': 0}, {'page_size': 0}, {'page_size': 201}):
+        with pytest.raises(pydantic.ValidationError):
+            asyncio.run(server.search_all_pages.run({'endpoint': 'v3_for_sale', 'params': {}, **arguments}))
@@ -0,0 +1,20 @@
+from listings import ListingStore, listing_row
+from mockupstream import synthetic_listing
+
+
+def test_listings_are_stored_in_summary_form():
+    listing = {**synthetic_listing(1, 'sold'), 'hoa': {'fee': 120}, 'virtual_tours': [{'href': 'https://tour'}]}
+    store = ListingStore()
+    store.add([listing])
+    stored = store.listing(store.position(listing['property_id']))
+    assert 'photos' not in stored and 'virtual_tours' not in stored
+    assert stored['primary_photo'] == listing['primary_photo']
+    assert stored['hoa'] == {'fee': 120}
+    assert listing_row(stored) == listing_row(listing)
+
+
+def test_whole_listings_are_kept_without_fields():
+    listing = synthetic_listing(1)
+    store = ListingStore(fields=None)
+    store.add([listing])
+    assert store.listing(0) is listing
@@ -0,0 +1,21 @@
+import pytest
+
+import mortgage
+
+
+def test_zero_term_is_rejected():
+    with pytest.raises(ValueError, match='year_term'):
+        mortgage.calculate(100000, 0, 3, 0, 0, 0, 0)
+
+
+@pytest.mark.parametrize('year_terms', [[30, 0], [-15], [float('nan')]])
+def test_scenario_grid_rejects_terms_calculate_rejects(year_terms):
+    with pytest.raises(ValueError, match='year_term'):
+        mortgage.scenario_grid(400000, [80000], [6.5], year_terms, 0, 0, 0)
+
+
+def test_calculate_many_matches_calculate():
+    single = mortgage.calculate(400000, 80000, 6.5, 30, 1.2, 100, 50)['data']['mortgage']
+    many = mortgage.calculate_many([400000, 500000], 80000, 6.5, 30, 1.2, 100, 50)
+    assert round(float(many['monthly_payment'][0]), 2) == single['monthly_payment']
+    assert round(float(many['loan_amount'][0]), 2) == single['loan_amount']
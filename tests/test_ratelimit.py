@@ -0,0 +1,26 @@
+import pytest
+
+from ratelimit import QuotaBudget, QuotaExceeded, parse_endpoint_limits
+
+
+def test_endpoint_limits_are_parsed_from_path_rate_burst_entries():
+    assert parse_endpoint_limits('') == {}
+    assert parse_endpoint_limits('/v3/for-sale:2:4, /v2/for-sale:0.5:1') == {'/v3/for-sale': (2.0, 4.0), '/v2/for-sale': (0.5, 1.0)}
+
+
+@pytest.mark.parametrize('text', ['/v3/for-sale:2', 'v3/for-sale:2:4', '/v3/for-sale:0:4', '/v3/for-sale:2:x'])
+def test_malformed_endpoint_limits_are_rejected(text):
+    with pytest.raises(ValueError):
+        parse_endpoint_limits(text)
+
+
+def test_concurrent_calls_cannot_spend_the_same_quota():
+    quota = QuotaBudget(reserve=1)
+    quota.record({'x-ratelimit-requests-remaining': '3'})
+    quota.check()
+    quota.check()
+    with pytest.raises(QuotaExceeded):
+        quota.check()
+    assert quota.remaining == 1
+    quota.record({'x-ratelimit-requests-remaining': '2'})
+    quota.check()
@@ -0,0 +1,55 @@
+import asyncio
+import socket
+import time
+
+import httpx
+import pytest
+
+import server
+from ratelimit import RetryPolicy
+
+path = '/v3/property-detail'
+
+
+def get(monkeypatch, **policy):
+    monkeypatch.setattr(server, 'retry_policy', RetryPolicy(**policy))
+    start = time.monotonic()
+    body = asyncio.run(server._get(f'{server.base_url}{path}', {'property_id': '1000000001'}))
+    return body, time.monotonic() - start
+
+
+def test_retry_after_replaces_the_computed_delay(upstream, monkeypatch):
+    mock = upstream(throttle_rate=1.0, retry_after=0.4)
+    body, elapsed = get(monkeypatch, max_attempts=2, base_delay=0.0, max_delay=0.0)
+    assert 'rate limit' in body['message']
+    assert mock.counts['requests'] == 2
+    assert elapsed >= 0.4
+    assert server.retry_policy.stats() == {'retries': {path: 1}, 'exhausted': {path: 1}}
+
+
+def test_no_retry_that_would_end_past_the_deadline(upstream, monkeypatch):
+    mock = upstream(throttle_rate=1.0, retry_after=5)
+    body, elapsed = get(monkeypatch, max_attempts=3, deadline=1.0)
+    assert mock.counts['requests'] == 1
+    assert elapsed < 1.0
+    assert server.retry_policy.stats() == {'retries': {}, 'exhausted': {path: 1}}
+
+
+def test_failed_attempts_are_retried_until_one_succeeds(upstream, monkeypatch):
+    mock = upstream(error_rate=0.5, seed=3)
+    body, _ = get(monkeypatch, max_attempts=10, base_delay=0.01)
+    assert body['data']['property_id'] == '1000000001'
+    assert mock.counts['errors'] >= 1
+    assert server.retry_policy.retries[path] == mock.counts['errors']
+    assert server.retry_policy.exhausted[path] == 0
+
+
+def test_transport_error_on_the_last_attempt_is_raised(upstream, monkeypatch):
+    upstream()
+    with socket.socket() as closed:
+        closed.bind(('127.0.0.1', 0))
+        port = closed.getsockname()[1]
+    monkeypatch.setattr(server, 'base_url', f'http://127.0.0.1:{port}')
+    with pytest.raises(httpx.ConnectError):
+        get(monkeypatch, max_attempts=2, base_delay=0.01)
+    assert server.retry_policy.stats() == {'retries': {path: 1}, 'exhausted': {path: 1}}
@@ -0,0 +1,116 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+import server
+from cache import DiskCache, ResponseCache, SingleFlight
+from ratelimit import RetryPolicy
+
+path = '/finance/rate-trends'
+payload = {'is_refinance': True}
+stale_body = {'status': 200, 'data': {'cached': True}}
+
+
+@pytest.fixture
+def stale(upstream, monkeypatch):
+    '''A mock upstream with a stale-but-servable copy of the rate trends response in the memory tier'''
+    mock = upstream(latency=0.3)
+    monkeypatch.setattr(server, 'response_cache', ResponseCache())
+    monkeypatch.setattr(server, 'disk_cache', None)
+    monkeypatch.setattr(server, 'inflight', SingleFlight())
+    monkeypatch.setattr(server, 'revalidate_errors', {})
+    monkeypatch.setattr(server, 'revalidate_backoff', 0)
+    monkeypatch.setattr(server, 'retry_policy', RetryPolicy(max_attempts=1))
+    server.response_cache.put(key(), json.dumps(stale_body).encode(), ttl=0, stale_ttl=60)
+    return mock
+
+
+def key():
+    return server.make_key(f'{server.base_url}{path}', payload)
+
+
+async def get():
+    start = time.monotonic()
+    document = await server._get(f'{server.base_url}{path}', payload)
+    return document, time.monotonic() - start
+
+
+async def refreshed():
+    await asyncio.gather(*server.revalidations)
+
+
+def test_stale_hit_is_served_at_once_and_refreshed_once_in_the_background(stale):
+    async def run():
+        (first, elapsed), (second, _) = await asyncio.gather(get(), get())
+        assert first == second == stale_body
+        assert elapsed < 0.1
+        assert stale.counts['requests'] == 0
+        await refreshed()
+        assert stale.counts['requests'] == 1
+        document, _ = await get()
+        assert document['data'] == {}
+        assert 'stale' not in document
+    asyncio.run(run())
+
+
+def test_failed_refresh_flags_responses_until_a_refresh_succeeds(stale):
+    async def run():
+        stale.error_rate = 1.0
+        await get()
+        await refreshed()
+        document, _ = await get()
+        assert document['stale'] is True
+        assert document['stale_reason'] == 'HTTP 503'
+        assert document['data'] == stale_body['data']
+
+        stale.error_rate = 0.0
+        await refreshed()
+        document, _ = await get()
+        assert 'stale' not in document and 'stale_reason' not in document
+        assert document['data'] == {}
+        assert key() not in server.revalidate_errors
+    asyncio.run(run())
+
+
+def test_failed_refresh_backs_off(stale, monkeypatch):
+    monkeypatch.setattr(server, 'revalidate_backoff', 60)
+
+    async def run():
+        stale.error_rate = 1.0
+        await get()
+        await refreshed()
+        for _ in range(3):
+            await get()
+        await refreshed()
+        assert stale.counts['requests'] == 1
+    asyncio.run(run())
+
+
+def test_entries_past_the_hard_ttl_are_not_served(stale):
+    server.response_cache.put(key(), json.dumps(stale_body).encode(), ttl=0, stale_ttl=0.05)
+    time.sleep(0.1)
+    assert server.response_cache.get(key()) is None
+    document, elapsed = asyncio.run(get())
+    assert document['data'] == {}
+    assert stale.counts['requests'] == 1
+    assert elapsed >= 0.3
+
+
+def test_disk_entries_past_the_hard_ttl_are_not_served(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache.db'))
+    cache.put('key', b'body', ttl=0.02, stale_ttl=0.03)
+    body, fresh_left, left = cache.get('key')
+    assert body == b'body' and fresh_left <= 0.02 and left <= 0.05
+    time.sleep(0.06)
+    assert cache.get('key') is None
+
+
+def test_memory_entries_go_stale_after_the_soft_ttl():
+    cache = ResponseCache()
+    cache.put('key', b'body', ttl=0.02, stale_ttl=60)
+    assert cache.get('key') == (b'body', True)
+    time.sleep(0.04)
+    assert cache.get('key') == (b'body', False)
+    assert cache.stats()['stale_hits'] == 1
@@ -0,0 +1,85 @@
+import asyncio
+import json
+
+import pytest
+
+import server
+from jsonstream import ArrayStream, stream_array
+from mockupstream import synthetic_listing
+from projection import project
+
+paths = [('data', 'home_search', 'results')]
+
+
+async def v3_for_sale(**arguments):
+    tools = await server.mcp.get_tools()
+    return await tools['v3_for_sale'].fn(**arguments)
+
+
+def page(count=5):
+    results = [synthetic_listing(index) for index in range(count)]
+    return {'status': 200, 'data': {'home_search': {'total': count, 'count': count, 'results': results}}, 'meta': [1, 2.5]}
+
+
+@pytest.mark.parametrize('size', [1, 7, 4096])
+def test_elements_arrive_one_by_one_in_any_chunking(size):
+    document = page()
+    text = json.dumps(document, indent=1)
+    seen = []
+    decoded = stream_array((text[i:i + size] for i in range(0, len(text), size)), paths, lambda item: seen.append(item) or item)
+    assert seen == document['data']['home_search']['results']
+    assert decoded == document
+
+
+def test_callback_result_replaces_the_element_and_none_drops_it():
+    text = json.dumps(page())
+    decoded = stream_array([text], paths, lambda item: {'id': item['property_id']} if item['list_price'] > 120000 else None)
+    expected = [{'id': listing['property_id']} for listing in page()['data']['home_search']['results'] if listing['list_price'] > 120000]
+    assert decoded['data']['home_search']['results'] == expected
+
+
+def test_elements_are_streamed_before_the_document_ends():
+    text = json.dumps(page())
+    seen = []
+    stream = ArrayStream(paths, seen.append)
+    stream.feed(text[:text.index('"property_id": "1000000002"')])
+    assert [item['property_id'] for item in seen] == ['1000000000', '1000000001']
+
+
+def test_documents_without_the_array_are_parsed_whole():
+    for document in [{'message': 'Service Unavailable'}, {'data': {'home_search': None}}, [1, {'a': '["x"]'}], 42]:
+        assert stream_array([json.dumps(document)], paths, lambda item: item) == document
+
+
+def test_a_truncated_document_raises():
+    text = json.dumps(page())
+    with pytest.raises(json.JSONDecodeError):
+        stream_array([text[:len(text) // 2]], paths, lambda item: item)
+
+
+@pytest.mark.parametrize('fields', ['search_summary', ['data.home_search.total', '-data.home_search.results.photos'],
+                                    ['data.home_search.total']])
+def test_streamed_search_matches_projecting_the_whole_page(upstream, monkeypatch, fields):
+    upstream(listings=300)
+    monkeypatch.setattr(server, 'listing_store', server.ListingStore())
+    streams = []
+    monkeypatch.setattr(server, 'ArrayStream', lambda *args: streams.append(ArrayStream(*args)) or streams[-1])
+
+    async def both():
+        return await v3_for_sale(state_code='IL', limit=200, fields=fields), await v3_for_sale(state_code='IL', limit=200)
+
+    streamed, whole = asyncio.run(both())
+    assert streamed == project(whole, fields)
+    assert len(streams) == 1 and streams[0].path == ('data', 'home_search', 'results')
+    assert len(server.listing_store) == 200
+
+
+def test_streamed_search_returns_an_error_body(upstream, monkeypatch):
+    upstream(error_rate=1.0)
+    monkeypatch.setattr(server.retry_policy, 'max_attempts', 1)
+
+    async def both():
+        return await v3_for_sale(state_code='IL', fields=['message']), await v3_for_sale(state_code='IL')
+
+    streamed, whole = asyncio.run(both())
+    assert streamed == whole == {'message': 'Service Unavailable'}
@@ -0,0 +1,18 @@
+import asyncio
+
+import pydantic
+import pytest
+
+import server
+
+
+@pytest.mark.parametrize('tool, arguments', [
+    (server.bulk_fetch_listings, {'endpoint': 'v3_for_sale', 'params': {}, 'concurrency': 0}),
+    (server.bulk_fetch_listings, {'endpoint': 'v3_for_sale', 'params': {}, 'page_size': 0}),
+    (server.crawl_listings, {'endpoint': 'v3_for_sale', 'params': {}, 'concurrency': 0}),
+    (server.crawl_listings, {'endpoint': 'v3_for_sale', 'params': {}, 'page_size': 201}),
+    (server.batch_property_detail, {'property_ids': ['1000000001'], 'concurrency': 0}),
+])
+def test_fan_out_tools_reject_arguments_that_would_hang(tool, arguments):
+    with pytest.raises(pydantic.ValidationError):
+        asyncio.run(tool.run(arguments))
@@ -0,0 +1,30 @@
+import asyncio
+
+import server
+from cache import DiskCache, ResponseCache
+
+path = '/finance/rate-trends'
+payload = {'is_refinance': True}
+
+
+def test_restart_warms_from_the_disk_tier_without_calling_upstream(upstream, monkeypatch, tmp_path):
+    mock = upstream()
+    monkeypatch.setattr(server, 'warm_set', [(path, payload)])
+    monkeypatch.setattr(server, 'warm_stats', {'refreshed': 0, 'skipped_budget': 0, 'errors': 0, 'day': None, 'used_today': 0})
+    monkeypatch.setattr(server, 'disk_cache', DiskCache(str(tmp_path / 'cache.db')))
+    monkeypatch.setattr(server, 'response_cache', ResponseCache())
+    asyncio.run(server._warm_once())
+    assert mock.counts['requests'] == 1
+
+    monkeypatch.setattr(server, 'response_cache', ResponseCache())
+    asyncio.run(server._warm_once())
+    assert mock.counts['requests'] == 1
+    assert server.response_cache.remaining(server.make_key(f'{server.base_url}{path}', payload)) > server.warm_refresh_ahead
+    assert server.warm_stats['refreshed'] == 1
+
+
+def test_server_stats_reports_the_warmer(monkeypatch):
+    monkeypatch.setattr(server, 'warm_stats', {'refreshed': 2, 'skipped_budget': 1, 'errors': 0, 'day': None, 'used_today': 2})
+    stats = asyncio.run(server.server_stats.fn())
+    assert stats['warmer']['refreshed'] == 2
+    assert 'us_real_estate_warmer_refreshed 2' in asyncio.run(server.server_stats.fn('prometheus'))
@@ -0,0 +1,25 @@
+import asyncio
+
+import pytest
+
+import server
+from listings import SavedSearch
+
+
+@pytest.mark.parametrize('endpoint, sort', [('v3_for_sale', 'newest'), ('for_sale', 'newest'),
+                                            ('v2_for_rent', 'frehsnest'), ('for_rent', 'frehsnest')])
+def test_poll_uses_the_endpoints_newest_sort(monkeypatch, endpoint, sort):
+    requests = []
+
+    async def get(url, payload):
+        requests.append(payload)
+        return {'data': {'home_search': {'total': 0, 'results': []}}}
+
+    monkeypatch.setattr(server, '_get', get)
+    asyncio.run(server._poll(SavedSearch(endpoint, {'city': 'Springfield', 'sort': 'lowest_price'})))
+    assert [payload['sort'] for payload in requests] == [sort]
+
+
+def test_every_watchable_endpoint_has_a_newest_sort():
+    watchable = server.watch_search.parameters['properties']['endpoint']['enum']
+    assert sorted(server.newest_sorts) == sorted(watchable)
@@ -0,0 +1,78 @@
+'''Precomputed input schemas for the MCP tools, so startup skips pydantic schema generation.
+
+Each entry is stored with a digest of the tool's name, docstring, annotated
+signature and the fastmcp/pydantic versions. A tool whose digest no longer
+matches builds its schema at startup as before, so a stale file only costs
+time. Regenerate it after changing tools:
+
+Usage: python toolschemas.py
+'''
+import asyncio
+import hashlib
+import inspect
+import json
+import os
+from typing import Callable
+
+import fastmcp
+import pydantic
+from fastmcp.tools.tool import FunctionTool
+
+default_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tool_schemas.json')
+
+
+def signature_digest(fn: Callable) -> str:
+    text = '\n'.join((fn.__name__, fn.__doc__ or '', repr(inspect.signature(fn)), fastmcp.__version__, pydantic.VERSION))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ToolSchemas:
+    '''Tool input schemas loaded from `path`, keyed by tool name'''
+
+    def __init__(self, path: str = default_path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        try:
+            with open(path) as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def build(self, fn: Callable) -> FunctionTool:
+        '''The tool for `fn`, with its cached schema when the entry is current.
+        pydantic still validates arguments; that adapter is built on the tool's first call.'''
+        entry = self.entries.get(fn.__name__)
+        if entry is not None and entry['digest'] == signature_digest(fn):
+            self.hits += 1
+            return FunctionTool(fn=fn, name=fn.__name__, description=fn.__doc__, parameters=entry['parameters'], tags=set())
+        self.misses += 1
+        return FunctionTool.from_function(fn)
+
+    def tool(self, mcp: fastmcp.FastMCP) -> Callable[[Callable], FunctionTool]:
+        '''Decorator registering a function on `mcp`, like `mcp.tool()`'''
+        def register(fn: Callable) -> FunctionTool:
+            tool = self.build(fn)
+            mcp.add_tool(tool)
+            return tool
+        return register
+
+    def save(self, tools) -> None:
+        '''Write freshly generated schemas for `tools`'''
+        entries = {tool.name: {'digest': signature_digest(tool.fn), 'parameters': FunctionTool.from_function(tool.fn).parameters}
+                   for tool in tools}
+        with open(self.path, 'w') as f:
+            json.dump(entries, f, indent=1, sort_keys=True)
+            f.write('\n')
+        self.entries = entries
+
+
+def main():
+    import server
+    tools = asyncio.run(server.mcp.get_tools())
+    server.tool_schemas.save(tools.values())
+    print(f'Wrote {len(tools)} tool schemas to {server.tool_schemas.path}')
+
+
+if __name__ == '__main__':
+    main()